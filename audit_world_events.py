@@ -19,6 +19,10 @@ import re
 from datetime import datetime, timezone
 
 import anthropic
+try:
+    import orjson  # type: ignore
+except Exception:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 
 CODEX_FILE = "codex.json"
@@ -175,11 +179,18 @@ def _appearance_fingerprint(apps: list) -> str:
     return hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest() if raw else ""
 
 
+def _json_dumps_indented(obj) -> str:
+    """Two-space-indented JSON (non-ASCII kept), via orjson's C encoder when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
 def _build_event_arc_summary_prompt(event_row: dict, prior_tales: list) -> str:
     """Reader-facing summary prompt for a world event arc."""
     name = str(event_row.get("name") or "unnamed event").strip()
     canon_json = json.dumps(event_row, ensure_ascii=False, sort_keys=True)
-    tales_payload = json.dumps(prior_tales or [], ensure_ascii=False, indent=2)
+    tales_payload = _json_dumps_indented(prior_tales or [])
     return f"""You are an archivist writing a reader-facing summary of a running world event in a sword-and-sorcery universe.
 
 Event name: {name}
@@ -16,15 +16,19 @@ import re
 from datetime import datetime, timezone
 from typing import Any
 
-try:
-    import anthropic
-except Exception:  # pragma: no cover - dependency may be absent in some contexts
-    anthropic = None
-
 from character_story_tools import gather_story_texts_for_character, load_story_catalog
 from world_time import build_world_clock
 
 
+def _import_anthropic():
+    """Import the Anthropic SDK on first use; None when it is not installed."""
+    try:
+        import anthropic
+    except Exception:  # pragma: no cover - dependency may be absent in some contexts
+        return None
+    return anthropic
+
+
 DEFAULT_CODEX_FILE = "codex.json"
 DEFAULT_OUTPUT_FILE = "character-temporal.json"
 DEFAULT_MODEL = "claude-haiku-4-5-20251001"
@@ -611,6 +615,7 @@ def _apply_haiku_age_adjudication(
     resolved_mode = age_mode
     api_key = (os.environ.get("ANTHROPIC_API_KEY") or "").strip()
     if age_mode in {"auto", "haiku"}:
+        anthropic = _import_anthropic() if api_key else None
         if api_key and anthropic is not None:
             client = anthropic.Anthropic(api_key=api_key)
             resolved_mode = "haiku"
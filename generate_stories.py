@@ -10,14 +10,29 @@ Run daily via GitHub Actions.
 """
 
 import os
+import asyncio
 import json
 import sys
 import re
 import random
 import hashlib
+import functools
+import heapq
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
-import anthropic
+try:
+    import orjson  # type: ignore
+except Exception:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+try:
+    import ijson  # type: ignore
+except Exception:  # optional; large archive days are parsed whole without it
+    ijson = None
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # optional; codex mentions fall back to one regex per entity
+    ahocorasick = None
 from backfill_character_temporal import refresh_character_temporal
 from build_alliances import refresh_alliances
 from build_lineages import refresh_lineages
@@ -34,6 +49,16 @@ def _parse_date_key(date_key: str):
         return None
 
 
+def _anthropic():
+    """Import the Anthropic SDK on first use.
+
+    The SDK pulls in httpx/pydantic, which dominates cold import time for the
+    audit/backfill scripts that only borrow this module's lore helpers.
+    """
+    import anthropic
+    return anthropic
+
+
 def _maybe_load_dotenv():
     """Best-effort load of a local .env file for development.
 
@@ -47,8 +72,97 @@ def _maybe_load_dotenv():
         return
     load_dotenv(override=False)
 
+
+# ── JSON I/O (orjson when installed, stdlib json otherwise) ─────────────
+def _json_loads(data):
+    """Parse JSON from bytes or str; orjson parses UTF-8 bytes without a decode pass."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is, like ensure_ascii=False).
+
+    Output is identical with or without orjson: compact separators by default, or
+    two-space indentation with ``indent``.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys).encode("utf-8")
+    # Compact separators so the fallback emits the same text as orjson.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+
+
+def _json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    return _json_dumps_bytes(obj, indent=indent, sort_keys=sort_keys).decode("utf-8")
+
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7e]")
+
+
+def _ascii_escape(m) -> str:
+    """\\uXXXX escape (surrogate pair above the BMP), as json's ensure_ascii does."""
+    c = ord(m.group())
+    if c > 0xFFFF:
+        c -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (c >> 10), 0xDC00 | (c & 0x3FF))
+    return "\\u%04x" % c
+
+
+def _json_dumps_ascii_indented(obj) -> str:
+    """Same text as ``json.dumps(obj, ensure_ascii=True, indent=2)`` for our data.
+
+    orjson emits UTF-8, so non-ASCII (and DEL) is escaped afterwards; it only
+    ever appears inside strings. Exponent floats print differently (1e16 vs
+    1e+16) but parse the same. Big ints and non-str keys use stdlib json.
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+        else:
+            return _NON_ASCII_RE.sub(_ascii_escape, text)
+    return json.dumps(obj, ensure_ascii=True, indent=2)
+
+
+def _read_json_file(path: str):
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=32)
+def _read_json_file_at(path: str, mtime_ns: int):
+    return _read_json_file(path)
+
+
+def _load_json_cached(path: str):
+    """Parse ``path`` once per mtime; returns None if it is missing or unreadable.
+
+    The parsed object is shared between callers, so treat it as read-only.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        return _read_json_file_at(path, mtime_ns)
+    except Exception:
+        return None
+
 # ── Text sanitation (prevents control-char tofu/rectangles in UI) ──────
-_CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]")
+# C0 controls except \t \n \r, plus DEL and C1 controls; str.translate drops them in one C-level pass.
+_CTRL_TRANSLATE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)],
+    None,
+)
 
 # ── Config ────────────────────────────────────────────────────────────────
 MODEL           = "claude-haiku-4-5-20251001"
@@ -83,6 +197,10 @@ WORLD_EVENT_ARCS_MAX = int(os.environ.get("WORLD_EVENT_ARCS_MAX", "2"))
 # Arc persistence tuning (does not force arcs; only influences which arcs are highlighted)
 WORLD_EVENT_ARC_ACTIVE_DAYS = int(os.environ.get("WORLD_EVENT_ARC_ACTIVE_DAYS", "14"))
 WORLD_EVENT_ARC_INTENSITY_MAX = int(os.environ.get("WORLD_EVENT_ARC_INTENSITY_MAX", "5"))
+# Validated forms of the above (0 falls back to the default, counts never go negative).
+_ARC_PICK_LIMIT = max(0, int(WORLD_EVENT_ARCS_MAX or 0))
+_ARC_ACTIVE_DAYS = max(1, int(WORLD_EVENT_ARC_ACTIVE_DAYS or 14))
+_ARC_INTENSITY_MAX = int(WORLD_EVENT_ARC_INTENSITY_MAX or 5)
 # Event arc dossiers: summarize prior tales via an API call instead of raw text injection.
 ENABLE_EVENT_ARC_DOSSIER = os.environ.get("ENABLE_EVENT_ARC_DOSSIER", "1").strip().lower() in {"1", "true", "yes", "y"}
 EVENT_ARC_DOSSIER_MAX_TALES = int(os.environ.get("EVENT_ARC_DOSSIER_MAX_TALES", "0"))  # 0 = no limit
@@ -165,6 +283,18 @@ REUSE_DOSSIER_MAX_TOKENS = int(os.environ.get("REUSE_DOSSIER_MAX_TOKENS", "1200"
 # Progressive dossier scaling: once total tale input exceeds this char limit,
 # older tales are progressively clipped so recent tales stay full-fidelity.
 REUSE_DOSSIER_MAX_TOTAL_INPUT_CHARS = int(os.environ.get("REUSE_DOSSIER_MAX_TOTAL_INPUT_CHARS", "80000"))  # ~20K tokens
+# Dossier batching: submit all reuse dossiers as one Message Batches job (half price) instead of
+# serial calls. Off by default because batches can queue; anything not back by the timeout is
+# retried with a direct call.
+ENABLE_REUSE_DOSSIER_BATCH = os.environ.get("ENABLE_REUSE_DOSSIER_BATCH", "0").strip().lower() in {"1", "true", "yes", "y"}
+REUSE_DOSSIER_BATCH_TIMEOUT_SECONDS = int(os.environ.get("REUSE_DOSSIER_BATCH_TIMEOUT_SECONDS", "900"))
+# Dossier cache: reuse a dossier verbatim when the canon entry and prior tales are unchanged.
+# Stored as <dir>/<category>/<entity>/<hash of model, category, canon, tales>.txt; only the
+# latest dossier per category and entity is kept. Lives outside archive/ so it is never
+# committed (the daily workflow persists it with actions/cache); set to "" to disable.
+REUSE_DOSSIER_CACHE_DIR = os.environ.get("REUSE_DOSSIER_CACHE_DIR", ".dossier_cache").strip()
+# Independent dossier calls (reuse + event arc) run concurrently, capped to respect rate limits.
+REUSE_MAX_CONCURRENCY = int(os.environ.get("REUSE_MAX_CONCURRENCY", "8"))
 REUSE_ALLOWED_CATEGORIES_RAW = os.environ.get("REUSE_ALLOWED_CATEGORIES", "all").strip()
 
 
@@ -190,11 +320,10 @@ def get_reuse_allowed_categories(lore: dict):
 def load_lore():
     """Load the existing lore bible, or return a minimal skeleton."""
     if os.path.exists(LORE_FILE):
-        with open(LORE_FILE, "r", encoding="utf-8") as f:
-            lore = json.load(f)
-            if isinstance(lore, dict):
-                lore.pop("subcontinents", None)
-            return lore
+        lore = _read_json_file(LORE_FILE)
+        if isinstance(lore, dict):
+            lore.pop("subcontinents", None)
+        return lore
     return {
         "version": "1.0",
         "worlds": [],
@@ -220,11 +349,61 @@ def load_lore():
     }
 
 
+def _is_dict(x) -> bool:
+    return isinstance(x, dict)
+
+
+def _lname(item: dict) -> str:
+    """Lowercased, stripped entity name ("" when missing); the key used by name indexes.
+
+    Uses ``lower()`` rather than ``casefold()`` so keys match every existing lookup site.
+    """
+    nm = item.get("name")
+    return str(nm).strip().lower() if nm else ""
+
+
+def _lname_set(items) -> frozenset:
+    """Lowercased names of the dict entries in ``items`` (non-dicts and blanks skipped)."""
+    return frozenset(filter(None, map(_lname, filter(_is_dict, items or ()))))
+
+
+@dataclass
+class LoreIndex:
+    """Lowercased-name lookups over a lore (or codex) dict, built once after loading.
+
+    ``by_category[cat][name.lower()]`` maps to the entry itself. Code that appends
+    entities while the index is live should call :meth:`add` to keep it current.
+    """
+    by_category: dict[str, dict[str, dict]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, lore: dict, categories=None) -> "LoreIndex":
+        by_category = {}
+        if isinstance(lore, dict):
+            for cat, items in lore.items():
+                if categories is not None and cat not in categories:
+                    continue
+                if not isinstance(items, list):
+                    continue
+                by_category[cat] = {key: it for it in items if isinstance(it, dict) and (key := _lname(it))}
+        return cls(by_category)
+
+    def category(self, cat: str) -> dict[str, dict]:
+        return self.by_category.setdefault(cat, {})
+
+    def get(self, cat: str, name: str):
+        return self.by_category.get(cat, {}).get((name or "").strip().lower())
+
+    def add(self, cat: str, item: dict):
+        key = _lname(item) if isinstance(item, dict) else ""
+        if key:
+            self.category(cat).setdefault(key, item)
+
+
 def load_geography():
     """Load the geography file, or return an empty skeleton."""
     if os.path.exists(GEOGRAPHY_FILE):
-        with open(GEOGRAPHY_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_file(GEOGRAPHY_FILE)
     return {}
 
 
@@ -445,11 +624,23 @@ def build_geography_context(geo):
     return "\n".join(lines).strip()
 
 
+_UNKNOWN_VALUES = frozenset({"", "unknown", "n/a", "na", "none"})
+
+
+def _is_known(lowered: str) -> bool:
+    """_truthy_non_unknown for a value the caller has already stripped and lowercased."""
+    return lowered not in _UNKNOWN_VALUES
+
+
+def _strip_str(val) -> str:
+    """``str(val or "").strip()`` without the str() round-trip for values that are already str."""
+    if isinstance(val, str):
+        return val.strip()
+    return str(val).strip() if val else ""
+
+
 def _truthy_non_unknown(val: str) -> bool:
-    v = (val or "").strip()
-    if not v:
-        return False
-    return v.lower() not in {"unknown", "n/a", "na", "none"}
+    return (val or "").strip().lower() not in _UNKNOWN_VALUES
 
 
 def sanitize_text(value: str) -> str:
@@ -457,7 +648,7 @@ def sanitize_text(value: str) -> str:
         return ""
     s = str(value)
     s = s.replace("\r\n", "\n").replace("\r", "\n")
-    return _CONTROL_CHAR_RE.sub("", s)
+    return s.translate(_CTRL_TRANSLATE)
 
 
 def sanitize_stories(stories):
@@ -485,7 +676,7 @@ def _compress_story_text_to_hard_max(text: str, hard_max: int) -> str:
     if not raw:
         return ""
     limit = max(1, int(hard_max or STORY_WORD_HARD_MAX))
-    sentences = [seg.strip() for seg in re.split(r"(?<=[.!?])\s+", raw) if seg.strip()]
+    sentences = [seg.strip() for seg in _SENTENCE_SPLIT_RE.split(raw) if seg.strip()]
     if not sentences:
         words = _STORY_WORD_RE.findall(raw)
         return " ".join(words[:limit]).strip()
@@ -530,27 +721,41 @@ def enforce_story_hard_max(stories: list[dict]) -> list[dict]:
     return out
 
 
+_SNAKE_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def _make_snake_id(name: str) -> str:
-    base = re.sub(r"[^a-zA-Z0-9]+", "_", (name or "").strip().lower()).strip("_")
+    base = _SNAKE_RE.sub("_", (name or "").strip().lower()).strip("_")
     return base or "unknown"
 
 
-def ensure_home_location_entities_exist(lore, date_key: str):
+def _lore_list(lore: dict, cat: str) -> list:
+    """Return lore[cat] as the live list, installing an empty one if missing or malformed."""
+    items = lore.get(cat)
+    if not isinstance(items, list):
+        items = lore[cat] = []
+    return items
+
+
+def ensure_home_location_entities_exist(lore, date_key: str, index: LoreIndex = None):
     """Auto-create placeholder geo entities referenced by character home_* anchors.
 
     This reduces UX dead-ends when a story reveals a new domain (e.g., a region someone rules)
     via a character update, but the NEW-lore extractor fails to add that region/place yet.
+    Pass the run's LoreIndex to skip re-scanning places/regions/realms; it is updated in place.
     """
     if not isinstance(lore, dict):
         return lore
 
-    places = lore.get("places") or []
-    regions = lore.get("regions") or []
-    realms = lore.get("realms") or []
+    places = _lore_list(lore, "places")
+    regions = _lore_list(lore, "regions")
+    realms = _lore_list(lore, "realms")
 
-    place_names = {str(p.get("name", "")).strip().lower() for p in places if isinstance(p, dict) and p.get("name")}
-    region_names = {str(r.get("name", "")).strip().lower() for r in regions if isinstance(r, dict) and r.get("name")}
-    realm_names = {str(rm.get("name", "")).strip().lower() for rm in realms if isinstance(rm, dict) and rm.get("name")}
+    if index is None:
+        index = LoreIndex.build(lore, categories=("places", "regions", "realms"))
+    place_names = index.category("places")
+    region_names = index.category("regions")
+    realm_names = index.category("realms")
 
     for c in lore.get("characters") or []:
         if not isinstance(c, dict):
@@ -559,9 +764,11 @@ def ensure_home_location_entities_exist(lore, date_key: str):
         home_place = sanitize_text(c.get("home_place", "")).strip()
         home_region = sanitize_text(c.get("home_region", "")).strip()
         home_realm = sanitize_text(c.get("home_realm", "")).strip()
+        place_key, region_key, realm_key = home_place.lower(), home_region.lower(), home_realm.lower()
+        realm_known, region_known = _is_known(realm_key), _is_known(region_key)
 
-        if _truthy_non_unknown(home_realm) and home_realm.lower() not in realm_names:
-            realms.append({
+        if realm_known and realm_key not in realm_names:
+            realm_names[realm_key] = {
                 "id": _make_snake_id(home_realm),
                 "name": home_realm,
                 "tagline": "",
@@ -574,16 +781,16 @@ def ensure_home_location_entities_exist(lore, date_key: str):
                 "notes": "",
                 "first_date": date_key,
                 "appearances": 1,
-            })
-            realm_names.add(home_realm.lower())
+            }
+            realms.append(realm_names[realm_key])
 
-        if _truthy_non_unknown(home_region) and home_region.lower() not in region_names:
-            regions.append({
+        if region_known and region_key not in region_names:
+            region_names[region_key] = {
                 "id": _make_snake_id(home_region),
                 "name": home_region,
                 "tagline": "",
                 "continent": "unknown",
-                "realm": home_realm if _truthy_non_unknown(home_realm) else "unknown",
+                "realm": home_realm if realm_known else "unknown",
                 "climate": "unknown",
                 "terrain": "unknown",
                 "function": "Auto-added from character home_region.",
@@ -591,11 +798,11 @@ def ensure_home_location_entities_exist(lore, date_key: str):
                 "notes": "",
                 "first_date": date_key,
                 "appearances": 1,
-            })
-            region_names.add(home_region.lower())
+            }
+            regions.append(region_names[region_key])
 
-        if _truthy_non_unknown(home_place) and home_place.lower() not in place_names:
-            places.append({
+        if _is_known(place_key) and place_key not in place_names:
+            place_names[place_key] = {
                 "id": _make_snake_id(home_place),
                 "name": home_place,
                 "tagline": "",
@@ -603,9 +810,9 @@ def ensure_home_location_entities_exist(lore, date_key: str):
                 "world": "known_world",
                 "hemisphere": "unknown",
                 "continent": "unknown",
-                "realm": home_realm if _truthy_non_unknown(home_realm) else "unknown",
+                "realm": home_realm if realm_known else "unknown",
                 "province": "unknown",
-                "region": home_region if _truthy_non_unknown(home_region) else "unknown",
+                "region": home_region if region_known else "unknown",
                 "district": "unknown",
                 "atmosphere": "",
                 "description": "Auto-added from character home_place.",
@@ -613,12 +820,9 @@ def ensure_home_location_entities_exist(lore, date_key: str):
                 "notes": "",
                 "first_date": date_key,
                 "appearances": 1,
-            })
-            place_names.add(home_place.lower())
+            }
+            places.append(place_names[place_key])
 
-    lore["places"] = places
-    lore["regions"] = regions
-    lore["realms"] = realms
     return lore
 
 
@@ -690,37 +894,42 @@ def enforce_continent_limit(lore: dict):
     if max_n and len(conts) > max_n:
         conts[:] = conts[:max_n]
 
-    allowed = {((c.get("name") or "").strip().lower()) for c in conts if isinstance(c, dict) and (c.get("name") or "").strip()}
+    allowed = _lname_set(conts)
     if not allowed:
         return lore
 
-    for p in lore.get("places", []) or []:
-        if not isinstance(p, dict):
+    for cat in ("places", "regions", "realms"):
+        items = lore.get(cat)
+        if not isinstance(items, list):
             continue
-        continent = (p.get("continent") or "").strip()
-        if _truthy_non_unknown(continent) and continent.lower() not in allowed:
-            p["continent"] = "unknown"
+        for it in items:
+            if not isinstance(it, dict):
+                continue
+            continent = (it.get("continent") or "").strip().lower()
+            if _is_known(continent) and continent not in allowed:
+                it["continent"] = "unknown"
 
-    for r in lore.get("regions", []) or []:
-        if not isinstance(r, dict):
-            continue
-        continent = (r.get("continent") or "").strip()
-        if _truthy_non_unknown(continent) and continent.lower() not in allowed:
-            r["continent"] = "unknown"
+    return lore
 
-    for realm in lore.get("realms", []) or []:
-        if not isinstance(realm, dict):
-            continue
-        continent = (realm.get("continent") or "").strip()
-        if _truthy_non_unknown(continent) and continent.lower() not in allowed:
-            realm["continent"] = "unknown"
+def _write_file_atomic(path: str, data: bytes):
+    """Write bytes to a sibling temp file and os.replace() it over ``path``.
+
+    A crash mid-write leaves the previous file intact instead of truncated JSON.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_json_ascii_atomic(path: str, obj):
+    """Atomically write the committed-JSON format (ASCII-escaped, indent=2)."""
+    _write_file_atomic(path, _json_dumps_ascii_indented(obj).encode("ascii"))
 
-    return lore
 
 def save_lore(lore, date_key):
     lore["last_updated"] = date_key
-    with open(LORE_FILE, "w", encoding="utf-8") as f:
-        json.dump(lore, f, ensure_ascii=True, indent=2)
+    _write_json_ascii_atomic(LORE_FILE, lore)
 
 def build_lore_context(lore):
     """Format the lore bible into a concise prompt string for the story generator."""
@@ -773,20 +982,23 @@ def build_lore_context(lore):
     return "\n".join(lines)
 
 
+def _appearances_key(x) -> int:
+    try:
+        return int(x.get("appearances", 0) or 0)
+    except Exception:
+        return 0
+
+
 def _safe_sorted_by_appearances(items):
-    def _key(x):
-        try:
-            return int(x.get("appearances", 0) or 0)
-        except Exception:
-            return 0
-    return sorted(items or [], key=_key, reverse=True)
+    return sorted(items or [], key=_appearances_key, reverse=True)
 
 
+@functools.lru_cache(maxsize=512)
 def _stable_seed_int(seed_text: str, salt: str) -> int:
     payload = (seed_text or "") + "|" + (salt or "")
-    digest = hashlib.sha256(payload.encode("utf-8")).digest()
-    # Use 64 bits for deterministic RNG seed.
-    return int.from_bytes(digest[:8], "big", signed=False)
+    # 64-bit deterministic RNG seed; blake2b emits exactly 8 bytes, no truncation needed.
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=False)
 
 
 def _sample_candidates(items, k: int, seed_text: str, salt: str):
@@ -798,31 +1010,7 @@ def _sample_candidates(items, k: int, seed_text: str, salt: str):
     return rng.sample(items, k=k)
 
 
-def build_reuse_plan_prompt(today_str, world_date_label, lore, candidates_by_category):
-    """Ask the model whether to reuse canon today, and if so pick from provided candidates."""
-    world = lore.get("worlds", [{}])[0] if lore.get("worlds") else {}
-    rules = world.get("rules", []) if isinstance(world.get("rules", []), list) else []
-    rules_block = "\n".join([f"- {r}" for r in rules]) if rules else "- (none)"
-
-    candidate_lines = []
-    for cat, items in (candidates_by_category or {}).items():
-        if not items:
-            continue
-        candidate_lines.append(f"=== {cat.upper()} CANDIDATES ===")
-        for it in items:
-            name = (it.get("name") or "").strip()
-            if not name:
-                continue
-            hint = (it.get("tagline") or it.get("role") or it.get("place_type") or it.get("artifact_type") or it.get("weapon_type") or "").strip()
-            if hint:
-                candidate_lines.append(f"- {name} — {hint}")
-            else:
-                candidate_lines.append(f"- {name}")
-        candidate_lines.append("")
-
-    allowed_cats = ", ".join(sorted(candidates_by_category.keys())) if candidates_by_category else "(none)"
-
-    return f"""You are planning today's issue of an ongoing sword-and-sorcery universe.
+_REUSE_PLAN_PROMPT_TEMPLATE = """You are planning today's issue of an ongoing sword-and-sorcery universe.
 
 Archive date: {today_str}
 World date in Edhra: {world_date_label}
@@ -835,7 +1023,7 @@ Decision: for today's 10 stories, should we intentionally reuse any existing can
 Important:
 - Reuse is optional.
 - If you choose reuse, pick ONLY from the candidates listed below.
-- Keep reuse light: at most {REUSE_MAX_PER_CATEGORY} selection(s) per category.
+- Keep reuse light: at most {max_per_category} selection(s) per category.
 
 Available categories today: {allowed_cats}
 
@@ -856,12 +1044,53 @@ Return ONLY valid JSON like:
 
 Notes:
 - For backwards compatibility, each selection may also be a bare string "Name".
-- If intensity is omitted, default to "{REUSE_DEFAULT_INTENSITY}".
+- If intensity is omitted, default to "{default_intensity}".
 
 CANDIDATES:
-{os.linesep.join(candidate_lines).strip()}
+{candidates_block}
 """
 
+_REUSE_CANDIDATE_HINT_KEYS = ("tagline", "role", "place_type", "artifact_type", "weapon_type")
+
+
+def _reuse_candidate_line(item) -> str:
+    name = (item.get("name") or "").strip()
+    if not name:
+        return ""
+    hint = ""
+    for key in _REUSE_CANDIDATE_HINT_KEYS:
+        if item.get(key):
+            hint = item[key]
+            break
+    hint = (hint or "").strip()
+    return f"- {name} — {hint}" if hint else f"- {name}"
+
+
+def build_reuse_plan_prompt(today_str, world_date_label, lore, candidates_by_category):
+    """Ask the model whether to reuse canon today, and if so pick from provided candidates."""
+    world = lore.get("worlds", [{}])[0] if lore.get("worlds") else {}
+    rules = world.get("rules", []) if isinstance(world.get("rules", []), list) else []
+    rules_block = "\n".join([f"- {r}" for r in rules]) if rules else "- (none)"
+
+    sections = []
+    for cat, items in (candidates_by_category or {}).items():
+        if not items:
+            continue
+        lines = [line for line in map(_reuse_candidate_line, items) if line]
+        sections.append("\n".join([f"=== {cat.upper()} CANDIDATES ===", *lines, ""]))
+
+    allowed_cats = ", ".join(sorted(candidates_by_category.keys())) if candidates_by_category else "(none)"
+
+    return _REUSE_PLAN_PROMPT_TEMPLATE.format(
+        today_str=today_str,
+        world_date_label=world_date_label,
+        rules_block=rules_block,
+        max_per_category=REUSE_MAX_PER_CATEGORY,
+        allowed_cats=allowed_cats,
+        default_intensity=REUSE_DEFAULT_INTENSITY,
+        candidates_block="\n".join(sections).strip(),
+    )
+
 
 def normalize_reuse_plan(plan, candidates_by_category):
     """Ensure planner output is safe: selections must be within candidates and within max counts."""
@@ -874,7 +1103,7 @@ def normalize_reuse_plan(plan, candidates_by_category):
 
     candidate_name_sets = {}
     for cat, items in (candidates_by_category or {}).items():
-        candidate_name_sets[cat] = { (it.get("name") or "").strip().lower() for it in (items or []) if (it.get("name") or "").strip() }
+        candidate_name_sets[cat] = _lname_set(items)
 
     def _normalize_intensity(raw: str) -> str:
         val = (raw or "").strip().lower()
@@ -927,16 +1156,17 @@ def normalize_reuse_plan(plan, candidates_by_category):
     return safe
 
 
-def get_full_canon_entries_for_selections(lore, selections):
+def get_full_canon_entries_for_selections(lore, selections, index: LoreIndex = None):
     """Return full lore entries for selected names by category."""
     out = {}
     if not isinstance(selections, dict):
         return out
+    if index is None:
+        index = LoreIndex.build(lore, categories=set(selections))
     for cat, names in selections.items():
         if not isinstance(names, list) or not names:
             continue
-        lore_items = lore.get(cat, []) or []
-        idx = { (it.get("name") or "").strip().lower(): it for it in lore_items if isinstance(it, dict) and (it.get("name") or "").strip() }
+        idx = index.category(cat)
         picked = []
         for n in names:
             name = ""
@@ -955,13 +1185,18 @@ def get_full_canon_entries_for_selections(lore, selections):
 def load_codex_file():
     if os.path.exists(CODEX_FILE):
         try:
-            with open(CODEX_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _read_json_file(CODEX_FILE)
         except Exception:
             return {}
     return {}
 
 
+def load_codex_file_readonly():
+    """Like load_codex_file, but served from the mtime-keyed cache; do not mutate the result."""
+    codex = _load_json_cached(CODEX_FILE)
+    return codex if isinstance(codex, dict) else {}
+
+
 CODEX_BALANCE_TRACKED_LABELS = [
     "weapons",
     "rituals",
@@ -1188,43 +1423,82 @@ def _codex_entry_map(codex):
     for cat, items in codex.items():
         if not isinstance(items, list):
             continue
-        idx = {}
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            nm = (it.get("name") or "").strip()
-            if nm:
-                idx[nm.lower()] = it
+        idx = {key: it for it in items if isinstance(it, dict) and (key := _lname(it))}
         if idx:
             out[cat] = idx
     return out
 
 
-def _load_archive_day(date_key: str):
+def _archive_day_stamp(date_key: str):
+    """Return (path, mtime_ns) for an archive day file, or None if it is missing.
+
+    The mtime is part of the cache key so a day file rewritten mid-run (e.g. by
+    an audit rewrite) is re-parsed instead of served stale.
+    """
     path = os.path.join(ARCHIVE_DIR, f"{date_key}.json")
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
-def load_story_by_date_and_title(date_key: str, title: str):
-    day = _load_archive_day(date_key)
+@functools.lru_cache(maxsize=256)
+def _load_archive_day_cached(path: str, mtime_ns: int):
+    try:
+        return _read_json_file(path)
+    except Exception:
+        return {}
+
+
+@functools.lru_cache(maxsize=256)
+def _archive_day_title_index(path: str, mtime_ns: int) -> dict:
+    day = _load_archive_day_cached(path, mtime_ns)
     stories = day.get("stories") if isinstance(day, dict) else None
+    idx = {}
     if not isinstance(stories, list):
-        return None
-    wanted = (title or "").strip().lower()
+        return idx
     for s in stories:
         if not isinstance(s, dict):
             continue
-        if (s.get("title") or "").strip().lower() == wanted:
-            return s
+        idx.setdefault((s.get("title") or "").strip().lower(), s)
+    return idx
+
+
+def _load_archive_day(date_key: str):
+    """Parsed archive/<date>.json (shared, do not mutate), or {} if missing/unreadable."""
+    stamp = _archive_day_stamp(date_key)
+    if stamp is None:
+        return {}
+    return _load_archive_day_cached(*stamp)
+
+
+# Archive days above this size are streamed (when ijson is installed) to fetch a
+# single story instead of materializing the whole file.
+ARCHIVE_STREAM_PARSE_MIN_BYTES = 512 * 1024
+
+
+def _stream_story_by_title(path: str, wanted: str):
+    with open(path, "rb") as f:
+        for s in ijson.items(f, "stories.item", use_float=True):
+            if isinstance(s, dict) and (s.get("title") or "").strip().lower() == wanted:
+                return s
     return None
 
 
+def load_story_by_date_and_title(date_key: str, title: str):
+    stamp = _archive_day_stamp(date_key)
+    if stamp is None:
+        return None
+    wanted = (title or "").strip().lower()
+    if ijson is not None:
+        try:
+            if os.path.getsize(stamp[0]) > ARCHIVE_STREAM_PARSE_MIN_BYTES:
+                return _stream_story_by_title(stamp[0], wanted)
+        except Exception:
+            pass
+    return _archive_day_title_index(*stamp).get(wanted)
+
+
 # ── Recent-theme lookback (cross-day diversity) ───────────────────────────
 RECENT_THEME_LOOKBACK_DAYS = 3          # how many past issues to scan
 
@@ -1359,10 +1633,7 @@ def gather_prior_tales_for_entity(
     return out
 
 
-def build_reuse_dossier_prompt(entity_name: str, category: str, canon_entry, prior_tales):
-    canon_json = json.dumps(canon_entry, ensure_ascii=False, sort_keys=True)
-    tales_payload = json.dumps(prior_tales or [], ensure_ascii=False, indent=2)
-    return f"""You are an archivist building a canon dossier for a recurring sword-and-sorcery universe.
+_REUSE_DOSSIER_PROMPT_TEMPLATE = """You are an archivist building a canon dossier for a recurring sword-and-sorcery universe.
 
 Entity category: {category}
 Entity name: {entity_name}
@@ -1393,12 +1664,27 @@ DO-NOT-CHANGE (continuity locks):
 """
 
 
+def encode_reuse_dossier_inputs(canon_entry, prior_tales) -> tuple[str, str]:
+    """Serialize (canon JSON, prior-tales JSON) once so the cache key and prompt share the work."""
+    return _json_dumps(canon_entry, sort_keys=True), _json_dumps(prior_tales or [], indent=True)
+
+
+def build_reuse_dossier_prompt(entity_name: str, category: str, canon_entry, prior_tales, encoded=None):
+    canon_json, tales_payload = encoded or encode_reuse_dossier_inputs(canon_entry, prior_tales)
+    return _REUSE_DOSSIER_PROMPT_TEMPLATE.format(
+        category=category,
+        entity_name=entity_name,
+        canon_json=canon_json,
+        tales_payload=tales_payload,
+    )
+
+
 def build_event_arc_dossier_prompt(event_entry: dict, prior_tales: list):
     """Build a prompt that asks the model to summarize the narrative arc so far
     for a world event, producing a compact dossier the story writer can use."""
     name = (event_entry.get("name") or "unnamed event").strip()
     canon_json = json.dumps(event_entry, ensure_ascii=False, sort_keys=True)
-    tales_payload = json.dumps(prior_tales or [], ensure_ascii=False, indent=2)
+    tales_payload = _json_dumps(prior_tales or [], indent=True)
     return f"""You are an archivist summarizing the narrative arc of a world event in a sword-and-sorcery universe.
 
 Event name: {name}
@@ -1434,6 +1720,144 @@ OPEN THREADS:
 """
 
 
+# Bookkeeping counters that change without changing what a dossier would say; the tales
+# themselves still key the cache.
+_DOSSIER_CACHE_VOLATILE_FIELDS = ("appearances", "story_appearances")
+
+
+def reuse_dossier_cache_path(entity_name: str, category: str, canon_entry, prior_tales, encoded=None) -> str:
+    """Content-addressed cache file for a reuse dossier ("" when caching is disabled)."""
+    if not REUSE_DOSSIER_CACHE_DIR:
+        return ""
+    canon_json, tales_payload = encoded or encode_reuse_dossier_inputs(canon_entry, prior_tales)
+    if isinstance(canon_entry, dict) and any(k in canon_entry for k in _DOSSIER_CACHE_VOLATILE_FIELDS):
+        canon_json = _json_dumps(
+            {k: v for k, v in canon_entry.items() if k not in _DOSSIER_CACHE_VOLATILE_FIELDS},
+            sort_keys=True,
+        )
+    h = hashlib.blake2b(digest_size=16)
+    for part in (MODEL, category, canon_json, tales_payload):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    key = h.hexdigest()
+    return os.path.join(REUSE_DOSSIER_CACHE_DIR, _make_snake_id(category), _make_snake_id(entity_name), f"{key}.txt")
+
+
+def load_cached_dossier(path: str) -> str:
+    if not path:
+        return ""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def save_cached_dossier(path: str, text: str):
+    """Write ``path`` and drop older dossiers for the same category and entity, which can no longer hit."""
+    if not path or not text:
+        return
+    entity_dir = os.path.dirname(path)
+    try:
+        os.makedirs(entity_dir, exist_ok=True)
+        _write_file_atomic(path, text.encode("utf-8"))
+    except OSError as e:
+        print(f"WARNING: Could not write dossier cache {path}: {e}", file=sys.stderr)
+        return
+    keep = os.path.basename(path)
+    try:
+        stale = [n for n in os.listdir(entity_dir) if n.endswith(".txt") and n != keep]
+    except OSError:
+        return
+    for n in stale:
+        try:
+            os.remove(os.path.join(entity_dir, n))
+        except OSError:
+            pass
+
+
+def submit_dossier_batch(client, prompts, max_tokens: int = REUSE_DOSSIER_MAX_TOKENS, timeout_seconds: int = REUSE_DOSSIER_BATCH_TIMEOUT_SECONDS) -> dict:
+    """Run dossier prompts as a single Message Batches job.
+
+    ``prompts`` is a list of ``(key, prompt)`` pairs. Returns ``{key: text}`` for
+    requests that succeeded; keys that errored, expired, or were still pending at
+    the deadline are simply absent so the caller can fall back to direct calls.
+    """
+    if not prompts:
+        return {}
+
+    key_by_custom_id = {}
+    requests = []
+    for i, (key, prompt) in enumerate(prompts):
+        custom_id = f"dossier_{i}"
+        key_by_custom_id[custom_id] = key
+        requests.append({
+            "custom_id": custom_id,
+            "params": {
+                "model": MODEL,
+                "max_tokens": int(max_tokens),
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+
+    batch = client.messages.batches.create(requests=requests)
+    deadline = time.monotonic() + max(0, int(timeout_seconds or 0))
+    delay = 5.0
+    while batch.processing_status != "ended":
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            try:
+                client.messages.batches.cancel(batch.id)
+            except Exception:
+                pass
+            print(f"WARNING: Dossier batch {batch.id} still {batch.processing_status} after {timeout_seconds}s; falling back to direct calls.", file=sys.stderr)
+            return {}
+        time.sleep(min(delay, remaining))
+        delay = min(30.0, delay * 2)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    out = {}
+    for row in client.messages.batches.results(batch.id):
+        key = key_by_custom_id.get(row.custom_id)
+        if key is None or row.result.type != "succeeded":
+            continue
+        content = row.result.message.content
+        text = content[0].text.strip() if content else ""
+        if text:
+            out[key] = text
+    return out
+
+
+def run_prompts_concurrently(client, prompts, max_tokens: int, max_concurrency: int = REUSE_MAX_CONCURRENCY) -> list:
+    """Run independent single-turn prompts concurrently via AsyncAnthropic.
+
+    Returns one entry per prompt, in order: the stripped response text, or the
+    exception that call raised (so one failure does not sink the others).
+    """
+    if not prompts:
+        return []
+
+    async def _run_all():
+        aclient = _anthropic().AsyncAnthropic(api_key=client.api_key)
+        sem = asyncio.Semaphore(max(1, int(max_concurrency or 1)))
+
+        async def _one(prompt: str) -> str:
+            async with sem:
+                msg = await aclient.messages.create(
+                    model=MODEL,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                return msg.content[0].text.strip()
+
+        try:
+            return await asyncio.gather(*[_one(p) for p in prompts], return_exceptions=True)
+        finally:
+            await aclient.close()
+
+    return asyncio.run(_run_all())
+
+
 def allowed_reuse_name_set(full_entries_by_cat):
     allowed = set()
     for items in (full_entries_by_cat or {}).values():
@@ -1597,25 +2021,101 @@ def _pick_top_plus_random(items, top_n: int, random_n: int, seed_text: str, salt
     if random_n <= 0:
         return top
 
-    remaining = [x for x in ordered if x not in top]
+    # Identity set: `x not in top` was a linear list scan (with dict equality) per item.
+    top_ids = {id(x) for x in top}
+    remaining = [x for x in ordered if id(x) not in top_ids]
     if not remaining:
         return top
 
     rng = random.Random(_stable_seed_int(seed_text, salt))
     k = min(random_n, len(remaining))
-    sampled = rng.sample(remaining, k=k)
+    # Sampling indices draws exactly what rng.sample(remaining, k) would.
+    sampled = [remaining[i] for i in rng.sample(range(len(remaining)), k=k)]
     return top + sampled
 
 
+def _spotlight_character_line(c: dict) -> str:
+    role = c.get("role")
+    status = c.get("status")
+    traits = c.get("traits")
+    bio = c.get("bio") or ""
+    role_seg = f" ({role})" if role else ""
+    status_seg = f" [{status}]" if status else ""
+    traits_seg = f" Traits: {', '.join(traits[:6])}." if isinstance(traits, list) and traits else ""
+    bio_seg = f" Bio: {bio[:220]}" if bio.strip() else ""
+    return f"• {c.get('name', 'Unknown')}{role_seg}{status_seg}{traits_seg}{bio_seg}"
+
+
+def _spotlight_place_line(p: dict) -> str:
+    place_type = p.get("place_type")
+    status = p.get("status")
+    desc = p.get("description") or ""
+    type_seg = f" ({place_type})" if place_type else ""
+    status_seg = f" Status: {status}" if status else ""
+    desc_seg = f" — {desc[:240]}" if desc.strip() else ""
+    return f"• {p.get('name', 'Unknown')}{type_seg}{status_seg}{desc_seg}"
+
+
+def _spotlight_relic_line(r: dict) -> str:
+    origin = r.get("origin") or ""
+    power = r.get("power") or ""
+    curse = r.get("curse") or ""
+    origin_seg = f" Origin: {origin[:120]}" if origin.strip() else ""
+    power_seg = f" Power: {power[:140]}" if power.strip() else ""
+    curse_seg = f" Curse: {curse[:140]}" if curse.strip() else ""
+    return f"• {r.get('name', 'Unknown')}{origin_seg}{power_seg}{curse_seg}"
+
+
+def _spotlight_weapon_line(w: dict) -> str:
+    weapon_type = w.get("weapon_type")
+    origin = w.get("origin") or ""
+    powers = w.get("powers") or ""
+    holder = w.get("last_known_holder")
+    type_seg = f" Type: {weapon_type}" if weapon_type else ""
+    origin_seg = f" Origin: {origin[:140]}" if origin.strip() else ""
+    powers_seg = f" Powers: {powers[:180]}" if powers.strip() else ""
+    holder_seg = f" Holder: {holder}" if holder else ""
+    return f"• {w.get('name', 'Unknown')}{type_seg}{origin_seg}{powers_seg}{holder_seg}"
+
+
+def _spotlight_artifact_line(a: dict) -> str:
+    artifact_type = a.get("artifact_type")
+    powers = a.get("powers") or ""
+    holder = a.get("last_known_holder")
+    type_seg = f" Type: {artifact_type}" if artifact_type else ""
+    powers_seg = f" Powers: {powers[:180]}" if powers.strip() else ""
+    holder_seg = f" Holder: {holder}" if holder else ""
+    return f"• {a.get('name', 'Unknown')}{type_seg}{powers_seg}{holder_seg}"
+
+
+def _spotlight_faction_line(f: dict) -> str:
+    alignment = f.get("alignment")
+    goals = f.get("goals") or ""
+    leader = f.get("leader")
+    alignment_seg = f" Alignment: {alignment}" if alignment else ""
+    goals_seg = f" Goals: {goals[:200]}" if goals.strip() else ""
+    leader_seg = f" Leader: {leader}" if leader else ""
+    return f"• {f.get('name', 'Unknown')}{alignment_seg}{goals_seg}{leader_seg}"
+
+
+_SPOTLIGHT_SECTIONS = (
+    ("=== CANON SPOTLIGHT: CHARACTERS ===", "characters", _spotlight_character_line),
+    ("=== CANON SPOTLIGHT: PLACES ===", "places", _spotlight_place_line),
+    ("=== CANON SPOTLIGHT: RELICS ===", "relics", _spotlight_relic_line),
+    ("=== CANON SPOTLIGHT: WEAPONS ===", "weapons", _spotlight_weapon_line),
+    ("=== CANON SPOTLIGHT: ARTIFACTS ===", "artifacts", _spotlight_artifact_line),
+    ("=== CANON SPOTLIGHT: FACTIONS ===", "factions", _spotlight_faction_line),
+)
+
+
 def build_spotlight_section(lore, seed_text: str, top_per_category=20, random_per_category=3):
     """Return a compact canon snippet for a small subset of entities.
 
     This is the main way the model can keep reused entities consistent without sending the entire lore bible.
     It scales with lore growth because selection is bounded (top + rotating sample).
     """
-    lines = []
-
-    def add_section(title, cat_key, render_fn):
+    sections = []
+    for title, cat_key, render_line in _SPOTLIGHT_SECTIONS:
         picked = _pick_top_plus_random(
             lore.get(cat_key, []) or [],
             top_n=top_per_category,
@@ -1624,78 +2124,16 @@ def build_spotlight_section(lore, seed_text: str, top_per_category=20, random_pe
             salt=cat_key,
         )
         if not picked:
-            return
-        lines.append(title)
+            continue
+        parts = [title]
         for item in picked:
             try:
-                lines.append(render_fn(item))
+                parts.append(render_line(item))
             except Exception:
                 continue
-        lines.append("")
-
-    add_section(
-        "=== CANON SPOTLIGHT: CHARACTERS ===",
-        "characters",
-        lambda c: "• "
-            + f"{c.get('name','Unknown')}"
-            + (f" ({c.get('role','?')})" if c.get("role") else "")
-            + (f" [{c.get('status','unknown')}]" if c.get("status") else "")
-            + (f" Traits: {', '.join(c.get('traits', [])[:6])}." if isinstance(c.get("traits"), list) and c.get("traits") else "")
-            + (f" Bio: {(c.get('bio','') or '')[:220]}" if (c.get("bio") or "").strip() else ""),
-    )
-
-    add_section(
-        "=== CANON SPOTLIGHT: PLACES ===",
-        "places",
-        lambda p: "• "
-            + f"{p.get('name','Unknown')}"
-            + (f" ({p.get('place_type','')})" if p.get("place_type") else "")
-            + (f" Status: {p.get('status')}" if p.get("status") else "")
-            + (f" — {(p.get('description','') or '')[:240]}" if (p.get("description") or "").strip() else ""),
-    )
-
-    add_section(
-        "=== CANON SPOTLIGHT: RELICS ===",
-        "relics",
-        lambda r: "• "
-            + f"{r.get('name','Unknown')}"
-            + (f" Origin: {(r.get('origin','') or '')[:120]}" if (r.get("origin") or "").strip() else "")
-            + (f" Power: {(r.get('power','') or '')[:140]}" if (r.get("power") or "").strip() else "")
-            + (f" Curse: {(r.get('curse','') or '')[:140]}" if (r.get("curse") or "").strip() else ""),
-    )
-
-    add_section(
-        "=== CANON SPOTLIGHT: WEAPONS ===",
-        "weapons",
-        lambda w: "• "
-            + f"{w.get('name','Unknown')}"
-            + (f" Type: {w.get('weapon_type')}" if w.get("weapon_type") else "")
-            + (f" Origin: {(w.get('origin','') or '')[:140]}" if (w.get("origin") or "").strip() else "")
-            + (f" Powers: {(w.get('powers','') or '')[:180]}" if (w.get("powers") or "").strip() else "")
-            + (f" Holder: {w.get('last_known_holder')}" if w.get("last_known_holder") else ""),
-    )
-
-    add_section(
-        "=== CANON SPOTLIGHT: ARTIFACTS ===",
-        "artifacts",
-        lambda a: "• "
-            + f"{a.get('name','Unknown')}"
-            + (f" Type: {a.get('artifact_type')}" if a.get("artifact_type") else "")
-            + (f" Powers: {(a.get('powers','') or '')[:180]}" if (a.get("powers") or "").strip() else "")
-            + (f" Holder: {a.get('last_known_holder')}" if a.get("last_known_holder") else ""),
-    )
-
-    add_section(
-        "=== CANON SPOTLIGHT: FACTIONS ===",
-        "factions",
-        lambda f: "• "
-            + f"{f.get('name','Unknown')}"
-            + (f" Alignment: {f.get('alignment')}" if f.get("alignment") else "")
-            + (f" Goals: {(f.get('goals','') or '')[:200]}" if (f.get("goals") or "").strip() else "")
-            + (f" Leader: {f.get('leader')}" if f.get("leader") else ""),
-    )
+        sections.append("\n".join(parts))
 
-    return "\n".join(lines).strip()
+    return "\n\n".join(sections).strip()
 
 
 def build_generation_lore_context(lore, seed_text: str):
@@ -1727,26 +2165,10 @@ def build_generation_lore_context(lore, seed_text: str):
     # are dropped.
     codex = load_codex_file()
     if isinstance(codex, dict):
-        _dir_sections = [
-            ("characters", "KNOWN CHARACTERS", lambda it: _compact_char_line(it)),
-            ("places", "KNOWN PLACES", lambda it: _compact_place_line(it)),
-            ("factions", "KNOWN FACTIONS", lambda it: _compact_faction_line(it)),
-            ("regions", "KNOWN REGIONS", lambda it: _compact_generic_line(it)),
-            ("polities", "KNOWN POLITIES", lambda it: _compact_generic_line(it)),
-            ("artifacts", "KNOWN ARTIFACTS", lambda it: _compact_generic_line(it)),
-            ("relics", "KNOWN RELICS", lambda it: _compact_generic_line(it)),
-            ("flora_fauna", "KNOWN CREATURES & FLORA", lambda it: _compact_generic_line(it)),
-            ("magic", "KNOWN MAGIC TYPES", lambda it: _compact_generic_line(it)),
-            ("events", "KNOWN EVENTS", lambda it: _compact_generic_line(it)),
-            ("lore", "KNOWN LORE", lambda it: _compact_generic_line(it)),
-            ("substances", "KNOWN SUBSTANCES", lambda it: _compact_generic_line(it)),
-            ("rituals", "KNOWN RITUALS", lambda it: _compact_generic_line(it)),
-            ("weapons", "KNOWN WEAPONS", lambda it: _compact_weapon_line(it)),
-        ]
         budget = max(1000, ENTITY_DIR_MAX_CHARS)
         budget_used = 0
         budget_exhausted = False
-        for cat, header, formatter in _dir_sections:
+        for cat, header, formatter in _ENTITY_DIRECTORY_SECTIONS:
             if budget_exhausted:
                 break
             items = codex.get(cat, [])
@@ -1798,6 +2220,14 @@ def _entity_last_appearance_sort_key(it: dict) -> str:
     return max(dates) if dates else ""
 
 
+def _first_sentence(text: str, max_len: int) -> str:
+    """Text up to the first period, stripped and clipped to max_len with an ellipsis."""
+    short = text.partition(".")[0].strip()
+    if len(short) > max_len:
+        short = short[:max_len - 3] + "..."
+    return short
+
+
 def _compact_char_line(it: dict) -> str:
     """One-line summary: Name — role/title, status, location."""
     nm = (it.get("name") or "").strip()
@@ -1825,10 +2255,7 @@ def _compact_place_line(it: dict) -> str:
     desc = (it.get("description") or it.get("bio") or "").strip()
     if desc:
         # First sentence or first 80 chars
-        short = desc.split(".")[0].strip()
-        if len(short) > 80:
-            short = short[:77] + "..."
-        bits.append(short)
+        bits.append(_first_sentence(desc, 80))
     region = (it.get("region") or it.get("realm") or "").strip()
     if region and region.lower() != "unknown":
         bits.append(f"({region})")
@@ -1841,12 +2268,8 @@ def _compact_faction_line(it: dict) -> str:
     if not nm:
         return ""
     desc = (it.get("description") or it.get("bio") or "").strip()
-    short = ""
-    if desc:
-        short = desc.split(".")[0].strip()
-        if len(short) > 100:
-            short = short[:97] + "..."
-    return f"• {nm}" + (f" — {short}" if short else "")
+    short = _first_sentence(desc, 100) if desc else ""
+    return f"• {nm} — {short}" if short else f"• {nm}"
 
 
 def _compact_generic_line(it: dict) -> str:
@@ -1855,12 +2278,8 @@ def _compact_generic_line(it: dict) -> str:
     if not nm:
         return ""
     desc = (it.get("description") or it.get("bio") or it.get("significance") or "").strip()
-    short = ""
-    if desc:
-        short = desc.split(".")[0].strip()
-        if len(short) > 100:
-            short = short[:97] + "..."
-    return f"• {nm}" + (f" — {short}" if short else "")
+    short = _first_sentence(desc, 100) if desc else ""
+    return f"• {nm} — {short}" if short else f"• {nm}"
 
 
 def _compact_weapon_line(it: dict) -> str:
@@ -1877,11 +2296,11 @@ def _compact_weapon_line(it: dict) -> str:
     lore_bits = []
     origin = (it.get("origin") or "").strip()
     if origin and origin.lower() != "unknown":
-        lore_bits.append(origin.split(".")[0].strip())
+        lore_bits.append(origin.partition(".")[0].strip())
 
     powers = (it.get("powers") or "").strip()
     if powers and powers.lower() != "unknown":
-        lore_bits.append(powers.split(".")[0].strip())
+        lore_bits.append(powers.partition(".")[0].strip())
 
     holder = (it.get("last_known_holder") or "").strip()
     if holder and holder.lower() != "unknown":
@@ -1896,6 +2315,25 @@ def _compact_weapon_line(it: dict) -> str:
     return "• " + " — ".join(bits[:2]) + (" — " + bits[2] if len(bits) > 2 else "")
 
 
+# (codex category, directory header, one-line formatter) for build_generation_lore_context.
+_ENTITY_DIRECTORY_SECTIONS = (
+    ("characters", "KNOWN CHARACTERS", _compact_char_line),
+    ("places", "KNOWN PLACES", _compact_place_line),
+    ("factions", "KNOWN FACTIONS", _compact_faction_line),
+    ("regions", "KNOWN REGIONS", _compact_generic_line),
+    ("polities", "KNOWN POLITIES", _compact_generic_line),
+    ("artifacts", "KNOWN ARTIFACTS", _compact_generic_line),
+    ("relics", "KNOWN RELICS", _compact_generic_line),
+    ("flora_fauna", "KNOWN CREATURES & FLORA", _compact_generic_line),
+    ("magic", "KNOWN MAGIC TYPES", _compact_generic_line),
+    ("events", "KNOWN EVENTS", _compact_generic_line),
+    ("lore", "KNOWN LORE", _compact_generic_line),
+    ("substances", "KNOWN SUBSTANCES", _compact_generic_line),
+    ("rituals", "KNOWN RITUALS", _compact_generic_line),
+    ("weapons", "KNOWN WEAPONS", _compact_weapon_line),
+)
+
+
 def _canon_loc_names_from_codex(codex: dict) -> dict[str, list[str]]:
     if not isinstance(codex, dict):
         return {}
@@ -1919,48 +2357,97 @@ def _canon_loc_names_from_codex(codex: dict) -> dict[str, list[str]]:
 def _load_known_issue_dates() -> list[str]:
     """Best-effort list of available issue dates (YYYY-MM-DD)."""
     dates: list[str] = []
-    if os.path.exists(ARCHIVE_IDX):
-        try:
-            idx = json.load(open(ARCHIVE_IDX, "r", encoding="utf-8"))
-            raw = idx.get("dates") if isinstance(idx, dict) else None
-            if isinstance(raw, list):
-                dates = [str(x or "").strip() for x in raw if str(x or "").strip()]
-        except Exception:
-            dates = []
+    idx = _load_json_cached(ARCHIVE_IDX)
+    raw = idx.get("dates") if isinstance(idx, dict) else None
+    if isinstance(raw, list):
+        dates = [d for d in map(_strip_str, raw) if d]
 
     # Ensure today exists if stories.json has a date.
-    try:
-        if os.path.exists(OUTPUT_FILE):
-            day = json.load(open(OUTPUT_FILE, "r", encoding="utf-8"))
-            d = str(day.get("date") or "").strip() if isinstance(day, dict) else ""
-            if d and d not in dates:
-                dates.append(d)
-    except Exception:
-        pass
+    day = _load_json_cached(OUTPUT_FILE)
+    d = _strip_str(day.get("date")) if isinstance(day, dict) else ""
+    if d and d not in dates:
+        dates.append(d)
 
     # Sort lexicographically (YYYY-MM-DD). Archive index is typically already ordered.
     dates = sorted(set(dates))
     return dates
 
 
+# Strong resolution tokens.
+_EVENT_RESOLVED_RE = re.compile(
+    r"\b(ended|over|resolved|concluded|peace\s+signed|sealed|banished|departed|destroyed|extinguished)\b"
+)
+_EVENT_RESOLVED_FIELDS = ("tagline", "outcome", "significance", "notes")
+
+
 def _event_is_resolved(event: dict) -> bool:
     """Heuristic: decide whether an event feels resolved/ended."""
     if not isinstance(event, dict):
         return False
-    blob = " ".join([
-        str(event.get("tagline") or ""),
-        str(event.get("outcome") or ""),
-        str(event.get("significance") or ""),
-        str(event.get("notes") or ""),
-    ]).lower()
-    # Strong resolution tokens.
-    if re.search(r"\b(ended|over|resolved|concluded|peace\s+signed|sealed\b|banished|departed|destroyed|extinguished)\b", blob):
-        return True
+    for key in _EVENT_RESOLVED_FIELDS:
+        val = event.get(key)
+        if val and _EVENT_RESOLVED_RE.search(str(val).lower()):
+            return True
     return False
 
 
-def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
-    """Compute arc recency, trend, and a coarse stage/intensity from appearances."""
+@dataclass
+class _EventArcContext:
+    """Issue-date lookups shared by every _event_arc_metrics call in one prompt build.
+
+    Also memoizes per-event metrics and inferred geo, since events are scored during
+    selection and then measured again while rendering.
+    """
+    known_dates: list[str]
+    date_index: dict[str, int]
+    recent: frozenset
+    tail5: frozenset
+    prev5: frozenset
+    metrics: dict[int, tuple[dict, dict]] = field(default_factory=dict)
+    geos: dict[int, tuple[dict, dict]] = field(default_factory=dict)
+
+    def event_geo(self, event: dict, loc_names: dict[str, list[str]]) -> dict:
+        """_infer_event_geo_from_codex, computed once per event for this context."""
+        hit = self.geos.get(id(event))
+        if hit is not None and hit[0] is event:
+            return hit[1]
+        geo = _infer_event_geo_from_codex(event, loc_names)
+        self.geos[id(event)] = (event, geo)
+        return geo
+
+    @classmethod
+    def build(cls, known_dates: list[str]) -> "_EventArcContext":
+        known_dates = list(known_dates or [])
+        tail5 = prev5 = frozenset()
+        if len(known_dates) >= 6:
+            tail5 = frozenset(known_dates[-5:])
+            prev5 = frozenset(known_dates[-10:-5] if len(known_dates) >= 10 else known_dates[:-5])
+        return cls(
+            known_dates=known_dates,
+            date_index={d: i for i, d in enumerate(known_dates)},
+            recent=frozenset(known_dates[-_ARC_ACTIVE_DAYS:]),
+            tail5=tail5,
+            prev5=prev5,
+        )
+
+
+def _event_arc_metrics(event: dict, known_dates: list[str], ctx: _EventArcContext = None) -> dict:
+    """Compute arc recency, trend, and a coarse stage/intensity from appearances.
+
+    Pass a shared ``ctx`` when measuring many events against the same ``known_dates``.
+    """
+    if ctx is None:
+        ctx = _EventArcContext.build(known_dates)
+    hit = ctx.metrics.get(id(event))
+    if hit is not None and hit[0] is event:
+        return hit[1]
+    metrics = _compute_event_arc_metrics(event, ctx)
+    ctx.metrics[id(event)] = (event, metrics)
+    return metrics
+
+
+def _compute_event_arc_metrics(event: dict, ctx: _EventArcContext) -> dict:
+    known_dates = ctx.known_dates
     apps = event.get("story_appearances") if isinstance(event, dict) else None
     if not isinstance(apps, list) or not apps:
         return {"last_date": "", "recent_count": 0, "intensity": 1, "stage": "seed"}
@@ -1969,7 +2456,7 @@ def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
     for a in apps:
         if not isinstance(a, dict):
             continue
-        d = str(a.get("date") or "").strip()
+        d = _strip_str(a.get("date"))
         if d:
             dates.append(d)
     if not dates:
@@ -1979,7 +2466,7 @@ def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
     last_date = dates[-1]
 
     # Compute recency in "issues" using archive index ordering.
-    idx = {d: i for i, d in enumerate(known_dates or [])}
+    idx = ctx.date_index
     if last_date in idx:
         days_ago = (len(known_dates) - 1) - idx[last_date]
     else:
@@ -1991,21 +2478,14 @@ def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
         else:
             days_ago = 999
 
-    # Recent appearances window.
-    active_days = max(1, int(WORLD_EVENT_ARC_ACTIVE_DAYS or 14))
-    recent_dates = set()
-    if known_dates:
-        tail = known_dates[-active_days:]
-        recent_dates = set(tail)
-    recent_count = sum(1 for d in dates if d in recent_dates) if recent_dates else 0
+    # Recent appearances window (WORLD_EVENT_ARC_ACTIVE_DAYS issues).
+    recent_count = sum(1 for d in dates if d in ctx.recent)
 
     # Trend: compare last 5 issues vs prior 5 issues.
     trend = 0
-    if known_dates and len(known_dates) >= 6:
-        tail = known_dates[-5:]
-        prev = known_dates[-10:-5] if len(known_dates) >= 10 else known_dates[:-5]
-        tail_n = sum(1 for d in dates if d in set(tail))
-        prev_n = sum(1 for d in dates if d in set(prev))
+    if len(known_dates) >= 6:
+        tail_n = sum(1 for d in dates if d in ctx.tail5)
+        prev_n = sum(1 for d in dates if d in ctx.prev5)
         trend = tail_n - prev_n
 
     resolved = _event_is_resolved(event)
@@ -2028,11 +2508,11 @@ def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
             intensity = 1
 
         if days_ago <= 1:
-            intensity = min(intensity + 1, int(WORLD_EVENT_ARC_INTENSITY_MAX or 5))
+            intensity = min(intensity + 1, _ARC_INTENSITY_MAX)
         if trend >= 2:
-            intensity = min(intensity + 1, int(WORLD_EVENT_ARC_INTENSITY_MAX or 5))
+            intensity = min(intensity + 1, _ARC_INTENSITY_MAX)
 
-    intensity = max(1, min(intensity, int(WORLD_EVENT_ARC_INTENSITY_MAX or 5)))
+    intensity = max(1, min(intensity, _ARC_INTENSITY_MAX))
 
     # Stage: how it should read in-story.
     if resolved:
@@ -2059,6 +2539,56 @@ def _event_arc_metrics(event: dict, known_dates: list[str]) -> dict:
     }
 
 
+class _NameMatcher:
+    """Canon names of one category, matched against a normalized blob in list order.
+
+    The substring pass runs as filter(blob.__contains__, ...) over the distinct
+    normalized names, so the per-name Python loop only covers actual substring hits.
+    """
+
+    __slots__ = ("entries", "by_norm", "norms")
+
+    def __init__(self, names):
+        self.entries = []
+        self.by_norm: dict[str, list[int]] = {}
+        for nm in names or ():
+            pat = _name_mention_pattern(str(nm or ""))
+            if pat is None:
+                continue
+            self.by_norm.setdefault(pat[0], []).append(len(self.entries))
+            self.entries.append((nm, pat[1]))
+        self.norms = tuple(self.by_norm)
+
+    def find_all(self, blob_norm: str) -> list:
+        if not blob_norm:
+            return []
+        hits = sorted(i for norm in filter(blob_norm.__contains__, self.norms) for i in self.by_norm[norm])
+        return [self.entries[i][0] for i in hits if self.entries[i][1].search(blob_norm)]
+
+
+_loc_matchers_slot: list = [None, {}]
+
+
+def _loc_name_matchers(loc_names: dict[str, list[str]]) -> dict[str, _NameMatcher]:
+    """Per-category _NameMatcher for a _canon_loc_names_from_codex result (last one is kept)."""
+    if _loc_matchers_slot[0] is not loc_names:
+        _loc_matchers_slot[:] = [loc_names, {cat: _NameMatcher(names) for cat, names in (loc_names or {}).items()}]
+    return _loc_matchers_slot[1]
+
+
+_EVENT_SCOPES = frozenset({"city", "regional", "continental", "world"})
+
+
+def _explicit_event_scope(event: dict) -> str:
+    """The event's own valid ``scope`` field, lowercased, or "" when it must be inferred."""
+    scope = (event.get("scope") or "").strip().lower()
+    return scope if scope in _EVENT_SCOPES else ""
+
+
+# Mention categories in epicenter priority order (most specific first).
+_EVENT_GEO_PRIORITY = ("places", "districts", "provinces", "regions", "realms", "continents", "worlds")
+
+
 def _infer_event_geo_from_codex(event: dict, loc_names: dict[str, list[str]]) -> dict:
     """Infer a rough epicenter + affected scope for an event from its text.
 
@@ -2068,27 +2598,18 @@ def _infer_event_geo_from_codex(event: dict, loc_names: dict[str, list[str]]) ->
         return {"scope": "regional", "epicenter": "unknown", "mentions": {}}
 
     blob = "\n".join([
-        str(event.get("name") or "").strip(),
-        str(event.get("tagline") or "").strip(),
-        str(event.get("significance") or "").strip(),
-        str(event.get("outcome") or "").strip(),
+        _strip_str(event.get("name")),
+        _strip_str(event.get("tagline")),
+        _strip_str(event.get("significance")),
+        _strip_str(event.get("outcome")),
     ]).strip()
 
+    blob_norm = _norm_text_for_matching(blob)
+    matchers = _loc_name_matchers(loc_names)
     mentions: dict[str, list[str]] = {}
-    priority = [
-        ("places", "place"),
-        ("districts", "district"),
-        ("provinces", "province"),
-        ("regions", "region"),
-        ("realms", "realm"),
-        ("continents", "continent"),
-        ("worlds", "world"),
-    ]
-    for cat, _ in priority:
-        found = []
-        for nm in loc_names.get(cat, []) or []:
-            if entity_name_mentioned_in_text(nm, blob):
-                found.append(nm)
+    for cat in _EVENT_GEO_PRIORITY:
+        matcher = matchers.get(cat)
+        found = matcher.find_all(blob_norm) if matcher is not None else []
         if found:
             # Deduplicate while preserving order.
             seen = set()
@@ -2109,16 +2630,18 @@ def _infer_event_geo_from_codex(event: dict, loc_names: dict[str, list[str]]) ->
     ]:
         vals = event.get(key)
         if isinstance(vals, list):
-            cleaned = [str(x or "").strip() for x in vals if str(x or "").strip()]
+            cleaned = [x for x in map(_strip_str, vals) if x]
             if cleaned:
-                mentions.setdefault(cat, [])
-                existing = {str(x or "").strip().lower() for x in mentions.get(cat, [])}
+                lst = mentions.get(cat)
+                if lst is None:
+                    lst = mentions[cat] = []
+                existing = {_strip_str(x).lower() for x in lst}
                 for x in cleaned:
                     xl = x.lower()
                     if xl in existing:
                         continue
                     existing.add(xl)
-                    mentions[cat].append(x)
+                    lst.append(x)
 
     # Prefer explicit epicenter fields if present.
     epicenter = "unknown"
@@ -2132,13 +2655,13 @@ def _infer_event_geo_from_codex(event: dict, loc_names: dict[str, list[str]]) ->
     elif explicit_realm:
         epicenter = explicit_realm
     else:
-        for cat, _ in priority:
+        for cat in _EVENT_GEO_PRIORITY:
             if mentions.get(cat):
                 epicenter = mentions[cat][0]
                 break
 
-    scope = (event.get("scope") or "").strip().lower()
-    if scope not in {"city", "regional", "continental", "world"}:
+    scope = _explicit_event_scope(event)
+    if not scope:
         scope = "regional"
         if mentions.get("worlds"):
             scope = "world"
@@ -2226,7 +2749,7 @@ def _entity_geo_anchors(category: str, item: dict) -> dict[str, str]:
         return {}
 
     def _get(key: str) -> str:
-        return str(item.get(key) or "").strip()
+        return _strip_str(item.get(key))
 
     anchors = {
         "world": _get("world"),
@@ -2267,64 +2790,95 @@ def _entity_geo_anchors(category: str, item: dict) -> dict[str, str]:
     return {k: v for k, v in anchors.items() if _truthy_non_unknown(v)}
 
 
-def _in_event_scope(entity_anchors: dict[str, str], event_geo: dict) -> bool:
-    if not entity_anchors or not isinstance(event_geo, dict):
-        return False
+# Entity anchor level -> event mention category that puts it in scope, per event scope.
+# World-scope events include every anchored entity.
+_EVENT_SCOPE_MATCH_LEVELS = {
+    "city": (("place", "places"), ("district", "districts"), ("province", "provinces")),
+    "regional": (("region", "regions"), ("realm", "realms"), ("place", "places")),
+    "continental": (("continent", "continents"), ("realm", "realms"), ("region", "regions")),
+}
+
+
+def _entity_anchor_set(category: str, item: dict) -> frozenset:
+    """_entity_geo_anchors as a frozenset of (level, lowercased value) pairs."""
+    return frozenset((level, value.lower()) for level, value in _entity_geo_anchors(category, item).items())
+
 
+def _event_scope_set(event_geo: dict):
+    """(level, lowercased name) pairs an entity anchor must hit to fall inside the event.
+
+    Returns None for world-scope events (any anchored entity qualifies).
+    """
+    if not isinstance(event_geo, dict):
+        return frozenset()
     scope = str(event_geo.get("scope") or "regional").strip().lower()
+    if scope == "world":
+        return None
     mentions = event_geo.get("mentions") if isinstance(event_geo.get("mentions"), dict) else {}
-
-    def _has(cat: str, value: str) -> bool:
+    out = set()
+    for level, cat in _EVENT_SCOPE_MATCH_LEVELS.get(scope, ()):
         vals = mentions.get(cat)
-        if not isinstance(vals, list) or not vals:
-            return False
-        vl = value.lower()
-        return any(str(x or "").strip().lower() == vl for x in vals)
-
-    if scope == "city":
-        return (
-            ("place" in entity_anchors and _has("places", entity_anchors["place"]))
-            or ("district" in entity_anchors and _has("districts", entity_anchors["district"]))
-            or ("province" in entity_anchors and _has("provinces", entity_anchors["province"]))
-        )
+        if isinstance(vals, list):
+            out.update((level, _strip_str(x).lower()) for x in vals)
+    return frozenset(out)
 
-    if scope == "regional":
-        return (
-            ("region" in entity_anchors and _has("regions", entity_anchors["region"]))
-            or ("realm" in entity_anchors and _has("realms", entity_anchors["realm"]))
-            or ("place" in entity_anchors and _has("places", entity_anchors["place"]))
-        )
 
-    if scope == "continental":
-        return (
-            ("continent" in entity_anchors and _has("continents", entity_anchors["continent"]))
-            or ("realm" in entity_anchors and _has("realms", entity_anchors["realm"]))
-            or ("region" in entity_anchors and _has("regions", entity_anchors["region"]))
-        )
+@dataclass
+class _SuggestionCategoryIndex:
+    """One codex category prepared for the per-event in-scope ingredients lookup."""
+    # (item, lowercased name, anchor set) for named items with geo anchors, in codex order.
+    anchored: list[tuple[dict, str, frozenset]] = field(default_factory=list)
+    # Lowercased name -> (codex position, item) of the first item with that name.
+    first_by_name: dict[str, tuple[int, dict]] = field(default_factory=dict)
 
-    if scope == "world":
-        if "world" in entity_anchors and _has("worlds", entity_anchors["world"]):
-            return True
-        return True
 
-    return False
+def _codex_anchor_index(codex: dict, categories) -> dict[str, _SuggestionCategoryIndex]:
+    """Per category, name and geo-anchor lookups for the in-scope ingredients block.
+
+    Built once per world-events section so each picked event only does dict hits and
+    set intersections.
+    """
+    out = {}
+    if not isinstance(codex, dict):
+        return out
+    for cat in categories:
+        items = codex.get(cat, [])
+        if not isinstance(items, list) or not items:
+            continue
+        idx = _SuggestionCategoryIndex()
+        for pos, it in enumerate(items):
+            if not isinstance(it, dict):
+                continue
+            nm_it = (it.get("name") or "").strip()
+            if not nm_it:
+                continue
+            k = nm_it.lower()
+            idx.first_by_name.setdefault(k, (pos, it))
+            anchors = _entity_anchor_set(cat, it)
+            if anchors:
+                idx.anchored.append((it, k, anchors))
+        out[cat] = idx
+    return out
 
 
-def _select_world_event_arcs(today_str: str, codex=None) -> list:
+def _select_world_event_arcs(today_str: str, codex=None, arc_ctx: _EventArcContext = None, loc_names=None) -> list:
     """Pick a small set of active/important events deterministically per day.
 
     Returns a list of event dicts from the codex.  The same seed produces the
     same selection on a given day, so repeated calls are idempotent.
     """
     if codex is None:
-        codex = load_codex_file()
+        codex = load_codex_file_readonly()
     events = codex.get("events", []) if isinstance(codex, dict) else []
     if not isinstance(events, list) or not events:
         return []
 
-    known_dates = _load_known_issue_dates()
-    loc_names = _canon_loc_names_from_codex(codex)
-    rng = random.Random(_stable_seed_int(today_str, "world_event_arcs"))
+    if arc_ctx is None:
+        arc_ctx = _EventArcContext.build(_load_known_issue_dates())
+    known_dates = arc_ctx.known_dates
+    if loc_names is None:
+        loc_names = _canon_loc_names_from_codex(codex)
+    jitter = _event_arc_jitter(today_str, len(events))
     scored = []
     for e in events:
         if not isinstance(e, dict):
@@ -2332,39 +2886,53 @@ def _select_world_event_arcs(today_str: str, codex=None) -> list:
         nm = (e.get("name") or "").strip()
         if not nm:
             continue
-        sig = (e.get("significance") or "")
-        out = (e.get("outcome") or "")
-        arc = _event_arc_metrics(e, known_dates)
-        geo = _infer_event_geo_from_codex(e, loc_names)
-        scope = str(geo.get("scope") or "regional").strip().lower()
+        text_len = len(e.get("significance") or "") + len(e.get("outcome") or "")
+        arc = _event_arc_metrics(e, known_dates, arc_ctx)
+        # Scoring only needs the scope; skip the text scan when the event declares one.
+        # Picked events still get full geo (mentions) when rendered.
+        scope = _explicit_event_scope(e)
+        if not scope:
+            geo = arc_ctx.event_geo(e, loc_names)
+            scope = str(geo.get("scope") or "regional").strip().lower()
 
         # Prefer large-scale arcs for the issue-wide section.
-        if scope == "world":
-            scope_weight = 1.35
-        elif scope == "continental":
-            scope_weight = 1.25
-        elif scope == "regional":
-            scope_weight = 1.0
-        elif scope in {"city", "local"}:
-            scope_weight = 0.7
-        else:
-            scope_weight = 1.0
-
-        weight = (1.0 + min(3.0, (len(sig) + len(out)) / 400.0)) * scope_weight
+        weight = (1.0 + min(3.0, text_len / 400.0)) * _EVENT_ARC_SCOPE_WEIGHTS.get(scope, 1.0)
         if arc.get("resolved"):
             weight *= 0.7
         else:
             weight *= (1.0 + 0.18 * int(arc.get("intensity") or 1))
             if int(arc.get("days_ago") or 999) <= 2:
                 weight *= 1.25
-        weight *= (0.92 + 0.16 * rng.random())
-        scored.append((weight, e, arc))
+        weight *= jitter[len(scored)]
+        scored.append((weight, e))
+
+    limit = _ARC_PICK_LIMIT
+    # Only a handful are picked, so a partial selection usually suffices; fall back
+    # to the full ranking when (name, type) duplicates eat into the top slice.
+    picked = _dedupe_event_arcs(heapq.nlargest(limit, scored, key=_first_item), limit)
+    if len(picked) < limit < len(scored):
+        picked = _dedupe_event_arcs(sorted(scored, key=_first_item, reverse=True), limit)
+    return picked
+
+
+@functools.lru_cache(maxsize=8)
+def _event_arc_jitter(today_str: str, n: int) -> tuple:
+    """Per-day multiplicative jitter for the first ``n`` scored events, drawn in one batch."""
+    rng = random.Random(_stable_seed_int(today_str, "world_event_arcs"))
+    return tuple(0.92 + 0.16 * rng.random() for _ in range(n))
+
+
+_EVENT_ARC_SCOPE_WEIGHTS = {"world": 1.35, "continental": 1.25, "regional": 1.0, "city": 0.7, "local": 0.7}
 
-    scored.sort(key=lambda x: x[0], reverse=True)
 
+def _first_item(pair):
+    return pair[0]
+
+
+def _dedupe_event_arcs(ranked, limit: int) -> list:
     picked = []
     seen = set()
-    for _weight, event_row, _arc in scored:
+    for _weight, event_row in ranked:
         name_key = (event_row.get("name") or "").strip().lower()
         type_key = (event_row.get("event_type") or "").strip().lower()
         dedupe_key = (name_key, type_key)
@@ -2374,12 +2942,44 @@ def _select_world_event_arcs(today_str: str, codex=None) -> list:
             continue
         seen.add(dedupe_key)
         picked.append(event_row)
-        if len(picked) >= max(0, int(WORLD_EVENT_ARCS_MAX or 0)):
+        if len(picked) >= limit:
             break
-
     return picked
 
 
+def _indent_lines(lines, prefix: str) -> str:
+    """Prefix every line and rejoin them as a single chunk of a newline-joined prompt."""
+    return prefix + ("\n" + prefix).join(lines)
+
+
+# Fixed preamble of the world-events prompt section (ends with a blank line).
+_WORLD_EVENT_ARCS_HEADER = "\n".join([
+    "ISSUE-WIDE WORLD EVENTS (shared continuity / cross-story pressures):",
+    "- Treat these as real background pressures in the world. Some stories may be directly inside the affected area; others may only hear rumor.",
+    "- If a story is set within an event's scope, show at least ONE concrete effect (refugees, rationing, conscription, tolls, cults, broken trade, riots, shadow-markets, etc.).",
+    "- You may let minor characters cross paths across stories due to these pressures, but do NOT reuse the same protagonist or primary location.",
+    "- If you organically introduce a NEW large-scale event, let it persist across future issues: escalate from hints → consequences → turning points → aftermath, then either resolve it or let it cool into lasting scars.",
+    "- Arc pacing mechanic (organic):",
+    f"  - Canonical intensity scale is 1-{_ARC_INTENSITY_MAX}: 1=seed, 2=simmering, 3=rising, 4=crisis, 5=climax. Resolved events read as aftermath.",
+    "  - seed/simmering: subtle signs, rumors, odd shortages, new cult whispers; easy to miss.",
+    "  - rising/crisis: unmistakable consequences, travel disruption, faction moves, villains/saints emerging.",
+    "  - climax/aftermath: a breaking point or a scar; show what changed and what remains unresolved.",
+    "",
+])
+
+# Cross-category canon offered as optional ingredients inside an event's radius.
+_EVENT_SUGGESTION_CATEGORIES = (
+    "characters",
+    "factions",
+    "artifacts",
+    "weapons",
+    "relics",
+    "substances",
+    "magic",
+    "flora_fauna",
+)
+
+
 def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossiers=None) -> str:
     """Build a small, issue-wide world-events section for the generation prompt.
 
@@ -2393,33 +2993,24 @@ def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossier
     if not ENABLE_WORLD_EVENT_ARCS:
         return ""
 
-    codex = load_codex_file()
-    picked = _select_world_event_arcs(today_str, codex)
+    codex = load_codex_file_readonly()
+    known_dates = _load_known_issue_dates()
+    arc_ctx = _EventArcContext.build(known_dates)
+    loc_names = _canon_loc_names_from_codex(codex)
+    picked = _select_world_event_arcs(today_str, codex, arc_ctx, loc_names)
     if not picked:
         return ""
 
-    loc_names = _canon_loc_names_from_codex(codex)
-    known_dates = _load_known_issue_dates()
+    anchor_index = _codex_anchor_index(codex, _EVENT_SUGGESTION_CATEGORIES)
 
-    lines = []
-    lines.append("ISSUE-WIDE WORLD EVENTS (shared continuity / cross-story pressures):")
-    lines.append("- Treat these as real background pressures in the world. Some stories may be directly inside the affected area; others may only hear rumor.")
-    lines.append("- If a story is set within an event's scope, show at least ONE concrete effect (refugees, rationing, conscription, tolls, cults, broken trade, riots, shadow-markets, etc.).")
-    lines.append("- You may let minor characters cross paths across stories due to these pressures, but do NOT reuse the same protagonist or primary location.")
-    lines.append("- If you organically introduce a NEW large-scale event, let it persist across future issues: escalate from hints → consequences → turning points → aftermath, then either resolve it or let it cool into lasting scars.")
-    lines.append("- Arc pacing mechanic (organic):")
-    lines.append(f"  - Canonical intensity scale is 1-{int(WORLD_EVENT_ARC_INTENSITY_MAX or 5)}: 1=seed, 2=simmering, 3=rising, 4=crisis, 5=climax. Resolved events read as aftermath.")
-    lines.append("  - seed/simmering: subtle signs, rumors, odd shortages, new cult whispers; easy to miss.")
-    lines.append("  - rising/crisis: unmistakable consequences, travel disruption, faction moves, villains/saints emerging.")
-    lines.append("  - climax/aftermath: a breaking point or a scar; show what changed and what remains unresolved.")
-    lines.append("")
+    lines = [_WORLD_EVENT_ARCS_HEADER]
 
     for i, e in enumerate(picked, start=1):
         nm = (e.get("name") or "Unknown").strip() or "Unknown"
         et = (e.get("event_type") or "").strip()
         tag = (e.get("tagline") or "").strip()
-        geo = _infer_event_geo_from_codex(e, loc_names)
-        arc = _event_arc_metrics(e, known_dates)
+        geo = arc_ctx.event_geo(e, loc_names)
+        arc = _event_arc_metrics(e, known_dates, arc_ctx)
         scope = geo.get("scope", "regional")
         epic = geo.get("epicenter", "unknown")
 
@@ -2438,16 +3029,16 @@ def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossier
         # Arc status hint: helps the model persist/slow-burn/escalate across days without forcing.
         stage = str(arc.get("stage") or "seed")
         intensity = int(arc.get("intensity") or 1)
-        last_seen = str(arc.get("last_date") or "").strip()
+        last_seen = _strip_str(arc.get("last_date"))
         recent_count = int(arc.get("recent_count") or 0)
-        arc_bits = [f"Arc: {stage}", f"Intensity: {intensity}/{int(WORLD_EVENT_ARC_INTENSITY_MAX or 5)}"]
+        arc_bits = [f"Arc: {stage}", f"Intensity: {intensity}/{_ARC_INTENSITY_MAX}"]
         if last_seen:
             arc_bits.append(f"Last seen: {last_seen}")
         if recent_count:
             arc_bits.append(f"Recent issues: {recent_count}")
         lines.append("   " + " | ".join(arc_bits))
 
-        scope_lc = str(scope or "").strip().lower()
+        scope_lc = _strip_str(scope).lower()
         if scope_lc in {"city", "local"}:
             lines.append("   Visibility: most effects are localized; outsiders hear rumor or see displaced people.")
         elif scope_lc in {"regional", "region"}:
@@ -2482,8 +3073,7 @@ def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossier
         dossier_text = (event_arc_dossiers.get(event_name_lc) or "").strip()
         if dossier_text:
             lines.append("   ARC DOSSIER (summarized from prior tales):")
-            for dline in dossier_text.split("\n"):
-                lines.append(f"     {dline}")
+            lines.append(_indent_lines(dossier_text.split("\n"), "     "))
         else:
             # Fallback: inject raw tales (capped for scale)
             event_tales = gather_prior_tales_for_entity(
@@ -2499,59 +3089,28 @@ def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossier
                     ttitle = tale.get("title", "")
                     ttext = tale.get("text", "")
                     lines.append(f"   [{tdate}] \"{ttitle}\":")
-                    for tline in ttext.split("\n"):
-                        lines.append(f"     {tline.strip()}")
+                    lines.append(_indent_lines(map(str.strip, ttext.split("\n")), "     "))
 
         # Optional cross-category canon ingredients within the event radius.
         try:
             suggestions = []
-            suggestion_cats = [
-                "characters",
-                "factions",
-                "artifacts",
-                "weapons",
-                "relics",
-                "substances",
-                "magic",
-                "flora_fauna",
-            ]
             participants = e.get("participants")
-            participant_set = {str(x or "").strip().lower() for x in participants} if isinstance(participants, list) else set()
+            participant_set = {_strip_str(x).lower() for x in participants} if isinstance(participants, list) else set()
+            scope_set = _event_scope_set(geo)
 
-            for cat in suggestion_cats:
-                items = codex.get(cat, []) if isinstance(codex, dict) else []
-                if not isinstance(items, list) or not items:
+            for cat in _EVENT_SUGGESTION_CATEGORIES:
+                cat_index = anchor_index.get(cat)
+                if cat_index is None:
                     continue
 
-                pool = []
-                seen = set()
-
-                # Include any participant matches for this category.
-                if participant_set:
-                    for it in items:
-                        if not isinstance(it, dict):
-                            continue
-                        nm_it = (it.get("name") or "").strip()
-                        if nm_it and nm_it.lower() in participant_set:
-                            k = nm_it.lower()
-                            if k in seen:
-                                continue
-                            seen.add(k)
-                            pool.append(it)
+                # Include any participant matches for this category (codex order).
+                seen = {k for k in participant_set if k in cat_index.first_by_name}
+                pool = [it for _pos, it in sorted(cat_index.first_by_name[k] for k in seen)]
 
                 # Include geo-anchored in-scope items.
-                for it in items:
-                    if not isinstance(it, dict):
-                        continue
-                    nm_it = (it.get("name") or "").strip()
-                    if not nm_it:
-                        continue
-                    anchors = _entity_geo_anchors(cat, it)
-                    if not anchors:
-                        continue
-                    if not _in_event_scope(anchors, geo):
+                for it, k, anchors in cat_index.anchored:
+                    if scope_set is not None and not (anchors & scope_set):
                         continue
-                    k = nm_it.lower()
                     if k in seen:
                         continue
                     seen.add(k)
@@ -2560,9 +3119,9 @@ def build_world_event_arcs_section(today_str: str, lore: dict, event_arc_dossier
                 if not pool:
                     continue
 
-                pool = _safe_sorted_by_appearances(pool)
+                # Same picks as _safe_sorted_by_appearances(pool)[:2], ties included.
                 names = []
-                for it in pool[:2]:
+                for it in heapq.nlargest(2, pool, key=_appearances_key):
                     nm_it = (it.get("name") or "").strip()
                     if nm_it:
                         names.append(nm_it)
@@ -2852,88 +3411,229 @@ Guidelines:
   that fits. The label should feel like a pulp magazine category."""
 
 
-_CHILDLIKE_RE = re.compile(
-    r"\b(child|children|kid|kids|boy|girl|infant|baby|toddler|young\s+(?:son|daughter)|little\s+(?:son|daughter))\b",
-    re.IGNORECASE,
-)
-_CHILD_OWN_RE = re.compile(r"\b(her|his|their|my|your|our)\s+own\s+(child|baby|infant|toddler)\b", re.IGNORECASE)
-_CHILD_DEATH_RE = re.compile(r"\b(died|die|dead|death|corpse|funeral|buried)\b", re.IGNORECASE)
-_CHILD_ABDUCTION_RE = re.compile(
-    r"\b(kidnap(?:ped|ping)?|abduct(?:ed|ion)?|snatch(?:ed|ing)?|carried\s+off|spirited\s+away|ransom(?:ed)?|held\s+hostage|hostage|traffick(?:ed|ing)?)\b",
-    re.IGNORECASE,
-)
-_CHILD_VIOLENCE_RE = re.compile(
-    r"\b(kill|killed|killing|murder|murdered|slay|slain|stab|stabbed|strangle|strangled|smother|smothered|drown|drowned|poison|poisoned|sacrifice|sacrificed|burned\s+alive|butcher|butchered)\b",
-    re.IGNORECASE,
+@functools.cache
+def _re2():
+    """The optional google-re2 module, or None; imported on the first guardrail scan."""
+    try:
+        import re2  # type: ignore
+    except Exception:  # optional; guardrail scans use stdlib re without it
+        return None
+    return re2
+
+
+@functools.cache
+def _guard_re(pattern: str):
+    """Case-insensitive guardrail pattern, compiled on first use.
+
+    Runs on RE2 when google-re2 is installed. The guardrail patterns are plain
+    word alternations (no backreferences or lookaround), but RE2's \b, \w and
+    \s are ASCII-only, so scan _guard_text(text) rather than the raw text to get
+    the same matches as re. Importers that never scan a story (the audit and
+    backfill scripts) pay for neither the import nor the compiles.
+    """
+    re2 = _re2()
+    if re2 is not None:
+        return re2.compile(f"(?i){pattern}")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# ASCII characters that re's \s matches but RE2's ([\t\n\f\r ]) does not.
+_RE2_WHITESPACE_GAP_RE = re.compile(r"[\x0b\x1c-\x1f]")
+
+
+class _Re2ScanTable(dict):
+    """str.translate table mapping each character to an ASCII stand-in of the same re class.
+
+    Whitespace becomes a space, characters re folds onto an ASCII letter under
+    IGNORECASE (Kelvin sign, long s, dotted/dotless i) become that letter, other
+    word characters become "_" and everything else "#". Neither stand-in occurs
+    in a guardrail pattern, and the one-for-one mapping keeps match offsets.
+    """
+
+    def __missing__(self, cp: int) -> str:
+        c = chr(cp)
+        if c.isascii() and not _RE2_WHITESPACE_GAP_RE.match(c):
+            out = c
+        elif re.match(r"\s", c):
+            out = " "
+        elif re.match(r"\w", c):
+            out = next((a for a in "iks" if re.fullmatch(a, c, re.IGNORECASE)), "_")
+        else:
+            out = "#"
+        self[cp] = out
+        return out
+
+
+_RE2_SCAN_TABLE = _Re2ScanTable()
+
+
+def _guard_text(text: str) -> str:
+    """``text`` as the guardrail regexes should scan it.
+
+    Unchanged on stdlib re. On RE2, non-ASCII characters (and the ASCII controls
+    only re counts as whitespace) are swapped for _RE2_SCAN_TABLE stand-ins, so
+    "childé" keeps its word characters together and "young\xa0son" keeps its
+    whitespace, exactly as re sees them.
+    """
+    if _re2() is None or (text.isascii() and not _RE2_WHITESPACE_GAP_RE.search(text)):
+        return text
+    return text.translate(_RE2_SCAN_TABLE)
+
+
+# re's IGNORECASE matches both Turkish i's to "i", which casefold() does not
+# (it leaves "ı" alone and turns "İ" into "i" plus a combining dot).
+_ROOT_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _contains_any_root(text: str, roots: tuple) -> bool:
+    """Cheap superset check ahead of a guardrail regex when RE2 is unavailable.
+
+    Plain substring tests run on CPython's fast string search; re's word-bounded,
+    case-insensitive alternations cost several times more on a clean story.
+    """
+    if not text.isascii():
+        text = text.translate(_ROOT_FOLD_TABLE)
+    folded = text.casefold()
+    return any(root in folded for root in roots)
+
+
+_CHILDLIKE_TERMS = r"child|children|kid|kids|boy|girl|infant|baby|toddler|young\s+(?:son|daughter)|little\s+(?:son|daughter)"
+_CHILD_OWN_TERMS = r"(?:her|his|their|my|your|our)\s+own\s+(?:child|baby|infant|toddler)"
+_CHILD_DEATH_TERMS = r"died|die|dead|death|corpse|funeral|buried"
+_CHILD_ABDUCTION_TERMS = r"kidnap(?:ped|ping)?|abduct(?:ed|ion)?|snatch(?:ed|ing)?|carried\s+off|spirited\s+away|ransom(?:ed)?|held\s+hostage|hostage|traffick(?:ed|ing)?"
+_CHILD_VIOLENCE_TERMS = r"kill|killed|killing|murder|murdered|slay|slain|stab|stabbed|strangle|strangled|smother|smothered|drown|drowned|poison|poisoned|sacrifice|sacrificed|burned\s+alive|butcher|butchered"
+# Every childlike match contains one of these (young/little cover the son/daughter forms).
+_CHILDLIKE_ROOTS = ("child", "kid", "boy", "girl", "infant", "baby", "toddler", "young", "little")
+_CHILDLIKE_PATTERN = rf"\b({_CHILDLIKE_TERMS})\b"
+# Every child-harm term in one left-to-right pass, tagged by family. The
+# families never overlap, except that an "own child" phrase ends in a
+# childlike noun, which the scan records as a child hit as well.
+_CHILD_HARM_TERMS_PATTERN = (
+    rf"\b(?:(?P<own>{_CHILD_OWN_TERMS})|(?P<child>{_CHILDLIKE_TERMS})|(?P<abduction>{_CHILD_ABDUCTION_TERMS})"
+    rf"|(?P<violence>{_CHILD_VIOLENCE_TERMS})|(?P<death>{_CHILD_DEATH_TERMS}))\b"
 )
-_BROAD_TRAGEDY_CAUSE_RE = re.compile(
+_BROAD_TRAGEDY_CAUSE_PATTERN = (
     r"\b("
     r"plague|epidemic|pox|fever|sickness|disease|illness|rot\s+king|"
     r"famine|"
     r"war|battle|siege|campaign|invasion|massacre|slaughter|"
     r"drought|flood|fire|wildfire|earthquake|storm|blizzard|landslide|tidal\s+wave|"
     r"death\s+magic|necromanc|miasma|doom\s+fog|black\s+wind"
-    r")\b",
-    re.IGNORECASE,
+    r")\b"
 )
-_MASS_CONTEXT_RE = re.compile(
-    r"\b(village|town|city|realm|region|province|district|many|dozens|scores|hundreds|thousands|the\s+people|the\s+populace|crowds)\b",
-    re.IGNORECASE,
+_MASS_CONTEXT_PATTERN = (
+    r"\b(village|town|city|realm|region|province|district|many|dozens|scores|hundreds|thousands|the\s+people|the\s+populace|crowds)\b"
 )
 
 
 def _natural_mass_context(text: str) -> bool:
-    s = (text or "")
+    s = _guard_text(text or "")
     # We treat only broad, indiscriminate mass-casualty contexts as an exception.
     # This is intentionally conservative: it allows brief allusions to war/plague/etc
     # without permitting targeted child harm.
-    return bool(_BROAD_TRAGEDY_CAUSE_RE.search(s) and _MASS_CONTEXT_RE.search(s))
+    return bool(_guard_re(_BROAD_TRAGEDY_CAUSE_PATTERN).search(s) and _guard_re(_MASS_CONTEXT_PATTERN).search(s))
 
 
-def _near(text: str, a: re.Pattern, b: re.Pattern, window: int = 90) -> bool:
-    s = text or ""
-    for ma in a.finditer(s):
-        start = max(0, ma.start() - window)
-        end = min(len(s), ma.end() + window)
-        if b.search(s[start:end]):
+def _spans_near(a_spans: list, b_spans: list, window: int) -> bool:
+    """True when some b span lies entirely within `window` chars of an a span.
+
+    Both lists are sorted, non-overlapping match spans, so a single forward
+    walk over b suffices: the first b span starting inside an a span's window
+    is also the one that ends soonest, and windows only move right.
+    """
+    j = 0
+    nb = len(b_spans)
+    for start, end in a_spans:
+        lo = start - window
+        while j < nb and b_spans[j][0] < lo:
+            j += 1
+        if j == nb:
+            return False
+        if b_spans[j][1] <= end + window:
             return True
     return False
 
 
-def child_harm_violations_for_story(story: dict) -> list:
+def _near(text: str, a: re.Pattern, b: re.Pattern, window: int = 90) -> bool:
+    s = text or ""
+    a_spans = [m.span() for m in a.finditer(s)]
+    if not a_spans:
+        return False
+    return _spans_near(a_spans, [m.span() for m in b.finditer(s)], window)
+
+
+def _child_harm_hits(blob: str) -> dict:
+    hits = {"own": [], "child": [], "abduction": [], "violence": [], "death": []}
+    for m in _guard_re(_CHILD_HARM_TERMS_PATTERN).finditer(_guard_text(blob)):
+        kind = m.lastgroup
+        hits[kind].append(m.span())
+        if kind == "own":
+            noun = m.group().rsplit(None, 1)[-1]
+            hits["child"].append((m.end() - len(noun), m.end()))
+    hits["child"].sort()
+    return hits
+
+
+def _story_guard_blob(story) -> str:
     title = (story.get("title") or "") if isinstance(story, dict) else ""
     text = (story.get("text") or "") if isinstance(story, dict) else ""
-    blob = f"{title}\n\n{text}".strip()
-    if not blob:
-        return []
+    return f"{title}\n\n{text}".strip()
 
-    violations = []
-    has_child = bool(_CHILDLIKE_RE.search(blob) or _CHILD_OWN_RE.search(blob))
-    if not has_child:
-        return []
 
-    if _CHILD_OWN_RE.search(blob) and _CHILD_VIOLENCE_RE.search(blob):
-        violations.append("targeted harm to a child (own child + violence)")
+def child_harm_violations_for_story(story: dict) -> list:
+    return list(_child_harm_violations_in(_story_guard_blob(story)))
+
+
+# Rewrite passes re-scan every story, and most come back unchanged; the guards
+# are pure functions of the story text, so memoize them on it.
+@functools.lru_cache(maxsize=1024)
+def _child_harm_violations_in(blob: str) -> tuple:
+    if not blob:
+        return ()
+
+    # An "own child" phrase always contains a childlike word, so this one
+    # search is enough to clear the (common) stories with no children at all.
+    if _re2() is None and not _contains_any_root(blob, _CHILDLIKE_ROOTS):
+        return ()
+    scan = _guard_text(blob)
+    if not _guard_re(_CHILDLIKE_PATTERN).search(scan):
+        return ()
+
+    hits = _child_harm_hits(scan)
+    child, own = hits["child"], hits["own"]
+    abduction, violence = hits["abduction"], hits["violence"]
+
+    # Each label is added at most once, in alphabetical order, so callers see
+    # the same stable ordering without a sort/dedupe pass.
+    violations = []
+    if _spans_near(child, hits["death"], 120):
+        if not _natural_mass_context(scan):
+            violations.append("child death without broad mass-tragedy context")
 
-    if _near(blob, _CHILDLIKE_RE, _CHILD_ABDUCTION_RE, window=140) or _near(blob, _CHILD_OWN_RE, _CHILD_ABDUCTION_RE, window=220):
+    if _spans_near(child, abduction, 140) or _spans_near(own, abduction, 220):
         violations.append("child kidnapping/abduction/hostage")
 
-    if _near(blob, _CHILDLIKE_RE, _CHILD_VIOLENCE_RE, window=120) or _near(blob, _CHILD_OWN_RE, _CHILD_VIOLENCE_RE, window=200):
+    if own and violence:
+        violations.append("targeted harm to a child (own child + violence)")
+
+    if _spans_near(child, violence, 120) or _spans_near(own, violence, 200):
         violations.append("violence directed at a child")
 
-    if _near(blob, _CHILDLIKE_RE, _CHILD_DEATH_RE, window=120):
-        if not _natural_mass_context(blob):
-            violations.append("child death without broad mass-tragedy context")
+    return tuple(violations)
 
-    return sorted(set(violations))
 
+def _find_story_violations(stories: list, violations_for_story) -> list:
+    """Run a per-story guard over ``stories``; one report row per flagged story.
 
-def find_child_harm_violations(stories: list) -> list:
+    Stories are scanned in-process, one after another: a guard costs tens of
+    microseconds per story, far below what handing stories to worker
+    processes would cost.
+    """
     out = []
     for i, s in enumerate(stories or []):
         if not isinstance(s, dict):
             continue
-        v = child_harm_violations_for_story(s)
+        v = violations_for_story(s)
         if v:
             snippet = ((s.get("text") or "").strip()[:240]).replace("\n", " ")
             out.append({
@@ -2945,12 +3645,16 @@ def find_child_harm_violations(stories: list) -> list:
     return out
 
 
+def find_child_harm_violations(stories: list) -> list:
+    return _find_story_violations(stories, child_harm_violations_for_story)
+
+
 def build_child_harm_rewrite_prompt(stories: list, violations: list) -> str:
     problems = []
     for v in violations:
         problems.append(f"- Story #{v.get('index')+1}: {v.get('title')} — {', '.join(v.get('violations') or [])}")
 
-    payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    payload = _json_dumps(stories, indent=True)
     return f"""You are editing a list of 10 original pulp fantasy stories.
 
 Goal: Remove ANY child death or targeted harm to children.
@@ -2999,53 +3703,52 @@ def sanitize_story_for_child_harm(story: dict) -> dict:
     return new_story
 
 
-_SEXUAL_VIOLENCE_RE = re.compile(
-    r"\b(rape|raped|raping|rapist|sexual\s+assault|assaulted\s+her|assaulted\s+him|forced\s+himself\s+on|forced\s+herself\s+on|violated\s+her|violated\s+him|ravish|ravished|defile|defiled|molest|molested)\b",
-    re.IGNORECASE,
+_SEXUAL_VIOLENCE_TERMS = r"rape|raped|raping|rapist|sexual\s+assault|assaulted\s+her|assaulted\s+him|forced\s+himself\s+on|forced\s+herself\s+on|violated\s+her|violated\s+him|ravish|ravished|defile|defiled|molest|molested"
+_EXPLICIT_SEX_ACT_TERMS = r"intercourse|copulat|fornicat|thrust(?:ing)?|orgasm|climax|came\b|moan(?:ed|ing)?\b|writh(?:ing)?\b"
+_EXPLICIT_ANATOMY_TERMS = r"penis|vagina|clitoris|genitals|nipple(?:s)?|bare\s+breasts?"
+# Every _SEXUAL_CONTENT_TERMS_PATTERN match contains one of these substrings.
+_SEXUAL_CONTENT_ROOTS = (
+    "rap", "assault", "forced", "violated", "ravish", "defile", "molest",
+    "intercourse", "copulat", "fornicat", "thrust", "orgasm", "climax", "came", "moan", "writh",
+    "penis", "vagina", "clitoris", "genital", "nipple", "breast",
 )
-_EXPLICIT_SEX_ACT_RE = re.compile(
-    r"\b(intercourse|copulat|fornicat|thrust(?:ing)?|orgasm|climax|came\b|moan(?:ed|ing)?\b|writh(?:ing)?\b)\b",
-    re.IGNORECASE,
-)
-_EXPLICIT_ANATOMY_RE = re.compile(
-    r"\b(penis|vagina|clitoris|genitals|nipple(?:s)?|bare\s+breasts?)\b",
-    re.IGNORECASE,
+_SEXUAL_CONTENT_TERMS_PATTERN = (
+    rf"\b(?:(?P<violence>{_SEXUAL_VIOLENCE_TERMS})|(?P<explicit>{_EXPLICIT_ANATOMY_TERMS}|{_EXPLICIT_SEX_ACT_TERMS}))\b"
 )
 
 
 def sexual_content_violations_for_story(story: dict) -> list:
-    title = (story.get("title") or "") if isinstance(story, dict) else ""
-    text = (story.get("text") or "") if isinstance(story, dict) else ""
-    blob = f"{title}\n\n{text}".strip()
+    return list(_sexual_content_violations_in(_story_guard_blob(story)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _sexual_content_violations_in(blob: str) -> tuple:
     if not blob:
-        return []
+        return ()
 
-    violations = []
-    if _SEXUAL_VIOLENCE_RE.search(blob):
-        violations.append("rape/sexual assault or sexual violence")
+    if _re2() is None and not _contains_any_root(blob, _SEXUAL_CONTENT_ROOTS):
+        return ()
 
     # Explicit sex depiction: either explicit anatomy, or explicit act language.
-    if _EXPLICIT_ANATOMY_RE.search(blob) or _EXPLICIT_SEX_ACT_RE.search(blob):
+    kinds = set()
+    for m in _guard_re(_SEXUAL_CONTENT_TERMS_PATTERN).finditer(_guard_text(blob)):
+        kinds.add(m.lastgroup)
+        if len(kinds) == 2:
+            break
+
+    # Each label is added at most once, in alphabetical order, as the child-harm
+    # guard does.
+    violations = []
+    if "explicit" in kinds:
         violations.append("explicit sex depiction")
+    if "violence" in kinds:
+        violations.append("rape/sexual assault or sexual violence")
 
-    return sorted(set(violations))
+    return tuple(violations)
 
 
 def find_sexual_content_violations(stories: list) -> list:
-    out = []
-    for i, s in enumerate(stories or []):
-        if not isinstance(s, dict):
-            continue
-        v = sexual_content_violations_for_story(s)
-        if v:
-            snippet = ((s.get("text") or "").strip()[:240]).replace("\n", " ")
-            out.append({
-                "index": i,
-                "title": s.get("title", "Untitled"),
-                "violations": v,
-                "snippet": snippet,
-            })
-    return out
+    return _find_story_violations(stories, sexual_content_violations_for_story)
 
 
 def build_sexual_content_rewrite_prompt(stories: list, violations: list) -> str:
@@ -3053,7 +3756,7 @@ def build_sexual_content_rewrite_prompt(stories: list, violations: list) -> str:
     for v in violations:
         problems.append(f"- Story #{v.get('index')+1}: {v.get('title')} — {', '.join(v.get('violations') or [])}")
 
-    payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    payload = _json_dumps(stories, indent=True)
     return f"""You are editing a list of 10 original pulp fantasy stories.
 
 Goal: Remove rape/sexual assault AND remove explicit sex depictions.
@@ -3107,12 +3810,13 @@ def sanitize_story_for_sexual_content(story: dict) -> dict:
     title = str(story.get("title") or "").strip() or "Untitled"
     text = str(story.get("text") or "")
 
-    patterns = (_SEXUAL_VIOLENCE_RE, _EXPLICIT_ANATOMY_RE, _EXPLICIT_SEX_ACT_RE)
+    # Any violence, anatomy or act term in a sentence drops it.
+    terms_re = _guard_re(_SEXUAL_CONTENT_TERMS_PATTERN)
 
     parts = [p.strip() for p in _SENTENCE_SPLIT_RE.split(text) if p.strip()]
     kept = []
     for p in parts:
-        if any(rx.search(p) for rx in patterns):
+        if terms_re.search(_guard_text(p)):
             continue
         kept.append(p)
 
@@ -3233,7 +3937,7 @@ def build_motif_rewrite_prompt(stories: list, violations: list) -> str:
         motifs = ", ".join(v.get("motifs") or [])
         problems.append(f"- Story #{v.get('index')+1}: {v.get('title')} — {', '.join(v.get('violations') or [])} (motifs: {motifs})")
 
-    payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    payload = _json_dumps(stories, indent=True)
     caps_str = ", ".join(f"{k} ≤ {v}" for k, v in _MOTIF_CAPS.items())
     return f"""You are editing a list of 10 original pulp fantasy stories.
 
@@ -3283,6 +3987,8 @@ _TRAIT_KEYWORDS = re.compile(
     re.IGNORECASE,
 )
 
+_TRAIT_WORD_RE = re.compile(r"\b\w{4,}\b")
+
 
 def _extract_character_traits(text):
     """Extract character -> set-of-traits from parenthetical introductions.
@@ -3308,7 +4014,7 @@ def _find_trait_swap_candidates(text):
         return []
 
     suspects = []
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     for sent in sentences:
         # Find character names mentioned in this sentence.
@@ -3328,7 +4034,7 @@ def _find_trait_swap_candidates(text):
                 continue
             for trait in other_traits:
                 # Check trait keywords appear in this sentence.
-                trait_words = set(re.findall(r'\b\w{4,}\b', trait))
+                trait_words = set(_TRAIT_WORD_RE.findall(trait))
                 for tw in trait_words:
                     if re.search(r'\b' + re.escape(tw) + r'\b', sent, re.IGNORECASE):
                         suspects.append({
@@ -3377,7 +4083,7 @@ def build_continuity_rewrite_prompt(stories, issues):
                 f"keyword \"{s['keyword']}\". Possible swap."
             )
 
-    payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    payload = _json_dumps(stories, indent=True)
     return f"""You are editing a list of 10 original pulp fantasy stories.
 
 Goal: Fix character-trait continuity errors where a trait, role, or oath
@@ -3431,7 +4137,7 @@ def find_canon_collisions(stories, lore, allowed_names_lower):
 
 def build_collision_rename_prompt(stories, collisions_by_cat):
     """Prompt for minimal rewrite that renames accidental canon collisions to NEW names."""
-    stories_payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    stories_payload = _json_dumps(stories, indent=True)
     lines = []
     for cat, items in (collisions_by_cat or {}).items():
         if not items:
@@ -3465,95 +4171,183 @@ STORIES JSON INPUT:
 """
 
 # ── Lore extraction prompt ───────────────────────────────────────────────
-def build_lore_extraction_prompt(stories, existing_lore, codex_balance=None):
-    def _extract_name_candidates(stories, max_candidates=140):
-        """Heuristic list of capitalized name-like candidates from story text.
+# Name-candidate heuristics for build_lore_extraction_prompt, compiled once at import.
+_NAME_CAND_STOP_SINGLE = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "each", "for",
+    "from", "had", "has", "have", "he", "her", "hers", "him", "his", "i", "if",
+    "in", "into", "is", "it", "its", "like", "me", "my", "no", "not", "now",
+    "of", "off", "on", "one", "or", "our", "out", "she", "so", "some", "soon",
+    "than", "that", "the", "their", "then", "there", "these", "they", "this",
+    "those", "three", "to", "too", "two", "under", "up", "upon", "was", "we",
+    "were", "what", "when", "who", "why", "will", "with", "you", "your",
+    "above", "below",
+})
+# Allow multi-word titles like "High Magistrate" (don’t stopword-filter phrases).
+_NAME_CAND_BAD_SINGLE = frozenset({
+    "anything", "everything", "nothing", "someone", "something",
+    "yes", "yours", "mine", "ours", "theirs",
+})
+
+# Capitalized word / phrase matcher, with apostrophes, unicode quotes, and hyphens.
+# NOTE: avoid spanning newlines to prevent merging title + first sentence.
+# Examples: Xul'thyris, Thul-Kâr, Castle Greymarch, High Magistrate, Kael the Nameless
+_NAME_CAND_RE = re.compile(
+    r"\b[A-Z][\w’'\-]+(?:(?:(?:[ \t]+(?:of|the|and|in|on|at|to|for)[ \t]+)|[ \t]+)[A-Z][\w’'\-]+){1,4}\b"
+    r"|\b[A-Z][\w’'\-]{2,}\b"
+)
 
-        Purpose: help the model avoid missing one-off named entities (esp. places)
-        during the lore extraction pass.
-        """
-        stop_single = {
-            "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "each", "for",
-            "from", "had", "has", "have", "he", "her", "hers", "him", "his", "i", "if",
-            "in", "into", "is", "it", "its", "like", "me", "my", "no", "not", "now",
-            "of", "off", "on", "one", "or", "our", "out", "she", "so", "some", "soon",
-            "than", "that", "the", "their", "then", "there", "these", "they", "this",
-            "those", "three", "to", "too", "two", "under", "up", "upon", "was", "we",
-            "were", "what", "when", "who", "why", "will", "with", "you", "your",
-            "above", "below",
-        }
-        # Allow multi-word titles like "High Magistrate" (don’t stopword-filter phrases).
-        bad_single = {
-            "anything", "everything", "nothing", "someone", "something",
-            "yes", "yours", "mine", "ours", "theirs",
-        }
+# Catch important object phrases that often appear with a lowercase common noun
+# but should still be treated as named artifacts/relics (e.g., "the idol of Khar-Zul").
+# Keep the surface form from the story as closely as possible.
+_NAME_CAND_OBJECT_OF_RE = re.compile(
+    r"\b(?:the\s+)?(idol|crown|throne|blade|dagger|sword|sabre|saber|knife|axe|hammer|mace|spear|lance|bow|glaive|halberd|scythe|ring|tome|amulet|chalice|mask|orb|eye|eyes)\s+of\s+"
+    r"([A-Z][\w’'\-]+(?:[ \t\-]+[A-Z][\w’'\-]+){0,4})\b"
+)
 
-        # Capitalized word / phrase matcher, with apostrophes, unicode quotes, and hyphens.
-        # NOTE: avoid spanning newlines to prevent merging title + first sentence.
-        # Examples: Xul'thyris, Thul-Kâr, Castle Greymarch, High Magistrate, Kael the Nameless
-        cand_re = re.compile(
-            r"\b[A-Z][\w’'\-]+(?:(?:(?:[ \t]+(?:of|the|and|in|on|at|to|for)[ \t]+)|[ \t]+)[A-Z][\w’'\-]+){1,4}\b"
-            r"|\b[A-Z][\w’'\-]{2,}\b"
-        )
+# Catch possessive named items like "Morthaxes's gold" or "Karesh's crown".
+# This helps surface named treasures/materials that are otherwise easy to miss.
+_NAME_CAND_POSSESSIVE_ITEM_RE = re.compile(
+    r"\b([A-Z][\w’'\-]+(?:[ \t\-]+[A-Z][\w’'\-]+){0,2})['’]s\s+(gold|silver|hoard|treasure|coin|coins|crown|blade|debt|ledger)\b"
+)
+
+
+# (prompt label, lore category) in the order the extraction prompt lists known canon.
+_LORE_EXTRACTION_CANON_SECTIONS = (
+    ("Characters", "characters"),
+    ("Places", "places"),
+    ("Events", "events"),
+    ("Rituals", "rituals"),
+    ("Weapons", "weapons"),
+    ("Deities/Entities", "deities_and_entities"),
+    ("Artifacts", "artifacts"),
+    ("Factions", "factions"),
+    ("Polities (Crowns/Governments)", "polities"),
+    ("Lore & Legends", "lore"),
+    ("Flora & Fauna", "flora_fauna"),
+    ("Magic & Abilities", "magic"),
+    ("Relics & Cursed Items", "relics"),
+    ("Continents", "continents"),
+    ("Hemispheres", "hemispheres"),
+    ("Realms", "realms"),
+    ("Provinces", "provinces"),
+    ("Regions", "regions"),
+    ("Districts", "districts"),
+    ("Substances & Materials", "substances"),
+)
 
-        # Catch important object phrases that often appear with a lowercase common noun
-        # but should still be treated as named artifacts/relics (e.g., "the idol of Khar-Zul").
-        # Keep the surface form from the story as closely as possible.
-        object_of_re = re.compile(
-            r"\b(?:the\s+)?(idol|crown|throne|blade|dagger|sword|sabre|saber|knife|axe|hammer|mace|spear|lance|bow|glaive|halberd|scythe|ring|tome|amulet|chalice|mask|orb|eye|eyes)\s+of\s+"
-            r"([A-Z][\w’'\-]+(?:[ \t\-]+[A-Z][\w’'\-]+){0,4})\b"
-        )
 
-        # Catch possessive named items like "Morthaxes's gold" or "Karesh's crown".
-        # This helps surface named treasures/materials that are otherwise easy to miss.
-        possessive_item_re = re.compile(
-            r"\b([A-Z][\w’'\-]+(?:[ \t\-]+[A-Z][\w’'\-]+){0,2})['’]s\s+(gold|silver|hoard|treasure|coin|coins|crown|blade|debt|ledger)\b"
+_LORE_EXTRACTION_CANON_CATEGORIES = frozenset(cat for _, cat in _LORE_EXTRACTION_CANON_SECTIONS)
+
+# [index, per-category name counts, block] for the last LoreIndex summarized.
+_canon_block_slot: list = [None, (), ""]
+
+
+def _known_summary(items, limit=50):
+    if not items:
+        return "none"
+    if len(items) <= limit:
+        return ", ".join(items)
+    sample = ", ".join(items[:limit])
+    return f"{len(items)} known; sample: {sample}"
+
+
+def _lore_extraction_canon_block(lore_index: LoreIndex) -> str:
+    """EXISTING CANON lines for the extraction prompt; reused while the index is unchanged.
+
+    Batched extraction summarizes the same index for every batch. LoreIndex only
+    grows (via ``add``), so the per-category counts are enough to notice changes.
+    """
+    counts = tuple(len(lore_index.by_category.get(cat, ())) for _, cat in _LORE_EXTRACTION_CANON_SECTIONS)
+    if _canon_block_slot[0] is not lore_index or _canon_block_slot[1] != counts:
+        block = "\n".join(
+            f"- {label}: {_known_summary(sorted(lore_index.by_category.get(cat, ())))}"
+            for label, cat in _LORE_EXTRACTION_CANON_SECTIONS
         )
+        _canon_block_slot[:] = [lore_index, counts, block]
+    return _canon_block_slot[2]
 
-        candidates = []
-        seen = set()
+
+def _squash_blank_runs(match_text: str) -> str:
+    """Collapse space/tab runs in a name-candidate match to single spaces.
+
+    The bare-name pattern only joins words with [ \t] and never starts or ends on
+    whitespace, so most matches are already normalized and are returned as-is
+    without the split/join allocation.
+    """
+    if "\t" in match_text or "  " in match_text:
+        return " ".join(match_text.split())
+    return match_text
+
+
+def build_lore_extraction_prompt(stories, existing_lore, codex_balance=None, lore_index=None):
+    def _extract_name_candidates(stories, max_candidates=140):
+        """Heuristic list of capitalized name-like candidates from story text.
+
+        Purpose: help the model avoid missing one-off named entities (esp. places)
+        during the lore extraction pass.
+        """
+        stop_single = _NAME_CAND_STOP_SINGLE
+        bad_single = _NAME_CAND_BAD_SINGLE
+        cand_re = _NAME_CAND_RE
+        object_of_re = _NAME_CAND_OBJECT_OF_RE
+        possessive_item_re = _NAME_CAND_POSSESSIVE_ITEM_RE
+
+        # Lowercased key -> first surface form; insertion order is candidate order.
+        found = {}
+        # Raw match text already handled by a pass: a repeat always normalizes to
+        # a key that is in `found` or was filtered out, so it can be skipped before
+        # any normalizing. Names recur many times per story.
+        tried_object_of = set()
+        tried_possessive = set()
+        tried_cand = set()
         for s in stories or []:
             title = (s.get("title") or "")
             text = (s.get("text") or "")
             for chunk in [title] + (text.splitlines() if text else []):
-                if not chunk.strip():
+                if not chunk or chunk.isspace():
                     continue
 
-                for m in object_of_re.finditer(chunk):
-                    cand = (m.group(0) or "").strip()
-                    if not cand:
-                        continue
-                    if cand.lower().startswith("the "):
-                        cand = cand[4:].strip()
-                    cand_norm = " ".join(cand.split())
-                    key = cand_norm.lower()
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    candidates.append(cand_norm)
-                    if len(candidates) >= max_candidates:
-                        return candidates
-
-                for m in possessive_item_re.finditer(chunk):
-                    cand = (m.group(0) or "").strip()
-                    if not cand:
-                        continue
-                    cand_norm = " ".join(cand.split())
-                    key = cand_norm.lower()
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    candidates.append(cand_norm)
-                    if len(candidates) >= max_candidates:
-                        return candidates
+                if "of" in chunk:
+                    for m in object_of_re.finditer(chunk):
+                        raw = m.group(0)
+                        if raw in tried_object_of:
+                            continue
+                        tried_object_of.add(raw)
+                        cand = raw.strip()
+                        if not cand:
+                            continue
+                        if cand.lower().startswith("the "):
+                            cand = cand[4:].strip()
+                        cand_norm = " ".join(cand.split())
+                        key = cand_norm.lower()
+                        if key in found:
+                            continue
+                        found[key] = cand_norm
+                        if len(found) >= max_candidates:
+                            return list(found.values())
+
+                if "'" in chunk or "’" in chunk:
+                    for m in possessive_item_re.finditer(chunk):
+                        raw = m.group(0)
+                        if raw in tried_possessive:
+                            continue
+                        tried_possessive.add(raw)
+                        cand_norm = " ".join(raw.split())
+                        key = cand_norm.lower()
+                        if key in found:
+                            continue
+                        found[key] = cand_norm
+                        if len(found) >= max_candidates:
+                            return list(found.values())
 
                 for m in cand_re.finditer(chunk):
-                    cand = (m.group(0) or "").strip()
-                    if not cand:
+                    raw = m.group(0)
+                    if raw in tried_cand:
                         continue
-                    cand_norm = " ".join(cand.split())
+                    tried_cand.add(raw)
+                    cand_norm = _squash_blank_runs(raw)
                     key = cand_norm.lower()
-                    if key in seen:
+                    if key in found:
                         continue
 
                     # Filter obvious false positives for single-word candidates.
@@ -3564,47 +4358,23 @@ def build_lore_extraction_prompt(stories, existing_lore, codex_balance=None):
                         if len(cand_norm) <= 2:
                             continue
 
-                    seen.add(key)
-                    candidates.append(cand_norm)
-                    if len(candidates) >= max_candidates:
-                        return candidates
-        return candidates
-
-    existing_chars     = {c["name"].lower() for c in existing_lore.get("characters", [])}
-    existing_places    = {p["name"].lower() for p in existing_lore.get("places", [])}
-    existing_events    = {e["name"].lower() for e in existing_lore.get("events", [])}
-    existing_rituals   = {r["name"].lower() for r in existing_lore.get("rituals", []) if isinstance(r, dict) and r.get("name")}
-    existing_weapons   = {w["name"].lower() for w in existing_lore.get("weapons", [])}
-    existing_deities   = {d["name"].lower() for d in existing_lore.get("deities_and_entities", [])}
-    existing_artifacts   = {a["name"].lower() for a in existing_lore.get("artifacts",   [])}
-    existing_factions    = {f["name"].lower() for f in existing_lore.get("factions",    [])}
-    existing_polities    = {p["name"].lower() for p in existing_lore.get("polities",    [])}
-    existing_lore_items  = {l["name"].lower() for l in existing_lore.get("lore",         [])}
-    existing_flora_fauna = {x["name"].lower() for x in existing_lore.get("flora_fauna",  [])}
-    existing_magic       = {m["name"].lower() for m in existing_lore.get("magic",        [])}
-    existing_relics      = {r["name"].lower() for r in existing_lore.get("relics",       [])}
-    existing_regions     = {g["name"].lower() for g in existing_lore.get("regions",      [])}
-    existing_substances  = {s["name"].lower() for s in existing_lore.get("substances",   [])}
-
-    existing_continents   = {c["name"].lower() for c in existing_lore.get("continents",   []) if isinstance(c, dict) and c.get("name")}
-    existing_realms       = {r["name"].lower() for r in existing_lore.get("realms",       []) if isinstance(r, dict) and r.get("name")}
-    existing_provinces    = {p["name"].lower() for p in existing_lore.get("provinces",    []) if isinstance(p, dict) and p.get("name")}
-    existing_districts    = {d["name"].lower() for d in existing_lore.get("districts",    []) if isinstance(d, dict) and d.get("name")}
-    existing_hemispheres  = {h["name"].lower() for h in existing_lore.get("hemispheres",  []) if isinstance(h, dict) and h.get("name")}
-
-    def _known_summary(items, limit=50):
-        items = sorted({str(x).strip() for x in (items or set()) if str(x).strip()})
-        if not items:
-            return "none"
-        if len(items) <= limit:
-            return ", ".join(items)
-        sample = ", ".join(items[:limit])
-        return f"{len(items)} known; sample: {sample}"
-
-    stories_text = "\n\n".join(
-        f"STORY {i+1}: {s['title']}\n{s['text']}"
-        for i, s in enumerate(stories)
-    )
+                    found[key] = cand_norm
+                    if len(found) >= max_candidates:
+                        return list(found.values())
+        return list(found.values())
+
+    # Batched extraction passes one LoreIndex for all batches instead of
+    # re-normalizing every canon name per prompt.
+    if lore_index is None:
+        lore_index = LoreIndex.build(existing_lore, categories=_LORE_EXTRACTION_CANON_CATEGORIES)
+    existing_canon_block = _lore_extraction_canon_block(lore_index)
+
+    # One flat join over references to the story strings; no per-story
+    # intermediate copy of each title/text pair.
+    parts = []
+    for i, s in enumerate(stories, 1):
+        parts += ("STORY ", str(i), ": ", str(s["title"]), "\n", str(s["text"]), "\n\n")
+    stories_text = "".join(parts[:-1])
 
     name_candidates = _extract_name_candidates(stories)
     candidates_block = "\n".join([f"- {c}" for c in name_candidates]) if name_candidates else "- (none)"
@@ -3660,26 +4430,7 @@ Naming rules:
 - Keep apostrophes that are part of the canonical name itself (e.g. "Xul'thyris").
 
 EXISTING CANON (reference only; non-exhaustive; ok to repeat):
-- Characters: {_known_summary(existing_chars)}
-- Places: {_known_summary(existing_places)}
-- Events: {_known_summary(existing_events)}
-- Rituals: {_known_summary(existing_rituals)}
-- Weapons: {_known_summary(existing_weapons)}
-- Deities/Entities: {_known_summary(existing_deities)}
-- Artifacts: {_known_summary(existing_artifacts)}
-- Factions: {_known_summary(existing_factions)}
-- Polities (Crowns/Governments): {_known_summary(existing_polities)}
-- Lore & Legends: {_known_summary(existing_lore_items)}
-- Flora & Fauna: {_known_summary(existing_flora_fauna)}
-- Magic & Abilities: {_known_summary(existing_magic)}
-- Relics & Cursed Items: {_known_summary(existing_relics)}
-- Continents: {_known_summary(existing_continents)}
-- Hemispheres: {_known_summary(existing_hemispheres)}
-- Realms: {_known_summary(existing_realms)}
-- Provinces: {_known_summary(existing_provinces)}
-- Regions: {_known_summary(existing_regions)}
-- Districts: {_known_summary(existing_districts)}
-- Substances & Materials: {_known_summary(existing_substances)}
+{existing_canon_block}
 
 GEOGRAPHY CONSTRAINTS:
 - We are grounding this universe on ONE main planet/world named Edhra.
@@ -3992,28 +4743,58 @@ Respond with ONLY valid JSON in this exact structure (use empty arrays if nothin
 }}"""
 
 # ── Lore merging ────────────────────────────────────────────────────────
+# Hoisted so per-entity helpers don't depend on re's module cache, which the
+# per-name mention patterns churn through on large lore files.
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_WS_RUN_RE = re.compile(r"\s+")
+_NAME_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'\-]*")
+
+
 def _strip_trailing_parenthetical(name: str) -> str:
     if not name:
         return ""
+    return _strip_trailing_parenthetical_str(str(name))
+
+
+# Lore merging keys the same few thousand names over and over; the wrappers
+# coerce to str so these caches only ever see hashable, immutable input.
+@functools.lru_cache(maxsize=8192)
+def _strip_trailing_parenthetical_str(name: str) -> str:
     # Strip one trailing parenthetical qualifier: "Name (as Region)" -> "Name"
-    return re.sub(r"\s*\([^)]*\)\s*$", "", str(name)).strip()
+    if ")" not in name:
+        return name.strip()
+    return _TRAILING_PAREN_RE.sub("", name).strip()
 
 
 def _norm_entity_key(name: str) -> str:
     if not name:
         return ""
-    s = str(name).strip().replace("’", "'")
-    s = _strip_trailing_parenthetical(s)
-    s = re.sub(r"\s+", " ", s)
-    return s.casefold()
+    return _norm_entity_key_str(str(name))
+
 
+@functools.lru_cache(maxsize=8192)
+def _norm_entity_key_str(name: str) -> str:
+    s = _strip_trailing_parenthetical_str(name.replace("’", "'"))
+    # s is already stripped, so split/join collapses inner runs exactly like
+    # _WS_RUN_RE.sub(" ", s) (both use str.isspace's idea of whitespace).
+    s = " ".join(s.split())
+    # casefold only differs from lower outside ASCII (e.g. "ß" -> "ss").
+    return s.lower() if s.isascii() else s.casefold()
 
-def _character_alias_keys(name: str) -> set:
+
+def _character_alias_keys(name: str) -> frozenset:
     """Return a set of safe alias keys derived from a canonical character name."""
+    if not name:
+        return frozenset()
+    return _character_alias_keys_str(str(name))
+
+
+@functools.lru_cache(maxsize=8192)
+def _character_alias_keys_str(name: str) -> frozenset:
     key = _norm_entity_key(name)
-    out = set([key]) if key else set()
     if not key:
-        return out
+        return frozenset()
+    out = {key}
 
     if key.startswith("the "):
         out.add(key[4:].strip())
@@ -4029,7 +4810,7 @@ def _character_alias_keys(name: str) -> set:
     base = _norm_entity_key(_strip_trailing_parenthetical(name))
     if base and base != key:
         out.add(base)
-    return {x for x in out if x and len(x) >= 2}
+    return frozenset(x for x in out if x and len(x) >= 2)
 
 
 def _is_descriptor_placeholder_character_name(name: str) -> bool:
@@ -4037,7 +4818,7 @@ def _is_descriptor_placeholder_character_name(name: str) -> bool:
     raw = str(name or "").strip()
     if not raw:
         return False
-    tokens = re.findall(r"[A-Za-z][A-Za-z'\-]*", raw.replace("’", "'"))
+    tokens = _NAME_WORD_RE.findall(raw.replace("’", "'"))
     if not tokens:
         return False
 
@@ -4067,7 +4848,7 @@ def _looks_like_specific_character_name(name: str) -> bool:
         return False
     if _is_descriptor_placeholder_character_name(raw):
         return False
-    tokens = re.findall(r"[A-Za-z][A-Za-z'\-]*", raw.replace("’", "'"))
+    tokens = _NAME_WORD_RE.findall(raw.replace("’", "'"))
     if not tokens:
         return False
     first = tokens[0]
@@ -4078,11 +4859,11 @@ def _should_skip_character_auto_add(lore: dict, name: str, descriptor: str) -> b
     """Reject abstract/event-like concepts being auto-promoted into characters."""
     descriptor_tokens = {
         token.casefold()
-        for token in re.findall(r"[A-Za-z][A-Za-z'\-]*", str(descriptor or "").replace("’", "'"))
+        for token in _NAME_WORD_RE.findall(str(descriptor or "").replace("’", "'"))
     }
     name_tokens = {
         token.casefold()
-        for token in re.findall(r"[A-Za-z][A-Za-z'\-]*", str(name or "").replace("’", "'"))
+        for token in _NAME_WORD_RE.findall(str(name or "").replace("’", "'"))
     }
     concept_tokens = descriptor_tokens | name_tokens
     abstract_terms = {
@@ -4138,43 +4919,120 @@ def _should_promote_character_name(existing_name: str, incoming_name: str) -> bo
     return False
 
 
-def _resolve_character_target(existing_chars: list, incoming_name: str):
-    """Resolve an incoming character name to an existing canonical entry when safe.
+class _CharacterIndex:
+    """Name/alias lookups over a canonical characters list for merge_lore.
 
-    Prefers matching by exact name, explicit aliases, or epithet/"the" reduction.
-    Also supports safe single-token->full-name mapping when unambiguous.
+    Each key maps to ``{position: entry}`` so lookups can still prefer the
+    earliest entry in list order. Call :meth:`add` after appending an entry,
+    :meth:`alias` after appending one alias to it, and :meth:`update` after any
+    other merge into it; updates that left the name and aliases alone (the
+    usual repeat appearance) are a no-op.
+
+    Entries without a name are skipped, unless ``nameless_aliases`` is set, in
+    which case their explicit aliases still go into ``by_alias``.
     """
-    inc_key = _norm_entity_key(incoming_name)
-    if not inc_key:
-        return None
 
-    by_key = {}
-    alias_hits = []
-    for c in existing_chars or []:
-        if not isinstance(c, dict):
-            continue
-        nm = (c.get("name") or "").strip()
-        if not nm:
-            continue
-        if _norm_entity_key(nm) == inc_key:
-            return c
-        for k in _character_alias_keys(nm):
-            by_key.setdefault(k, c)
+    def __init__(self, chars: list, nameless_aliases: bool = False):
+        self._nameless_aliases = nameless_aliases
+        self._pos = {}        # id(entry) -> list position
+        self._keys_of = {}    # id(entry) -> (name_key, alias_keys, all_keys)
+        self._source_of = {}  # id(entry) -> (name, aliases) the keys came from
+        self.by_name = {}     # exact canonical-name key
+        self.by_alias = {}    # explicit alias key
+        self.by_key = {}      # name-derived alias keys + explicit aliases
+        for c in chars or []:
+            self.add(c)
+
+    def add(self, c) -> None:
+        if not isinstance(c, dict) or id(c) in self._pos:
+            return
+        self._pos[id(c)] = len(self._pos)
+        self._index(c)
+
+    def update(self, c) -> None:
+        if not isinstance(c, dict) or id(c) not in self._pos:
+            self.add(c)
+            return
+        if self._source_of.get(id(c)) == self._source(c):
+            return
+        pos = self._pos[id(c)]
+        name_key, alias_keys, all_keys = self._keys_of.pop(id(c), ("", (), ()))
+        for table, keys in ((self.by_name, (name_key,)), (self.by_alias, alias_keys), (self.by_key, all_keys)):
+            for k in keys:
+                hits = table.get(k)
+                if hits:
+                    hits.pop(pos, None)
+                    if not hits:
+                        del table[k]
+        self._index(c)
+
+    def alias(self, c, alias) -> None:
+        """Index one alias just appended to ``c["aliases"]``, leaving other keys as-is."""
+        source = self._source_of.get(id(c))
+        if id(c) not in self._keys_of or source is None or source[0] != c.get("name"):
+            self.update(c)
+            return
+        ak = _norm_entity_key(alias)
+        if ak:
+            pos = self._pos[id(c)]
+            name_key, alias_keys, all_keys = self._keys_of[id(c)]
+            alias_keys.add(ak)
+            self._keys_of[id(c)] = (name_key, alias_keys, all_keys | {ak})
+            self.by_alias.setdefault(ak, {})[pos] = c
+            self.by_key.setdefault(ak, {})[pos] = c
+        self._source_of[id(c)] = self._source(c)
+
+    @staticmethod
+    def _source(c: dict) -> tuple:
+        aliases = c.get("aliases")
+        return (c.get("name"), tuple(aliases) if isinstance(aliases, list) else None)
 
+    def _index(self, c: dict) -> None:
+        self._source_of[id(c)] = self._source(c)
+        nm = (c.get("name") or "").strip()
+        if not nm and not self._nameless_aliases:
+            return
+        pos = self._pos[id(c)]
+        name_key = _norm_entity_key(nm)
+        alias_keys = set()
         aliases = c.get("aliases")
         if isinstance(aliases, list):
             for a in aliases:
                 ak = _norm_entity_key(a)
                 if ak:
-                    by_key.setdefault(ak, c)
-                    if ak == inc_key:
-                        alias_hits.append(c)
+                    alias_keys.add(ak)
+        all_keys = _character_alias_keys(nm) | alias_keys if nm else frozenset()
+        self._keys_of[id(c)] = (name_key, alias_keys, all_keys)
+        if name_key:
+            self.by_name.setdefault(name_key, {})[pos] = c
+        for k in alias_keys:
+            self.by_alias.setdefault(k, {})[pos] = c
+        for k in all_keys:
+            self.by_key.setdefault(k, {})[pos] = c
+
+
+def _resolve_character_target(index: _CharacterIndex, incoming_name: str):
+    """Resolve an incoming character name to an existing canonical entry when safe.
+
+    Prefers matching by exact name, explicit aliases, or epithet/"the" reduction.
+    Also supports safe single-token->full-name mapping when unambiguous.
+    """
+    inc_key = _norm_entity_key(incoming_name)
+    if not inc_key:
+        return None
 
-    if len({id(x) for x in alias_hits}) == 1 and alias_hits:
-        return alias_hits[0]
+    hits = index.by_name.get(inc_key)
+    if hits:
+        return hits[min(hits)]
 
-    if inc_key in by_key:
-        return by_key[inc_key]
+    # An explicit alias only wins outright when exactly one character claims it.
+    hits = index.by_alias.get(inc_key)
+    if hits and len(hits) == 1:
+        return hits[min(hits)]
+
+    hits = index.by_key.get(inc_key)
+    if hits:
+        return hits[min(hits)]
 
     return None
 
@@ -4216,6 +5074,19 @@ def _first_token_collision_candidates(lore: dict) -> dict:
     return out
 
 
+_ALNUM_RUN_RE = re.compile(r"[a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _bare_token_re(tok: str) -> re.Pattern:
+    """Whole-token matcher over normalized text; one compiled pattern per canon token.
+
+    Built per call, these patterns (one per unique first name) overflowed re's
+    internal cache and were recompiled for every story.
+    """
+    return re.compile(r"(?<![a-z0-9])" + re.escape(tok) + r"(?![a-z0-9])")
+
+
 def _find_first_token_character_collisions(stories: list, lore: dict, allowed_names_lower: set) -> list:
     """Detect unique canon first-name tokens used without the full canonical name.
 
@@ -4231,6 +5102,29 @@ def _find_first_token_character_collisions(stories: list, lore: dict, allowed_na
     if not tok_to_char:
         return []
 
+    # Everything except the story text is fixed per token, so settle it once:
+    # tokens whose canonical character is an allowed reuse never collide.
+    checks = []
+    for tok, canon in tok_to_char.items():
+        canon_name = str((canon or {}).get("name") or "").strip()
+        if canon_name and canon_name.lower() in allowed:
+            continue
+        display_tok = (canon_name.split()[0] if canon_name and canon_name.split() else tok)
+        aliases = (canon or {}).get("aliases")
+        alias_names = [a for a in (str(a or "").strip() for a in aliases) if a] if isinstance(aliases, list) else []
+        checks.append((tok, canon_name, display_tok, alias_names))
+
+    # A plain [a-z0-9]+ token matches _bare_token_re exactly when it is one of
+    # the text's maximal alphanumeric runs, so those checks are found through
+    # one word set per story; tokens with punctuation keep the substring scan.
+    check_by_word = {}
+    punct_checks = []
+    for i, check in enumerate(checks):
+        if _ALNUM_RUN_RE.fullmatch(check[0]):
+            check_by_word[check[0]] = i
+        else:
+            punct_checks.append(i)
+
     collisions = []
     for s in stories:
         if not isinstance(s, dict):
@@ -4240,19 +5134,17 @@ def _find_first_token_character_collisions(stories: list, lore: dict, allowed_na
             continue
         blob_norm = _norm_text_for_matching(blob)
 
-        for tok, canon in tok_to_char.items():
-            canon_name = str((canon or {}).get("name") or "").strip()
-            display_tok = (canon_name.split()[0] if canon_name and canon_name.split() else tok)
-            if canon_name and canon_name.casefold() in allowed:
+        hits = [check_by_word[w] for w in set(_ALNUM_RUN_RE.findall(blob_norm)) if w in check_by_word]
+        hits.extend(i for i in punct_checks if checks[i][0] in blob_norm)
+        hits.sort()
+        for i in hits:
+            tok, canon_name, display_tok, alias_names = checks[i]
+            if canon_name and _name_mentioned_in_normalized(canon_name, blob_norm):
                 continue
-            if canon_name and entity_name_mentioned_in_text(canon_name, blob):
+            if any(_name_mentioned_in_normalized(a, blob_norm) for a in alias_names):
                 continue
-            aliases = (canon or {}).get("aliases")
-            if isinstance(aliases, list):
-                if any(entity_name_mentioned_in_text(str(a or "").strip(), blob) for a in aliases if str(a or "").strip()):
-                    continue
 
-            if re.search(r"(?<![a-z0-9])" + re.escape(tok) + r"(?![a-z0-9])", blob_norm):
+            if _bare_token_re(tok).search(blob_norm):
                 collisions.append({
                     "name": display_tok,
                     "canon": canon_name,
@@ -4413,6 +5305,28 @@ def sync_cross_category_appearances(codex: dict) -> int:
     return updated_count
 
 
+def _new_story_appearances(prior: list, today: list) -> list:
+    """Entries of ``today`` whose (date, title) isn't already in ``prior``."""
+    if not today:
+        return []
+    seen = {(p.get("date"), p.get("title")) for p in prior}
+    return [a for a in today if (a["date"], a["title"]) not in seen]
+
+
+def _bump_appearances(entry: dict, n: int = 1) -> None:
+    """Add ``n`` to an entry's appearance count; a missing count means one so far."""
+    entry["appearances"] = entry.get("appearances", 1) + n
+
+
+def _append_story_appearances(entry: dict, today: list) -> None:
+    """Record today's not-yet-seen appearances on ``entry`` and bump its count."""
+    prior = entry.get("story_appearances", [])
+    new_ones = _new_story_appearances(prior, today)
+    if new_ones:
+        _bump_appearances(entry, len(new_ones))
+        entry["story_appearances"] = prior + new_ones
+
+
 def merge_lore(existing_lore, new_lore, date_key):
     """Merge newly extracted lore into the existing lore, skipping duplicates by name."""
     for category in [
@@ -4442,6 +5356,7 @@ def merge_lore(existing_lore, new_lore, date_key):
             if not isinstance(existing_list, list):
                 existing_list = []
                 existing_lore["characters"] = existing_list
+            char_index = _CharacterIndex(existing_list)
 
             for item in new_lore.get("characters", []) or []:
                 if not isinstance(item, dict):
@@ -4450,7 +5365,7 @@ def merge_lore(existing_lore, new_lore, date_key):
                 if not incoming_name:
                     continue
 
-                target = _resolve_character_target(existing_list, incoming_name)
+                target = _resolve_character_target(char_index, incoming_name)
                 if target is None:
                     # Tag with first appearance date
                     item["first_date"] = date_key
@@ -4459,10 +5374,11 @@ def merge_lore(existing_lore, new_lore, date_key):
                     if "aliases" in item and not isinstance(item.get("aliases"), list):
                         item["aliases"] = []
                     existing_list.append(item)
+                    char_index.add(item)
                     continue
 
                 # Merge into existing canonical character.
-                target["appearances"] = target.get("appearances", 1) + 1
+                _bump_appearances(target)
 
                 # Prefer the more complete name as canonical.
                 existing_name = (target.get("name") or "").strip()
@@ -4485,9 +5401,12 @@ def merge_lore(existing_lore, new_lore, date_key):
                         aliases = target.get("aliases")
                         if not isinstance(aliases, list):
                             aliases = []
-                        if incoming_name != target.get("name") and incoming_name not in aliases:
+                        appended = incoming_name != target.get("name") and incoming_name not in aliases
+                        if appended:
                             aliases.append(incoming_name)
                         target["aliases"] = aliases
+                        if appended:
+                            char_index.alias(target, incoming_name)
 
                 # Fill any missing fields without overwriting established canon.
                 for k, v in item.items():
@@ -4505,28 +5424,32 @@ def merge_lore(existing_lore, new_lore, date_key):
                         or existing_v == {}
                     ):
                         target[k] = v
+                char_index.update(target)
         else:
-            existing_names = {
-                item["name"].lower() for item in existing_lore.get(category, [])
-            }
+            # First entry wins for duplicate names, as the old linear scan did.
+            existing_by_name = {}
+            for existing_item in existing_lore.get(category, []):
+                existing_by_name.setdefault(existing_item["name"].lower(), existing_item)
             for item in new_lore.get(category, []):
-                if item.get("name", "").lower() not in existing_names:
+                name_low = item.get("name", "").lower()
+                existing_item = existing_by_name.get(name_low)
+                if existing_item is None:
                     # Tag with first appearance date
                     item["first_date"] = date_key
                     item["appearances"] = 1
                     existing_lore.setdefault(category, []).append(item)
-                    existing_names.add(item["name"].lower())
+                    existing_by_name[item["name"].lower()] = item
                 else:
                     # Increment appearance count for existing entries
-                    for existing_item in existing_lore.get(category, []):
-                        if existing_item["name"].lower() == item["name"].lower():
-                            existing_item["appearances"] = existing_item.get("appearances", 1) + 1
-                            break
+                    _bump_appearances(existing_item)
     ensure_place_parent_chain(existing_lore)
     enforce_continent_limit(existing_lore)
     return existing_lore
 
 
+_POLITY_CONFLICT_STATUS_WORDS = ("contested", "disputed", "usurped", "civil war", "succession")
+
+
 def warn_polity_conflicts(lore: dict):
     """Print warnings for potentially contradictory crown/sovereignty claims.
 
@@ -4543,11 +5466,8 @@ def warn_polity_conflicts(lore: dict):
         return (v or "").strip()
 
     def _is_unknown(v: str) -> bool:
-        return not _clean(v) or _clean(v).lower() in {"unknown", "n/a", "na", "none"}
-
-    def _status_allows_conflict(status: str) -> bool:
-        s = (_clean(status)).lower()
-        return any(w in s for w in ("contested", "disputed", "usurped", "civil war", "succession"))
+        # Callers pass already-stripped values.
+        return v.lower() in _UNKNOWN_VALUES
 
     def _sovereign_list(p: dict):
         raw = p.get("sovereigns")
@@ -4559,35 +5479,33 @@ def warn_polity_conflicts(lore: dict):
             return [x] if x and not _is_unknown(x) else []
         return []
 
-    buckets = {}  # key -> list of (name, sovereigns, status)
+    buckets = {}  # key -> list of (name, sovereigns, status_allows_conflict)
     for p in polities:
         if not isinstance(p, dict):
             continue
         name = _clean(p.get("name") or "")
         if not name:
             continue
-        realm = _clean(p.get("realm") or "")
-        region = _clean(p.get("region") or "")
-        seat = _clean(p.get("seat") or "")
-        key = None
-        if not _is_unknown(realm):
-            key = f"realm:{realm.lower()}"
-        elif not _is_unknown(region):
-            key = f"region:{region.lower()}"
-        elif not _is_unknown(seat):
-            key = f"seat:{seat.lower()}"
+        # Realm, then region, then seat: only read as far as the first known one.
+        for field_name in ("realm", "region", "seat"):
+            value_low = _clean(p.get(field_name) or "").lower()
+            if value_low not in _UNKNOWN_VALUES:
+                key = f"{field_name}:{value_low}"
+                break
         else:
             continue
 
         sovs = _sovereign_list(p)
         if not sovs:
             continue
-        buckets.setdefault(key, []).append((name, sovs, _clean(p.get("status") or "")))
+        status = _clean(p.get("status") or "").lower()
+        allows_conflict = any(w in status for w in _POLITY_CONFLICT_STATUS_WORDS)
+        buckets.setdefault(key, []).append((name, sovs, allows_conflict))
 
     for key, items in buckets.items():
         if len(items) < 2:
             continue
-        if any(_status_allows_conflict(status) for _, _, status in items):
+        if any(allows_conflict for _, _, allows_conflict in items):
             continue
 
         all_names = sorted({n for _, sovs, _ in items for n in sovs})
@@ -4606,17 +5524,28 @@ def warn_polity_conflicts(lore: dict):
         )
 
 
-def _count_story_mentions(stories, name: str) -> int:
-    if not stories or not name:
+def _story_mention_blobs(stories) -> list:
+    """Lowercased ``title + " " + text`` per story, for _count_story_mentions."""
+    return [(s.get("title", "") + " " + s.get("text", "")).lower() for s in stories or []]
+
+
+def _count_story_mentions(story_blobs: list, name: str, mention_index: dict | None = None) -> int:
+    """Number of stories mentioning ``name``'s signature key.
+
+    ``mention_index`` is an optional precomputed _phrase_mentions_by_blob result
+    over the same blobs; keys missing from it are scanned directly.
+    """
+    if not story_blobs or not name:
         return 0
     key = _signature_key_for_name(name)
     if not key or len(key) < 4:
         return 0
-    return sum(
-        1
-        for s in stories
-        if key in ((s.get("title", "") + " " + s.get("text", "")).lower())
-    )
+    if mention_index is not None and key in mention_index:
+        return len(mention_index[key])
+    # Same boundary rule as the codex mention scan, so "crow" doesn't count
+    # a story that only mentions a "crown".
+    pat = re.compile(r"(?<![a-z0-9])" + re.escape(key) + r"(?![a-z0-9])")
+    return sum(1 for blob in story_blobs if key in blob and pat.search(blob))
 
 
 def build_existing_character_updates_prompt(stories, lore, referenced_characters):
@@ -4625,11 +5554,9 @@ def build_existing_character_updates_prompt(stories, lore, referenced_characters
     Important: treat canon as current truth. If a story is clearly a prequel/flashback,
     do NOT change the current status — only add a note.
     """
-    stories_payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    stories_payload = _json_dumps(stories, indent=True)
 
-    canon_chars = []
-    for c in referenced_characters or []:
-        canon_chars.append(json.dumps(c, ensure_ascii=False, sort_keys=True))
+    canon_chars = [_json_dumps(c, sort_keys=True) for c in referenced_characters or []]
 
     world_rules = []
     if lore.get("worlds") and lore["worlds"][0].get("rules"):
@@ -4702,6 +5629,16 @@ def apply_existing_character_updates(lore, updates, date_key, stories=None):
 
     chars = lore.get("characters", []) or []
     idx = { (c.get("name") or "").strip().lower(): c for c in chars if c.get("name") }
+    story_blobs = _story_mention_blobs(stories)
+    # Find every updated character's signature key in one pass per story.
+    mention_index = _phrase_mentions_by_blob(
+        (
+            _signature_key_for_name((up.get("name") or "").strip())
+            for up in updates.get("characters", []) or []
+            if isinstance(up, dict)
+        ),
+        story_blobs,
+    ) if story_blobs else None
 
     for up in updates.get("characters", []) or []:
         name = (up.get("name") or "").strip()
@@ -4718,7 +5655,7 @@ def apply_existing_character_updates(lore, updates, date_key, stories=None):
         event = up.get("event") if isinstance(up.get("event"), dict) else {}
 
         # Always increment appearances if the character is referenced today.
-        mention_count = _count_story_mentions(stories or [], name)
+        mention_count = _count_story_mentions(story_blobs, name, mention_index)
         if mention_count:
             try:
                 current["appearances"] = int(current.get("appearances", 0) or 0) + int(mention_count)
@@ -4778,6 +5715,103 @@ def apply_existing_character_updates(lore, updates, date_key, stories=None):
     return lore
 
 # ── Codex file update ────────────────────────────────────────────────────
+# Simple codex item categories merged by update_codex_file, as
+# (fields refreshed on existing entries, fields copied onto new entries).
+# Both are (key, default) pairs in output order; new entries are laid out as
+# name, tagline, <new fields>, then the first_story/appearance bookkeeping.
+_CODEX_SIMPLE_CATEGORIES = {
+    "weapons": (
+        [("powers", ""), ("last_known_holder", ""), ("status", "unknown")],
+        [("weapon_type", ""), ("origin", ""), ("powers", ""), ("last_known_holder", ""), ("status", "unknown")],
+    ),
+    "artifacts": (
+        [("powers", ""), ("last_known_holder", ""), ("status", "unknown")],
+        [("artifact_type", ""), ("origin", ""), ("powers", ""), ("last_known_holder", ""), ("status", "unknown")],
+    ),
+    "factions": (
+        [("goals", ""), ("leader", ""), ("status", "unknown")],
+        [("alignment", ""), ("goals", ""), ("leader", ""), ("status", "unknown")],
+    ),
+    "lore": (
+        [("source", ""), ("status", "unknown")],
+        [("category", ""), ("source", ""), ("status", "unknown")],
+    ),
+    "flora_fauna": (
+        [("habitat", ""), ("rarity", ""), ("status", "unknown")],
+        [("type", ""), ("rarity", ""), ("habitat", ""), ("status", "unknown")],
+    ),
+    "magic": (
+        [("element", ""), ("difficulty", ""), ("status", "unknown")],
+        [("type", ""), ("element", ""), ("difficulty", ""), ("status", "unknown")],
+    ),
+    "regions": (
+        [
+            ("continent", "unknown"), ("realm", "unknown"), ("ruler", ""), ("climate", ""),
+            ("terrain", ""), ("function", ""), ("status", "unknown"), ("notes", ""),
+        ],
+        [
+            ("continent", "unknown"), ("realm", "unknown"), ("climate", ""), ("terrain", ""),
+            ("ruler", ""), ("function", ""), ("status", "unknown"), ("notes", ""),
+        ],
+    ),
+    "substances": (
+        [("properties", ""), ("use", ""), ("status", "unknown")],
+        [("type", ""), ("rarity", ""), ("properties", ""), ("use", ""), ("status", "unknown")],
+    ),
+}
+
+
+# Object categories that skip lore entries named after a codex character, as
+# relics do: a person extracted as a weapon or artifact is extraction drift.
+_CODEX_CHARACTER_GUARDED_CATEGORIES = frozenset({"weapons", "artifacts"})
+
+
+def _norm_mention_blob(s: str) -> str:
+    """Lowercase text for codex mention matching, folding curly quotes and NB hyphens."""
+    return (
+        str(s or "")
+        .replace("\u2019", "'")
+        .replace("\u2018", "'")
+        .replace("\u2011", "-")
+        .lower()
+    )
+
+
+_MENTION_BOUNDARY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _phrase_mentions_by_blob(phrases, blobs: list) -> dict | None:
+    """Map each phrase to the indexes of the blobs that mention it.
+
+    A mention must not be flanked by [a-z0-9], matching the per-phrase boundary
+    regexes it replaces. Returns None when pyahocorasick is missing.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    hits = {}
+    for phrase in phrases:
+        if phrase and phrase not in hits:
+            automaton.add_word(phrase, phrase)
+            hits[phrase] = []
+    if not hits:
+        return hits
+    automaton.make_automaton()
+    for i, blob in enumerate(blobs):
+        found = set()
+        for end, phrase in automaton.iter(blob):
+            if phrase in found:
+                continue
+            start = end - len(phrase) + 1
+            if start > 0 and blob[start - 1] in _MENTION_BOUNDARY_CHARS:
+                continue
+            if end + 1 < len(blob) and blob[end + 1] in _MENTION_BOUNDARY_CHARS:
+                continue
+            found.add(phrase)
+            hits[phrase].append(i)
+    return hits
+
+
 def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: bool = False):
     """Merge today's lore into codex.json, covering all entity types with story appearances."""
     stories = stories or []
@@ -4808,8 +5842,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
     }
     if os.path.exists(CODEX_FILE):
         try:
-            with open(CODEX_FILE, "r", encoding="utf-8") as f:
-                codex = json.load(f)
+            codex = _read_json_file(CODEX_FILE)
             if isinstance(codex, dict):
                 codex.pop("subcontinents", None)
                 codex.setdefault("deities_and_entities", [])
@@ -4817,6 +5850,26 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
             pass
 
     # ── Helper: find stories that mention an entity by name ─────────────
+    # Normalize each story once; stories_for runs for every lore entity.
+    story_blobs = [
+        (s, _norm_mention_blob((s.get("text", "") or "") + " " + (s.get("title", "") or "")))
+        for s in stories
+        if isinstance(s, dict)
+    ]
+
+    # One automaton pass per story finds every lore name at once; names that
+    # aren't in lore (or a missing pyahocorasick) use the per-entity regex.
+    mention_index = _phrase_mentions_by_blob(
+        (
+            _norm_mention_blob(_strip_trailing_parenthetical(str(item.get("name") or "").strip()))
+            for items in lore.values()
+            if isinstance(items, list)
+            for item in items
+            if isinstance(item, dict)
+        ),
+        [blob for _, blob in story_blobs],
+    )
+
     def stories_for(name):
         # In single-story audit mode, everything extracted is from that story.
         if assume_all_from_stories and len(stories) == 1:
@@ -4824,41 +5877,29 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
             if only_title:
                 return [{"date": date_key, "title": only_title}]
 
-        def _norm_blob(s: str) -> str:
-            return (
-                str(s or "")
-                .replace("\u2019", "'")
-                .replace("\u2018", "'")
-                .replace("\u2011", "-")
-                .lower()
-            )
-
-        text_blobs = [
-            _norm_blob((s.get("text", "") or "") + " " + (s.get("title", "") or ""))
-            for s in stories
-            if isinstance(s, dict)
-        ]
-
         # Mention detection: strict surface-form phrase match with boundaries.
         # This avoids substring false positives like "crow" matching "crown".
         raw_name = _strip_trailing_parenthetical(str(name or "").strip())
+        if not raw_name:
+            return []
+        key = _norm_mention_blob(raw_name)
+        if mention_index is not None and key in mention_index:
+            return [
+                {"date": date_key, "title": story_blobs[i][0].get("title", "")}
+                for i in mention_index[key]
+            ]
+        # Most entities appear in no story at all; a plain substring test rules
+        # those out before any boundary regex is compiled or run.
+        candidates = [(s, blob) for s, blob in story_blobs if key in blob]
+        if not candidates:
+            return []
+        pat = re.compile(r"(?<![a-z0-9])" + re.escape(key) + r"(?![a-z0-9])")
 
-        def _phrase_in_blob(phrase: str, blob: str) -> bool:
-            phrase = (phrase or "").strip()
-            if not phrase:
-                return False
-            return bool(re.search(r"(?<![a-z0-9])" + re.escape(_norm_blob(phrase)) + r"(?![a-z0-9])", blob))
-
-        def _mentions(blob: str) -> bool:
-            if not blob:
-                return False
-            return _phrase_in_blob(raw_name, blob)
-
-        hits = []
-        for s, blob in zip([s for s in stories if isinstance(s, dict)], text_blobs):
-            if _mentions(blob):
-                hits.append({"date": date_key, "title": s.get("title", "")})
-        return hits
+        return [
+            {"date": date_key, "title": s.get("title", "")}
+            for s, blob in candidates
+            if pat.search(blob)
+        ]
 
     # ── Helper: resolve world name from lore worlds list ─────────────────
     def resolve_world(raw_world):
@@ -4887,13 +5928,13 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
                 continue
             name_low = name.lower()
             today_apps = stories_for(name)
-            if name_low in existing:
-                ex = existing[name_low]
+            ex = existing.get(name_low)
+            if ex is not None:
                 for k in field_keys:
                     if k in item and _should_overwrite(item.get(k)):
                         ex[k] = item.get(k)
                 prior = ex.get("story_appearances", [])
-                new_ones = [a for a in today_apps if not any(p["date"] == a["date"] and p["title"] == a["title"] for p in prior)]
+                new_ones = _new_story_appearances(prior, today_apps)
                 if new_ones:
                     ex["story_appearances"] = prior + new_ones
                 # Keep appearances aligned with unique story_appearances when present.
@@ -4949,38 +5990,34 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
         if not key:
             return None
 
-        exact_alias_hits = []
-        for obj in existing_chars_list:
-            if not isinstance(obj, dict):
-                continue
-            nm = (obj.get("name") or "").strip()
-            if nm and _norm_entity_key(nm) == key:
-                return obj
-            aliases = obj.get("aliases")
-            if isinstance(aliases, list):
-                for alias in aliases:
-                    if _norm_entity_key(alias) == key:
-                        exact_alias_hits.append(obj)
-                        break
-        if len({id(x) for x in exact_alias_hits}) == 1 and exact_alias_hits:
-            return exact_alias_hits[0]
-
-        if key in existing_map:
-            return existing_map[key]
+        # Live name/alias lookups: an exact canonical name wins (earliest row
+        # first), then an alias claimed by exactly one row.
+        hits = chars_index.by_name.get(key)
+        if hits:
+            return hits[min(hits)]
+        hits = chars_index.by_alias.get(key)
+        if hits and len(hits) == 1:
+            return hits[min(hits)]
+
+        hit = existing_map.get(key)
+        if hit is not None:
+            return hit
         # Try explicit aliases provided by lore.
         if isinstance(incoming_aliases, list):
             for a in incoming_aliases:
                 if _is_descriptor_placeholder_character_name(a):
                     continue
                 ak = _norm_entity_key(a)
-                if ak and ak in existing_map:
-                    return existing_map[ak]
+                hit = existing_map.get(ak) if ak else None
+                if hit is not None:
+                    return hit
         # Try epithetless alias ("X the Y" -> "X").
         the_idx = key.find(" the ")
         if the_idx > 2:
             base = key[:the_idx].strip()
-            if base in existing_map:
-                return existing_map[base]
+            hit = existing_map.get(base)
+            if hit is not None:
+                return hit
         return None
 
     # ── Merge characters ─────────────────────────────────────────────────
@@ -5003,6 +6040,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
                 ak = _norm_entity_key(a)
                 if ak:
                     existing_chars.setdefault(ak, obj)
+    chars_index = _CharacterIndex(existing_chars_list, nameless_aliases=True)
 
     for c in lore.get("characters", []):
         name = (c.get("name") or "Unknown").strip()
@@ -5014,16 +6052,13 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
         if ex is not None:
             ex["role"]   = c.get("role",   ex.get("role",   "Unknown"))
             ex["status"] = c.get("status", ex.get("status", "Unknown"))
-            if c.get("travel_scope"):
-                ex["travel_scope"] = c.get("travel_scope", ex.get("travel_scope", "unknown"))
-            if c.get("home_place"):
-                ex["home_place"] = c.get("home_place", ex.get("home_place", ""))
-            if c.get("home_region"):
-                ex["home_region"] = c.get("home_region", ex.get("home_region", ""))
-            if c.get("home_realm"):
-                ex["home_realm"] = c.get("home_realm", ex.get("home_realm", ""))
-            if isinstance(c.get("status_history"), list):
-                ex["status_history"] = c.get("status_history", ex.get("status_history", []))
+            for field in ("travel_scope", "home_place", "home_region", "home_realm"):
+                val = c.get(field)
+                if val:
+                    ex[field] = val
+            status_history = c.get("status_history")
+            if isinstance(status_history, list):
+                ex["status_history"] = status_history
             ex["world"]  = world
             ex["bio"]    = c.get("bio",    ex.get("bio",    ""))
             ex["traits"] = c.get("traits", ex.get("traits", []))
@@ -5042,10 +6077,10 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
                     ex["name"] = name
                 else:
                     _merge_aliases(ex, [name])
+            chars_index.update(ex)
 
             prior = ex.get("story_appearances", [])
-            new_ones = [a for a in today_appearances
-                        if not any(p["date"] == a["date"] and p["title"] == a["title"] for p in prior)]
+            new_ones = _new_story_appearances(prior, today_appearances)
             if new_ones:
                 ex["story_appearances"] = prior + new_ones
             apps = ex.get("story_appearances", [])
@@ -5079,6 +6114,8 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
 
             _ensure_alias_list(new_obj)
             codex.setdefault("characters", []).append(new_obj)
+            if codex["characters"] is existing_chars_list:
+                chars_index.add(new_obj)
             # Update index maps for subsequent merges in this run.
             for k in _character_alias_keys(new_obj.get("name")):
                 existing_chars.setdefault(k, new_obj)
@@ -5224,7 +6261,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
     non_character_keys = _non_character_name_keys(lore) | _non_character_name_keys(codex)
     deduped_chars = []
     by_name_key = {}
-    for obj in codex.get("characters", []) or []:
+    for obj in codex.get("characters") or []:
         if not isinstance(obj, dict):
             continue
         nm = str(obj.get("name") or "").strip()
@@ -5234,7 +6271,9 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
         if not nm_key:
             continue
 
-        if _is_abstract_character_concept(nm, str(obj.get("role") or ""), str(obj.get("bio") or "")) and nm_key in non_character_keys:
+        # Set lookup first: only names shared with a non-character entity need
+        # the (bio-length) abstract-concept text scan.
+        if nm_key in non_character_keys and _is_abstract_character_concept(nm, str(obj.get("role") or ""), str(obj.get("bio") or "")):
             continue
 
         existing = by_name_key.get(nm_key)
@@ -5268,8 +6307,8 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
         name = p.get("name", "Unknown")
         name_low = name.lower()
         today_appearances = stories_for(name)
-        if name_low in existing_places:
-            ex = existing_places[name_low]
+        ex = existing_places.get(name_low)
+        if ex is not None:
             incoming_parent_place = str(p.get("parent_place") or "").strip()
             if _truthy_non_unknown(incoming_parent_place):
                 ex["parent_place"] = incoming_parent_place
@@ -5291,12 +6330,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
                 ex["place_type"] = p["place_type"]
             if p.get("atmosphere") and not ex.get("atmosphere"):
                 ex["atmosphere"] = p["atmosphere"]
-            prior = ex.get("story_appearances", [])
-            new_ones = [a for a in today_appearances
-                        if not any(p2["date"] == a["date"] and p2["title"] == a["title"] for p2 in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
+            _append_story_appearances(ex, today_appearances)
         else:
             first_title = today_appearances[0]["title"] if today_appearances else ""
             existing_places[name_low] = {
@@ -5426,8 +6460,8 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
         name = str(e.get("name", "Unknown") or "Unknown").strip() or "Unknown"
         name_low = _norm_key(name)
         today_appearances = stories_for(name)
-        if name_low in existing_events:
-            ex = existing_events[name_low]
+        ex = existing_events.get(name_low)
+        if ex is not None:
             # Preserve richer metadata when present.
             if e.get("tagline") and not ex.get("tagline"):
                 ex["tagline"] = e.get("tagline")
@@ -5453,12 +6487,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
 
             ex["outcome"]      = e.get("outcome",      ex.get("outcome",      ""))
             ex["significance"] = e.get("significance", ex.get("significance", ""))
-            prior = ex.get("story_appearances", [])
-            new_ones = [a for a in today_appearances
-                        if not any(p["date"] == a["date"] and p["title"] == a["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
+            _append_story_appearances(ex, today_appearances)
         else:
             first_title = today_appearances[0]["title"] if today_appearances else ""
             existing_events[name_low] = {
@@ -5492,214 +6521,50 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
 
     codex["events"] = list(existing_events.values())
 
-    # ── Merge weapons ────────────────────────────────────────────────────
-    existing_weapons = {w["name"].lower(): w for w in codex.get("weapons", [])}
-    for w in lore.get("weapons", []):
-        name = w.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_weapons:
-            ex = existing_weapons[name_low]
-            ex["powers"]            = w.get("powers",            ex.get("powers",            ""))
-            ex["last_known_holder"] = w.get("last_known_holder", ex.get("last_known_holder", ""))
-            ex["status"]            = w.get("status",            ex.get("status",            "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [a for a in today_appearances
-                        if not any(p["date"] == a["date"] and p["title"] == a["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_weapons[name_low] = {
-                "name":              name,
-                "tagline":           w.get("tagline", ""),
-                "weapon_type":       w.get("weapon_type", ""),
-                "origin":            w.get("origin", ""),
-                "powers":            w.get("powers", ""),
-                "last_known_holder": w.get("last_known_holder", ""),
-                "status":            w.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["weapons"] = list(existing_weapons.values())
-
-    # ── Merge artifacts ──────────────────────────────────────────────────
-    existing_artifacts = {a["name"].lower(): a for a in codex.get("artifacts", [])}
-    for a in lore.get("artifacts", []):
-        name = a.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_artifacts:
-            ex = existing_artifacts[name_low]
-            ex["powers"]            = a.get("powers",            ex.get("powers",            ""))
-            ex["last_known_holder"] = a.get("last_known_holder", ex.get("last_known_holder", ""))
-            ex["status"]            = a.get("status",            ex.get("status",            "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_artifacts[name_low] = {
-                "name":              name,
-                "tagline":           a.get("tagline", ""),
-                "artifact_type":     a.get("artifact_type", ""),
-                "origin":            a.get("origin", ""),
-                "powers":            a.get("powers", ""),
-                "last_known_holder": a.get("last_known_holder", ""),
-                "status":            a.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["artifacts"] = list(existing_artifacts.values())
-    # ── Merge factions ──────────────────────────────────────────────
-    existing_factions = {x["name"].lower(): x for x in codex.get("factions", [])}
-    for f in lore.get("factions", []):
-        name = f.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_factions:
-            ex = existing_factions[name_low]
-            ex["goals"]         = f.get("goals",         ex.get("goals",         ""))
-            ex["leader"]        = f.get("leader",        ex.get("leader",        ""))
-            ex["status"]        = f.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_factions[name_low] = {
-                "name":              name,
-                "tagline":           f.get("tagline", ""),
-                "alignment":          f.get("alignment", ""),
-                "goals":              f.get("goals", ""),
-                "leader":             f.get("leader", ""),
-                "status":            f.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["factions"] = list(existing_factions.values())
-
-    # ── Merge lore ──────────────────────────────────────────────────
-    existing_lore = {x["name"].lower(): x for x in codex.get("lore", [])}
-    for lo in lore.get("lore", []):
-        name = lo.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_lore:
-            ex = existing_lore[name_low]
-            ex["source"]        = lo.get("source",        ex.get("source",        ""))
-            ex["status"]        = lo.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_lore[name_low] = {
-                "name":              name,
-                "tagline":           lo.get("tagline", ""),
-                "category":           lo.get("category", ""),
-                "source":             lo.get("source", ""),
-                "status":            lo.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["lore"] = list(existing_lore.values())
-
-    # ── Merge flora_fauna ───────────────────────────────────────────
-    existing_flora_fauna = {x["name"].lower(): x for x in codex.get("flora_fauna", [])}
-    for ff in lore.get("flora_fauna", []):
-        name = ff.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_flora_fauna:
-            ex = existing_flora_fauna[name_low]
-            ex["habitat"]       = ff.get("habitat",       ex.get("habitat",       ""))
-            ex["rarity"]        = ff.get("rarity",        ex.get("rarity",        ""))
-            ex["status"]        = ff.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_flora_fauna[name_low] = {
-                "name":              name,
-                "tagline":           ff.get("tagline", ""),
-                "type":               ff.get("type", ""),
-                "rarity":             ff.get("rarity", ""),
-                "habitat":            ff.get("habitat", ""),
-                "status":            ff.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["flora_fauna"] = list(existing_flora_fauna.values())
-
-    # ── Merge magic ─────────────────────────────────────────────────
-    existing_magic = {x["name"].lower(): x for x in codex.get("magic", [])}
-    for mg in lore.get("magic", []):
-        name = mg.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_magic:
-            ex = existing_magic[name_low]
-            ex["element"]       = mg.get("element",       ex.get("element",       ""))
-            ex["difficulty"]    = mg.get("difficulty",    ex.get("difficulty",    ""))
-            ex["status"]        = mg.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_magic[name_low] = {
-                "name":              name,
-                "tagline":           mg.get("tagline", ""),
-                "type":               mg.get("type", ""),
-                "element":            mg.get("element", ""),
-                "difficulty":         mg.get("difficulty", ""),
-                "status":            mg.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["magic"] = list(existing_magic.values())
-
-    # ── Merge relics ────────────────────────────────────────────────
-    existing_relics = {x["name"].lower(): x for x in codex.get("relics", [])}
-
+    # Names of codex characters, for keeping people out of object categories.
     def _base_name_for_crosscat(n: str) -> str:
         return _norm_entity_key(_strip_trailing_parenthetical(str(n or "")))
 
-    character_name_bases = {
+    character_name_bases = frozenset(
         _base_name_for_crosscat(c.get("name", ""))
         for c in (codex.get("characters") or [])
         if isinstance(c, dict) and (c.get("name") or "").strip()
-    }
+    )
+
+    # ── Merge the simple item categories (see _CODEX_SIMPLE_CATEGORIES) ──
+    def merge_simple_category(cat_key: str):
+        update_fields, new_fields = _CODEX_SIMPLE_CATEGORIES[cat_key]
+        guard_characters = cat_key in _CODEX_CHARACTER_GUARDED_CATEGORIES
+        existing = {x["name"].lower(): x for x in codex.get(cat_key, [])}
+        for item in lore.get(cat_key, []):
+            name = item.get("name", "Unknown")
+            if guard_characters and _base_name_for_crosscat(name) in character_name_bases:
+                # A person extracted as an object; the character row carries the appearance.
+                continue
+            name_low = name.lower()
+            today_appearances = stories_for(name)
+            ex = existing.get(name_low)
+            if ex is not None:
+                for k, default in update_fields:
+                    ex[k] = item.get(k, ex.get(k, default))
+                _append_story_appearances(ex, today_appearances)
+            else:
+                first_title = today_appearances[0]["title"] if today_appearances else ""
+                entry = {"name": name, "tagline": item.get("tagline", "")}
+                for k, default in new_fields:
+                    entry[k] = item.get(k, default)
+                entry["first_story"] = first_title
+                entry["first_date"] = date_key
+                entry["appearances"] = len(today_appearances) or 1
+                entry["story_appearances"] = today_appearances
+                existing[name_low] = entry
+        codex[cat_key] = list(existing.values())
+
+    for cat_key in ("weapons", "artifacts", "factions", "lore", "flora_fauna", "magic"):
+        merge_simple_category(cat_key)
+
+    # ── Merge relics ────────────────────────────────────────────────
+    existing_relics = {x["name"].lower(): x for x in codex.get("relics", [])}
 
     for rl in lore.get("relics", []):
         name = _strip_trailing_parenthetical(rl.get("name", "Unknown"))
@@ -5709,17 +6574,12 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
             continue
         name_low = name.lower()
         today_appearances = stories_for(name)
-        if name_low in existing_relics:
-            ex = existing_relics[name_low]
+        ex = existing_relics.get(name_low)
+        if ex is not None:
             ex["power"]         = rl.get("power",         ex.get("power",         ""))
             ex["curse"]         = rl.get("curse",         ex.get("curse",         ""))
             ex["status"]        = rl.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
+            _append_story_appearances(ex, today_appearances)
         else:
             first_title = today_appearances[0]["title"] if today_appearances else ""
             existing_relics[name_low] = {
@@ -5736,81 +6596,8 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
             }
     codex["relics"] = list(existing_relics.values())
 
-    # ── Merge regions ───────────────────────────────────────────────
-    existing_regions = {x["name"].lower(): x for x in codex.get("regions", [])}
-    for rg in lore.get("regions", []):
-        name = rg.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_regions:
-            ex = existing_regions[name_low]
-            ex["continent"]     = rg.get("continent",     ex.get("continent",     "unknown"))
-            ex["realm"]         = rg.get("realm",         ex.get("realm",         "unknown"))
-            ex["ruler"]         = rg.get("ruler",         ex.get("ruler",         ""))
-            ex["climate"]       = rg.get("climate",       ex.get("climate",       ""))
-            ex["terrain"]       = rg.get("terrain",       ex.get("terrain",       ""))
-            ex["function"]      = rg.get("function",      ex.get("function",      ""))
-            ex["status"]        = rg.get("status",        ex.get("status",        "unknown"))
-            ex["notes"]         = rg.get("notes",         ex.get("notes",         ""))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_regions[name_low] = {
-                "name":              name,
-                "tagline":           rg.get("tagline", ""),
-                "continent":         rg.get("continent", "unknown"),
-                "realm":             rg.get("realm", "unknown"),
-                "climate":            rg.get("climate", ""),
-                "terrain":            rg.get("terrain", ""),
-                "ruler":              rg.get("ruler", ""),
-                "function":           rg.get("function", ""),
-                "status":            rg.get("status", "unknown"),
-                "notes":             rg.get("notes", ""),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["regions"] = list(existing_regions.values())
-
-    # ── Merge substances ────────────────────────────────────────────
-    existing_substances = {x["name"].lower(): x for x in codex.get("substances", [])}
-    for sub in lore.get("substances", []):
-        name = sub.get("name", "Unknown")
-        name_low = name.lower()
-        today_appearances = stories_for(name)
-        if name_low in existing_substances:
-            ex = existing_substances[name_low]
-            ex["properties"]    = sub.get("properties",    ex.get("properties",    ""))
-            ex["use"]           = sub.get("use",           ex.get("use",           ""))
-            ex["status"]        = sub.get("status",        ex.get("status",        "unknown"))
-            prior = ex.get("story_appearances", [])
-            new_ones = [app for app in today_appearances
-                        if not any(p["date"] == app["date"] and p["title"] == app["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
-        else:
-            first_title = today_appearances[0]["title"] if today_appearances else ""
-            existing_substances[name_low] = {
-                "name":              name,
-                "tagline":           sub.get("tagline", ""),
-                "type":               sub.get("type", ""),
-                "rarity":             sub.get("rarity", ""),
-                "properties":         sub.get("properties", ""),
-                "use":                sub.get("use", ""),
-                "status":            sub.get("status", "unknown"),
-                "first_story":       first_title,
-                "first_date":        date_key,
-                "appearances":       len(today_appearances) or 1,
-                "story_appearances": today_appearances,
-            }
-    codex["substances"] = list(existing_substances.values())
+    for cat_key in ("regions", "substances"):
+        merge_simple_category(cat_key)
 
     # ── Backstop: ensure character home_* geo anchors exist ─────────────
     # Motivation: The extractor often captures a character's home_place/home_region/home_realm,
@@ -5869,7 +6656,7 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
             if isinstance(p, dict) and str(p.get("name") or "").strip()
         }
 
-        for c in codex.get("characters", []) or []:
+        for c in codex.get("characters") or []:
             if not isinstance(c, dict):
                 continue
             story_apps = _uniq_story_apps(c.get("story_appearances"))
@@ -6226,24 +7013,24 @@ def update_codex_file(lore, date_key, stories=None, assume_all_from_stories: boo
     _attach_codex_liveness_meta(codex)
 
     codex["last_updated"] = date_key
-    with open(CODEX_FILE, "w", encoding="utf-8") as f:
-        json.dump(codex, f, ensure_ascii=True, indent=2)
-    print(
-        f"\u2713 Saved {CODEX_FILE} ("
-        f"{len(codex['characters'])} chars, "
-        f"{len(codex['places'])} places, "
-        f"{len(codex['events'])} events, "
-        f"{len(codex.get('rituals', []))} rituals, "
-        f"{len(codex['weapons'])} weapons, "
-        f"{len(codex['artifacts'])} artifacts, "
-        f"{len(codex.get('factions', []))} factions, "
-        f"{len(codex.get('lore', []))} lore, "
-        f"{len(codex.get('flora_fauna', []))} flora/fauna, "
-        f"{len(codex.get('magic', []))} magic, "
-        f"{len(codex.get('relics', []))} relics, "
-        f"{len(codex.get('regions', []))} regions, "
-        f"{len(codex.get('substances', []))} substances)"
+    _write_json_ascii_atomic(CODEX_FILE, codex)
+    summary_labels = (
+        ("characters", "chars"),
+        ("places", "places"),
+        ("events", "events"),
+        ("rituals", "rituals"),
+        ("weapons", "weapons"),
+        ("artifacts", "artifacts"),
+        ("factions", "factions"),
+        ("lore", "lore"),
+        ("flora_fauna", "flora/fauna"),
+        ("magic", "magic"),
+        ("relics", "relics"),
+        ("regions", "regions"),
+        ("substances", "substances"),
     )
+    counts = {key: len(codex.get(key) or []) for key, _ in summary_labels}
+    print(f"\u2713 Saved {CODEX_FILE} (" + ", ".join(f"{counts[key]} {label}" for key, label in summary_labels) + ")")
 
 # ── Characters file update (legacy) ──────────────────────────────────────
 def update_characters_file(lore, date_key, stories=None):
@@ -6259,13 +7046,16 @@ def update_characters_file(lore, date_key, stories=None):
         except (json.JSONDecodeError, IOError):
             pass
 
+    # Lowercase each story once, and scan once per distinct first name.
+    story_blobs = [(s, (s.get("text", "") + " " + s.get("title", "")).lower()) for s in stories]
+    titles_by_first = {}
+
     def stories_for(name):
         first = name.split()[0].lower()
-        return [
-            {"date": date_key, "title": s.get("title", "")}
-            for s in stories
-            if first in (s.get("text", "") + " " + s.get("title", "")).lower()
-        ]
+        titles = titles_by_first.get(first)
+        if titles is None:
+            titles = titles_by_first[first] = [s.get("title", "") for s, blob in story_blobs if first in blob]
+        return [{"date": date_key, "title": title} for title in titles]
 
     for c in lore.get("characters", []):
         name = c.get("name", "Unknown")
@@ -6275,8 +7065,8 @@ def update_characters_file(lore, date_key, stories=None):
             c.get("world", "The Known World")
         )
         today_appearances = stories_for(name)
-        if name_low in existing_chars:
-            ex = existing_chars[name_low]
+        ex = existing_chars.get(name_low)
+        if ex is not None:
             ex["role"]   = c.get("role",   ex.get("role",   "Unknown"))
             ex["status"] = c.get("status", ex.get("status", "Unknown"))
             ex["world"]  = world
@@ -6284,12 +7074,7 @@ def update_characters_file(lore, date_key, stories=None):
             ex["traits"] = c.get("traits", ex.get("traits", []))
             if c.get("tagline") and not ex.get("tagline"):
                 ex["tagline"] = c["tagline"]
-            prior = ex.get("story_appearances", [])
-            new_ones = [a for a in today_appearances
-                        if not any(p["date"] == a["date"] and p["title"] == a["title"] for p in prior)]
-            if new_ones:
-                ex["appearances"] = ex.get("appearances", 1) + len(new_ones)
-                ex["story_appearances"] = prior + new_ones
+            _append_story_appearances(ex, today_appearances)
         else:
             first_title = today_appearances[0]["title"] if today_appearances else ""
             existing_chars[name_low] = {
@@ -6307,8 +7092,7 @@ def update_characters_file(lore, date_key, stories=None):
             }
 
     output = {"last_updated": date_key, "characters": list(existing_chars.values())}
-    with open(CHARACTERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=True, indent=2)
+    _write_json_ascii_atomic(CHARACTERS_FILE, output)
     print(f"\u2713 Saved {CHARACTERS_FILE} ({len(output['characters'])} characters total)")
 
 def parse_json_response(raw):
@@ -6432,7 +7216,7 @@ def coerce_story_dict(obj: object) -> dict:
 
 
 def _story_title_key(title: object) -> str:
-    return re.sub(r"\s+", " ", str(title or "").strip()).lower()
+    return _WS_RUN_RE.sub(" ", str(title or "").strip()).lower()
 
 
 def _story_length_rule_lines() -> list[str]:
@@ -6466,7 +7250,69 @@ Here is the prior response (verbatim):
 """
 
 
-def _parse_story_items_with_repair(client, raw_text: str, num_stories: int) -> list:
+class _StreamedStoryScanner:
+    """Pick complete story objects out of a streamed JSON response as they close.
+
+    Tracks brace depth outside string literals, so each ``{...}`` can be parsed the
+    moment its closing brace arrives, whether the stories sit in a bare array or a
+    wrapper like ``{"stories": [...]}``. Only dicts that look like stories are kept.
+    """
+
+    def __init__(self):
+        # Chunks are kept as a list and joined on demand: ``self.text += chunk``
+        # copied the whole response so far on every streamed chunk.
+        self._chunks = []
+        self._joined = ""
+        self._pos = 0
+        self._starts = []
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        self._joined = self._chunks[0] if self._chunks else ""
+        return self._joined
+
+    def feed(self, chunk: str) -> list:
+        if not chunk:
+            return []
+        self._chunks.append(chunk)
+        found = []
+        base = self._pos
+        for offset, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._starts.append(base + offset)
+            elif ch == "}" and self._starts:
+                start = self._starts.pop()
+                end = base + offset + 1
+                text = self._joined if len(self._joined) >= end else self.text
+                try:
+                    obj = json.loads(text[start:end])
+                except Exception:
+                    continue
+                if _looks_like_story_dict(obj):
+                    found.append(obj)
+        self._pos = base + len(chunk)
+        return found
+
+
+def _parse_story_items_with_repair(client, raw_text: str, num_stories: int, truncated_items=None) -> list:
+    """Parse story items from a response, falling back to a JSON-repair call.
+
+    ``truncated_items`` are the stories that closed while streaming a response
+    that hit max_tokens; when given, they replace the repair call.
+    """
     try:
         parsed = parse_json_response(raw_text)
         items = extract_story_items(parsed) or []
@@ -6474,6 +7320,13 @@ def _parse_story_items_with_repair(client, raw_text: str, num_stories: int) -> l
             return items
         raise ValueError("Parsed JSON did not contain any story items")
     except Exception as first_error:
+        # A response cut off at max_tokens still leaves every story that closed
+        # cleanly during streaming, and a repair call could only reformat the same
+        # cut-off text. Any other parse failure goes to the repair call, which can
+        # recover a malformed story instead of dropping it.
+        if truncated_items:
+            print(f"WARNING: Story JSON was truncated at max_tokens ({first_error}); keeping {len(truncated_items)} story(ies) completed during streaming.", file=sys.stderr)
+            return list(truncated_items)
         repair_msg = client.messages.create(
             model=MODEL,
             max_tokens=max(1024, min(JSON_REPAIR_MAX_TOKENS, 1200 * max(1, int(num_stories)))),
@@ -6770,7 +7623,11 @@ def generate_initial_story_batches(
         if spent_motifs:
             print(f"  Steering away from spent motifs for this batch: {', '.join(spent_motifs)}")
 
-        message = client.messages.create(
+        # Stream the batch so each story is picked out as soon as it closes; if the
+        # response runs into max_tokens, the completed stories are kept as-is.
+        scanner = _StreamedStoryScanner()
+        streamed_items = []
+        with client.messages.stream(
             model=MODEL,
             max_tokens=_story_generation_max_tokens(request_n),
             messages=[{
@@ -6789,10 +7646,15 @@ def generate_initial_story_batches(
                     existing_stories=stories,
                 ),
             }],
-        )
-        raw = message.content[0].text.strip()
+        ) as stream:
+            for chunk in stream.text_stream:
+                streamed_items.extend(scanner.feed(chunk))
+            truncated = stream.get_final_message().stop_reason == "max_tokens"
+        raw = scanner.text.strip()
         try:
-            story_items = _parse_story_items_with_repair(client, raw, request_n)
+            story_items = _parse_story_items_with_repair(
+                client, raw, request_n, truncated_items=streamed_items if truncated else None
+            )
         except Exception as e:
             print(f"WARNING: Initial story batch failed: {e}", file=sys.stderr)
             break
@@ -7054,6 +7916,8 @@ def _extract_lore_batched(client, stories: list[dict], lore: dict, codex_balance
         print(f"  Splitting {len(stories)} stories into {total_batches} extraction batches of ≤{batch_size}…")
 
     extracted_batches: list[dict] = []
+    # Lore is not modified until all batches are merged, so index its names once.
+    lore_index = LoreIndex.build(lore, categories=_LORE_EXTRACTION_CANON_CATEGORIES)
 
     for batch_idx, batch_stories in enumerate(batches_of_stories, 1):
         batch_label = f"batch {batch_idx}/{total_batches}" if total_batches > 1 else "extraction"
@@ -7067,7 +7931,9 @@ def _extract_lore_batched(client, stories: list[dict], lore: dict, codex_balance
                 max_tokens=max_tokens,
                 messages=[{
                     "role": "user",
-                    "content": build_lore_extraction_prompt(batch_stories, lore, codex_balance=codex_balance),
+                    "content": build_lore_extraction_prompt(
+                        batch_stories, lore, codex_balance=codex_balance, lore_index=lore_index
+                    ),
                 }],
             )
 
@@ -7148,6 +8014,8 @@ def _norm_text_for_matching(s: str) -> str:
         .lower()
     )
 
+_ENTITY_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-‑][a-z0-9]+)?")
+
 
 def _tokens_for_entity_name(name: str, max_tokens: int = 4) -> list[str]:
     """Extract significant word tokens from an entity name for mention checks."""
@@ -7156,7 +8024,7 @@ def _tokens_for_entity_name(name: str, max_tokens: int = 4) -> list[str]:
     nm = _norm_text_for_matching(nm)
     toks = [
         t
-        for t in re.findall(r"[a-z0-9]+(?:[-‑][a-z0-9]+)?", nm)
+        for t in _ENTITY_TOKEN_RE.findall(nm)
         if t and t not in _SKIP
     ]
     return toks[: max(1, int(max_tokens or 4))] if toks else ([nm] if nm else [])
@@ -7168,13 +8036,31 @@ def entity_name_mentioned_in_text(name: str, text: str) -> bool:
     This is deliberately conservative: it avoids substring matches like "crow" in "crown",
     while still allowing small re-orderings like "ritual of dismissal".
     """
-    blob = _norm_text_for_matching(text)
-    nm = _strip_trailing_parenthetical(str(name or "").strip())
-    if not nm or not blob:
-        return False
+    return _name_mentioned_in_normalized(name, _norm_text_for_matching(text))
+
 
+@functools.lru_cache(maxsize=4096)
+def _name_mention_pattern(name: str):
+    """(normalized name, compiled boundary regex) for a canon name; None when blank."""
+    nm = _strip_trailing_parenthetical(name.strip())
+    if not nm:
+        return None
     nm_norm = _norm_text_for_matching(nm)
-    return bool(re.search(r"(?<![a-z0-9])" + re.escape(nm_norm) + r"(?![a-z0-9])", blob))
+    return nm_norm, re.compile(r"(?<![a-z0-9])" + re.escape(nm_norm) + r"(?![a-z0-9])")
+
+
+def _name_mentioned_in_normalized(name: str, blob: str) -> bool:
+    """entity_name_mentioned_in_text for a blob already passed through _norm_text_for_matching.
+
+    A plain substring test rejects most names before the boundary regex runs.
+    """
+    if not blob:
+        return False
+    pat = _name_mention_pattern(str(name or ""))
+    if pat is None:
+        return False
+    nm_norm, rx = pat
+    return nm_norm in blob and rx.search(blob) is not None
 
 
 def filter_lore_to_stories(lore: dict, stories: list[dict]) -> dict:
@@ -7184,11 +8070,11 @@ def filter_lore_to_stories(lore: dict, stories: list[dict]) -> dict:
     if not isinstance(stories, list) or not stories:
         return lore
 
-    blob = "\n\n".join(
+    blob = _norm_text_for_matching("\n\n".join(
         str((s.get("title", "") or "").strip()) + "\n" + str((s.get("text", "") or "").strip())
         for s in stories
         if isinstance(s, dict)
-    )
+    ))
 
     def _keep_item(cat: str, it: dict) -> bool:
         nm = (it.get("name") or "").strip()
@@ -7196,15 +8082,15 @@ def filter_lore_to_stories(lore: dict, stories: list[dict]) -> dict:
             return False
         # Characters may have explicit aliases; allow any alias to satisfy grounding.
         if cat == "characters":
-            if entity_name_mentioned_in_text(nm, blob):
+            if _name_mentioned_in_normalized(nm, blob):
                 return True
             aliases = it.get("aliases")
             if isinstance(aliases, list):
                 for a in aliases:
-                    if entity_name_mentioned_in_text(str(a or "").strip(), blob):
+                    if _name_mentioned_in_normalized(str(a or "").strip(), blob):
                         return True
             return False
-        return entity_name_mentioned_in_text(nm, blob)
+        return _name_mentioned_in_normalized(nm, blob)
 
     for cat, arr in list(lore.items()):
         if not isinstance(arr, list):
@@ -7218,14 +8104,17 @@ def filter_lore_to_stories(lore: dict, stories: list[dict]) -> dict:
         lore[cat] = kept
     return lore
 
+_DESCRIPTOR_ARTICLE_RE = re.compile(r"^(?:the|a|an)\s+")
+_DESCRIPTOR_JUNK_RE = re.compile(r"[^a-z0-9\s'\-]")
+
 
 def _descriptor_key(text: str) -> str:
     """Collapse descriptive character labels into a stable comparison key."""
     s = _norm_text_for_matching(str(text or "").strip())
     if not s:
         return ""
-    s = re.sub(r"^(?:the|a|an)\s+", "", s)
-    s = re.sub(r"[^a-z0-9\s'\-]", " ", s)
+    s = _DESCRIPTOR_ARTICLE_RE.sub("", s)
+    s = _DESCRIPTOR_JUNK_RE.sub(" ", s)
     tokens = [t for t in s.split() if t]
     if not tokens:
         return ""
@@ -7352,12 +8241,17 @@ def ensure_named_character_mentions_present(lore: dict, stories: list[dict]) ->
                     by_name.setdefault(alias_key, char)
 
     removals = set()
+    stories_blob = _norm_text_for_matching("\n\n".join(
+        str((s.get("text") or "").strip()) + "\n" + str((s.get("title") or "").strip())
+        for s in stories
+        if isinstance(s, dict)
+    ))
     for mention in mentions:
         name = mention["name"]
         name_key = _norm_entity_key(name)
         descriptor = mention["descriptor"]
         descriptor_key = mention["descriptor_key"]
-        if not name_key or not entity_name_mentioned_in_text(name, "\n\n".join(str((s.get("text") or "").strip()) + "\n" + str((s.get("title") or "").strip()) for s in stories if isinstance(s, dict))):
+        if not name_key or not _name_mentioned_in_normalized(name, stories_blob):
             continue
 
         target = by_name.get(name_key)
@@ -7459,6 +8353,7 @@ def ensure_named_leaders_present(lore: dict, stories: list[dict]) -> dict:
     )
     if not blob.strip():
         return lore
+    blob_norm = _norm_text_for_matching(blob)
 
     def _norm_name(x: str) -> str:
         return _norm_text_for_matching(_strip_trailing_parenthetical(str(x or "").strip()))
@@ -7499,11 +8394,11 @@ def ensure_named_leaders_present(lore: dict, stories: list[dict]) -> dict:
             continue
 
         # Only add if actually mentioned in the story text.
-        if not entity_name_mentioned_in_text(leader, blob):
+        if not _name_mentioned_in_normalized(leader, blob_norm):
             # Try without leading "The".
             if _norm_text_for_matching(leader).startswith("the "):
                 alt = leader.strip()[4:].strip()
-                if alt and entity_name_mentioned_in_text(alt, blob):
+                if alt and _name_mentioned_in_normalized(alt, blob_norm):
                     leader = "The " + alt
                 else:
                     continue
@@ -7612,7 +8507,7 @@ def build_lore_revision_prompt(stories, lore, referenced_entries):
             canon_lines.append(json.dumps(it, ensure_ascii=False, sort_keys=True))
         canon_lines.append("")
 
-    stories_payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    stories_payload = _json_dumps(stories, indent=True)
     rules_block = "\n".join([f"- {r}" for r in world_rules]) if world_rules else "- (none)"
 
     return f"""You are an editor for an ongoing sword-and-sorcery universe.
@@ -7658,7 +8553,7 @@ def build_canon_checker_prompt(stories, lore, referenced_entries, mode="rewrite"
             canon_lines.append(json.dumps(it, ensure_ascii=False, sort_keys=True))
         canon_lines.append("")
 
-    stories_payload = json.dumps(stories, ensure_ascii=False, indent=2)
+    stories_payload = _json_dumps(stories, indent=True)
     rules_block = "\n".join([f"- {r}" for r in world_rules]) if world_rules else "- (none)"
     mode = (mode or "rewrite").strip().lower()
     wants_rewrite = mode != "report"
@@ -7706,13 +8601,11 @@ def ensure_archive_dir():
 
 def load_archive_index():
     if os.path.exists(ARCHIVE_IDX):
-        with open(ARCHIVE_IDX, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_file(ARCHIVE_IDX)
     return {"dates": []}
 
 def save_archive_index(idx):
-    with open(ARCHIVE_IDX, "w", encoding="utf-8") as f:
-        json.dump(idx, f, ensure_ascii=True, indent=2)
+    _write_json_ascii_atomic(ARCHIVE_IDX, idx)
 
 
 def _truthy_env(name: str) -> bool:
@@ -7741,6 +8634,8 @@ def _issue_now() -> datetime:
 
     Falls back to UTC if the timezone name is invalid.
     """
+    from zoneinfo import ZoneInfo
+
     try:
         tz = ZoneInfo(ISSUE_TIMEZONE)
     except Exception:
@@ -7788,6 +8683,7 @@ def main():
     lore = seed_geo_entities_from_geography(lore, geo)
     ensure_place_parent_chain(lore)
     enforce_continent_limit(lore)
+    lore_index = LoreIndex.build(lore)
     print(f"\u2713 Loaded lore ({len(lore.get('characters', []))} characters, "
           f"{len(lore.get('places', []))} places)")
 
@@ -7805,7 +8701,7 @@ def main():
     else:
         print("\u2713 Codex balance: no underrepresented labels below threshold")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic().Anthropic(api_key=api_key)
 
     # ── Optional: Reuse planning (decide reuse + select candidates) ──────
     reuse_plan = {"reuse": False, "selections": {}, "rationale": ""}
@@ -7837,7 +8733,7 @@ def main():
                 plan = parse_json_response(plan_raw)
                 reuse_plan = normalize_reuse_plan(plan, candidates_by_cat)
                 if reuse_plan.get("reuse"):
-                    reused_entries = get_full_canon_entries_for_selections(lore, reuse_plan.get("selections", {}))
+                    reused_entries = get_full_canon_entries_for_selections(lore, reuse_plan.get("selections", {}), index=lore_index)
                     allowed_names_lower = allowed_reuse_name_set(reused_entries)
                     print(f"\u2713 Reuse plan: {reuse_plan.get('selections', {})}")
                 else:
@@ -7876,6 +8772,7 @@ def main():
 
         codex = load_codex_file() if ENABLE_REUSE_DOSSIER else {}
         codex_map = _codex_entry_map(codex) if ENABLE_REUSE_DOSSIER else {}
+        pending_dossiers = []  # (detail, name, prompt, cache path)
 
         for cat, items in reused_entries.items():
             if not items:
@@ -7908,22 +8805,50 @@ def main():
                             max_total_chars=REUSE_DOSSIER_MAX_TOTAL_INPUT_CHARS,
                         )
                         if prior_tales:
-                            print(f"Scanning {len(prior_tales)} prior tale(s) for reused {cat[:-1] if cat.endswith('s') else cat}: {nm}...")
-                            dossier_prompt = build_reuse_dossier_prompt(nm, cat, it, prior_tales)
-                            try:
-                                dossier_msg = client.messages.create(
-                                    model=MODEL,
-                                    max_tokens=REUSE_DOSSIER_MAX_TOKENS,
-                                    messages=[{"role": "user", "content": dossier_prompt}],
-                                )
-                                detail["dossier"] = dossier_msg.content[0].text.strip()
-                            except Exception as e:
-                                print(f"WARNING: Reuse dossier build failed for {nm}: {e}", file=sys.stderr)
+                            encoded = encode_reuse_dossier_inputs(it, prior_tales)
+                            cache_path = reuse_dossier_cache_path(nm, cat, it, prior_tales, encoded)
+                            cached = load_cached_dossier(cache_path)
+                            if cached:
+                                print(f"\u2713 Reusing cached dossier for {nm} ({len(prior_tales)} prior tale(s) unchanged)")
+                                detail["dossier"] = cached
+                            else:
+                                print(f"Scanning {len(prior_tales)} prior tale(s) for reused {cat[:-1] if cat.endswith('s') else cat}: {nm}...")
+                                pending_dossiers.append((detail, nm, build_reuse_dossier_prompt(nm, cat, it, prior_tales, encoded), cache_path))
                     else:
                         detail["appearance_count"] = 0
 
                 reuse_details.setdefault(cat, []).append(detail)
 
+        batched_dossiers = {}
+        if ENABLE_REUSE_DOSSIER_BATCH and len(pending_dossiers) > 1:
+            print(f"Submitting {len(pending_dossiers)} reuse dossier(s) as a message batch...")
+            try:
+                batched_dossiers = submit_dossier_batch(
+                    client,
+                    [(i, prompt) for i, (_, _, prompt, _) in enumerate(pending_dossiers)],
+                )
+                print(f"\u2713 Dossier batch: {len(batched_dossiers)}/{len(pending_dossiers)} returned")
+            except Exception as e:
+                print(f"WARNING: Dossier batch failed; falling back to direct calls: {e}", file=sys.stderr)
+
+        for i, (detail, _, _, cache_path) in enumerate(pending_dossiers):
+            if i in batched_dossiers:
+                detail["dossier"] = batched_dossiers[i]
+                save_cached_dossier(cache_path, batched_dossiers[i])
+
+        direct_dossiers = [job for i, job in enumerate(pending_dossiers) if i not in batched_dossiers]
+        direct_results = run_prompts_concurrently(
+            client,
+            [prompt for _, _, prompt, _ in direct_dossiers],
+            max_tokens=REUSE_DOSSIER_MAX_TOKENS,
+        )
+        for (detail, nm, _, cache_path), result in zip(direct_dossiers, direct_results):
+            if isinstance(result, BaseException):
+                print(f"WARNING: Reuse dossier build failed for {nm}: {result}", file=sys.stderr)
+            else:
+                detail["dossier"] = result
+                save_cached_dossier(cache_path, result)
+
     # ── Optional: Pre-compute event arc dossiers ─────────────────────────
     # When ENABLE_EVENT_ARC_DOSSIER is on and an event has prior tale
     # appearances, we summarize its narrative arc via an API call so the
@@ -7940,6 +8865,7 @@ def main():
 
     if ENABLE_WORLD_EVENT_ARCS and ENABLE_EVENT_ARC_DOSSIER:
         selected_events = _select_world_event_arcs(today_str)
+        arc_jobs = []  # (event name, prompt)
         for evt in selected_events:
             evt_name = (evt.get("name") or "").strip()
             if not evt_name:
@@ -7953,19 +8879,20 @@ def main():
             if not event_tales:
                 continue
             print(f"Building arc dossier for event \"{evt_name}\" ({len(event_tales)} tales)...")
-            dossier_prompt = build_event_arc_dossier_prompt(evt, event_tales)
-            try:
-                dossier_msg = client.messages.create(
-                    model=MODEL,
-                    max_tokens=EVENT_ARC_DOSSIER_MAX_TOKENS,
-                    messages=[{"role": "user", "content": dossier_prompt}],
-                )
-                dossier_text = dossier_msg.content[0].text.strip()
-                if dossier_text:
-                    event_arc_dossiers[evt_name.lower()] = dossier_text
-                    print(f"✓ Arc dossier for \"{evt_name}\": {len(dossier_text)} chars")
-            except Exception as e:
-                print(f"WARNING: Event arc dossier failed for \"{evt_name}\": {e}", file=sys.stderr)
+            arc_jobs.append((evt_name, build_event_arc_dossier_prompt(evt, event_tales)))
+
+        arc_results = run_prompts_concurrently(
+            client,
+            [prompt for _, prompt in arc_jobs],
+            max_tokens=EVENT_ARC_DOSSIER_MAX_TOKENS,
+        )
+        for (evt_name, _), result in zip(arc_jobs, arc_results):
+            if isinstance(result, BaseException):
+                print(f"WARNING: Event arc dossier failed for \"{evt_name}\": {result}", file=sys.stderr)
+                continue
+            if result:
+                event_arc_dossiers[evt_name.lower()] = result
+                print(f"✓ Arc dossier for \"{evt_name}\": {len(result)} chars")
 
     # ── CALL 1: Generate stories with lore context ───────────────────────
     stories = generate_initial_story_batches(
@@ -8258,7 +9185,7 @@ def main():
             try:
                 updates = parse_json_response(updates_raw)
                 lore = apply_existing_character_updates(lore, updates, date_key, stories=stories)
-                lore = ensure_home_location_entities_exist(lore, date_key)
+                lore = ensure_home_location_entities_exist(lore, date_key, index=lore_index)
                 changed = len((updates or {}).get("characters", []) or []) if isinstance(updates, dict) else 0
                 if changed:
                     print(f"\u2713 Applied {changed} character status update(s)")
@@ -8304,15 +9231,13 @@ def main():
         "generated_at": issue_now.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "stories":      stories
     }
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=True, indent=2)
+    _write_json_ascii_atomic(OUTPUT_FILE, output)
     print(f"\u2713 Saved {len(stories)} stories to {OUTPUT_FILE}")
 
     # ── Save to archive/<date>.json ──────────────────────────────────────
     ensure_archive_dir()
     archive_file = os.path.join(ARCHIVE_DIR, f"{date_key}.json")
-    with open(archive_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=True, indent=2)
+    _write_json_ascii_atomic(archive_file, output)
     print(f"\u2713 Archived to {archive_file}")
 
     # ── Update archive/index.json ─────────────────────────────────────────
@@ -8407,7 +9332,9 @@ def main():
 if __name__ == "__main__":
     try:
         main()
-    except anthropic.BadRequestError as e:
+    except Exception as e:
+        if not isinstance(e, _anthropic().BadRequestError):
+            raise
         in_github_actions = (os.environ.get("GITHUB_ACTIONS") or "").strip().lower() == "true"
         if not in_github_actions or not _is_anthropic_usage_limit_error(e):
             raise
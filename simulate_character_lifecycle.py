@@ -16,15 +16,19 @@ from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any
 
-try:
-    import anthropic
-except Exception:  # pragma: no cover - dependency may be absent in some contexts
-    anthropic = None
-
 from character_story_tools import gather_story_texts_for_character, load_story_catalog
 from world_time import build_world_clock
 
 
+def _import_anthropic():
+    """Import the Anthropic SDK on first use; None when it is not installed."""
+    try:
+        import anthropic
+    except Exception:  # pragma: no cover - dependency may be absent in some contexts
+        return None
+    return anthropic
+
+
 DEFAULT_MODEL = "claude-haiku-4-5-20251001"
 DEFAULT_CODEX_FILE = "codex.json"
 DEFAULT_TEMPORAL_FILE = "character-temporal.json"
@@ -427,6 +431,7 @@ def simulate_lifecycle(
     resolved_mode = mode
     if mode in {"auto", "haiku"}:
         api_key = (os.environ.get("ANTHROPIC_API_KEY") or "").strip()
+        anthropic = _import_anthropic() if api_key else None
         if api_key and anthropic is not None:
             client = anthropic.Anthropic(api_key=api_key)
             resolved_mode = "haiku"